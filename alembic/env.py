@@ -14,6 +14,7 @@ sys.path.append(str(project_root))
 from chavfana.core.config import settings
 from chavfana.models.base import Base
 from chavfana.models import *
+from chavfana.db.partitions import is_partition_table
  
 config = context.config
 
@@ -24,6 +25,11 @@ if config.config_file_name is not None:
  
 target_metadata = Base.metadata   
 
+
+def include_name(name, type_, parent_names):
+    # Monthly partitions are created at runtime, not declared as models
+    return not (type_ == "table" and is_partition_table(name))
+
  
 async_engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
@@ -38,6 +44,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=settings.SQLALCHEMY_DATABASE_URI,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -53,7 +60,9 @@ async def run_migrations_online():
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_name=include_name
+    )
     with context.begin_transaction():
         context.run_migrations()
 
@@ -0,0 +1,83 @@
+"""partial indexes for live rows
+
+Revision ID: 2f8a6d0c4e19
+Revises: 7c41d9e2a6b3
+Create Date: 2026-10-19 15:21:08.904377
+
+Every ORM query now filters is_deleted = false (chavfana.db.soft_delete), so
+the lookup indexes only need the live rows. Each index is recreated under the
+same name with that predicate.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f8a6d0c4e19'
+down_revision: Union[str, Sequence[str], None] = '7c41d9e2a6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_DELETED = sa.text('is_deleted = false')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_farms_owner_name', table_name='farms')
+    op.create_index('ix_farms_owner_name', 'farms', ['owner_id', 'name'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_projects_owner_id', table_name='projects')
+    op.create_index('ix_projects_owner_id', 'projects', ['owner_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_projects_farm_status', table_name='projects')
+    op.create_index('ix_projects_farm_status', 'projects', ['farm_id', 'status'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_users_role_created_at_id', table_name='users')
+    op.create_index('ix_users_role_created_at_id', 'users', ['role', 'created_at', 'id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_employees_user_id', table_name='employees')
+    op.create_index('ix_employees_user_id', 'employees', ['user_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_employees_farm_id', table_name='employees')
+    op.create_index('ix_employees_farm_id', 'employees', ['farm_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_animal_groups_project_id', table_name='animal_groups')
+    op.create_index('ix_animal_groups_project_id', 'animal_groups', ['project_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_animals_project_id', table_name='animals')
+    op.create_index('ix_animals_project_id', 'animals', ['project_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_animals_group_id', table_name='animals')
+    op.create_index('ix_animals_group_id', 'animals', ['group_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_daily_entries_farm_date', table_name='daily_entries')
+    op.create_index('ix_daily_entries_farm_date', 'daily_entries', ['farm_id', 'date'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_inventory_items_farm_id', table_name='inventory_items')
+    op.create_index('ix_inventory_items_farm_id', 'inventory_items', ['farm_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.drop_index('ix_transactions_farm_date', table_name='transactions')
+    op.create_index('ix_transactions_farm_date', 'transactions', ['farm_id', 'date'], unique=False, postgresql_where=NOT_DELETED)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_farm_date', table_name='transactions')
+    op.create_index('ix_transactions_farm_date', 'transactions', ['farm_id', 'date'], unique=False)
+    op.drop_index('ix_inventory_items_farm_id', table_name='inventory_items')
+    op.create_index('ix_inventory_items_farm_id', 'inventory_items', ['farm_id'], unique=False)
+    op.drop_index('ix_daily_entries_farm_date', table_name='daily_entries')
+    op.create_index('ix_daily_entries_farm_date', 'daily_entries', ['farm_id', 'date'], unique=False)
+    op.drop_index('ix_animals_group_id', table_name='animals')
+    op.create_index('ix_animals_group_id', 'animals', ['group_id'], unique=False)
+    op.drop_index('ix_animals_project_id', table_name='animals')
+    op.create_index('ix_animals_project_id', 'animals', ['project_id'], unique=False)
+    op.drop_index('ix_animal_groups_project_id', table_name='animal_groups')
+    op.create_index('ix_animal_groups_project_id', 'animal_groups', ['project_id'], unique=False)
+    op.drop_index('ix_employees_farm_id', table_name='employees')
+    op.create_index('ix_employees_farm_id', 'employees', ['farm_id'], unique=False)
+    op.drop_index('ix_employees_user_id', table_name='employees')
+    op.create_index('ix_employees_user_id', 'employees', ['user_id'], unique=False)
+    op.drop_index('ix_users_role_created_at_id', table_name='users')
+    op.create_index('ix_users_role_created_at_id', 'users', ['role', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.drop_index('ix_projects_farm_status', table_name='projects')
+    op.create_index('ix_projects_farm_status', 'projects', ['farm_id', 'status'], unique=False)
+    op.drop_index('ix_projects_owner_id', table_name='projects')
+    op.create_index('ix_projects_owner_id', 'projects', ['owner_id'], unique=False)
+    op.drop_index('ix_farms_owner_name', table_name='farms')
+    op.create_index('ix_farms_owner_name', 'farms', ['owner_id', 'name'], unique=False)
@@ -0,0 +1,45 @@
+"""brin indexes for time columns
+
+Revision ID: 4e6c8a1b3d57
+Revises: 9d3b5e7f1a20
+Create Date: 2026-10-19 17:55:36.482190
+
+audit_logs.changed_at, weather_observations.observed_at, transactions.date
+and daily_entries.date follow insertion order closely, so a BRIN index
+(a min/max per block range) answers range filters at a fraction of a
+B-tree's size and insert cost. On the partitioned weather_observations the
+index is built on every partition. bin/audit_indexes.py flags BRIN columns
+whose correlation drops.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e6c8a1b3d57'
+down_revision: Union[str, Sequence[str], None] = '9d3b5e7f1a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIME_INDEXES = [
+    ('audit_logs', 'ix_audit_logs_changed_at', 'changed_at'),
+    ('weather_observations', 'ix_weather_observations_observed_at', 'observed_at'),
+    ('transactions', 'ix_transactions_date', 'date'),
+    ('daily_entries', 'ix_daily_entries_date', 'date'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, name, column in TIME_INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, [column], unique=False, postgresql_using='brin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, name, column in TIME_INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, [column], unique=False)
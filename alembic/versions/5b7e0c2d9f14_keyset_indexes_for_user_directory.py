@@ -0,0 +1,33 @@
+"""keyset indexes for user directory
+
+Revision ID: 5b7e0c2d9f14
+Revises: a23295637421
+Create Date: 2026-10-19 09:12:41.318202
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e0c2d9f14'
+down_revision: Union[str, Sequence[str], None] = 'a23295637421'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_users_role_created_at_id', 'users', ['role', 'created_at', 'id'], unique=False)
+    # ix_users_role is a prefix of ix_users_role_created_at_id
+    op.drop_index('ix_users_role', table_name='users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_users_role', 'users', ['role'], unique=False)
+    op.drop_index('ix_users_role_created_at_id', table_name='users')
+    op.drop_index('ix_users_created_at_id', table_name='users')
@@ -0,0 +1,62 @@
+"""covering indexes for listings
+
+Revision ID: 6a2d8f0b4c71
+Revises: d4b7a1e9c365
+Create Date: 2026-10-19 21:48:02.117936
+
+The farm plot, project animal and farm employee listings load only the
+columns of their read schemas; these indexes INCLUDE exactly those columns
+next to the lookup key so the listings run as index-only scans. Index-only
+scans skip the table only for pages VACUUM has marked all-visible, so
+autovacuum has to keep up on these tables for the gain to hold.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a2d8f0b4c71'
+down_revision: Union[str, Sequence[str], None] = 'd4b7a1e9c365'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_DELETED = sa.text('is_deleted = false')
+
+COVERING_INDEXES = [
+    ('ix_plots_farm_id', 'plots', 'farm_id',
+     ['id', 'name', 'plot_code', 'area_size', 'area_unit', 'current_crop_id', 'created_at']),
+    ('ix_animals_project_id', 'animals', 'project_id',
+     ['id', 'tag', 'breed', 'name', 'animal_type', 'gender', 'health_status', 'is_active',
+      'created_at']),
+    ('ix_employees_farm_id', 'employees', 'farm_id',
+     ['id', 'user_id', 'position', 'employment_start', 'employment_end', 'salary_amount',
+      'salary_currency', 'created_at']),
+]
+# Plain partial indexes these replace
+REPLACED = ['ix_animals_project_id', 'ix_employees_farm_id']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, column, include in COVERING_INDEXES:
+        if name in REPLACED:
+            op.drop_index(name, table_name=table, postgresql_where=NOT_DELETED)
+        op.create_index(
+            name, table, [column], unique=False,
+            postgresql_include=include, postgresql_where=NOT_DELETED,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, column, include in COVERING_INDEXES:
+        op.drop_index(
+            name, table_name=table,
+            postgresql_include=include, postgresql_where=NOT_DELETED,
+        )
+        if name in REPLACED:
+            op.create_index(
+                name, table, [column], unique=False, postgresql_where=NOT_DELETED,
+            )
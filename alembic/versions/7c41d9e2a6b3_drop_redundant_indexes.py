@@ -0,0 +1,385 @@
+"""drop redundant indexes
+
+Revision ID: 7c41d9e2a6b3
+Revises: 5b7e0c2d9f14
+Create Date: 2026-10-19 14:03:27.552914
+
+Drops the per-column audit indexes every table inherited from BaseMixin
+(id is already covered by the primary key), single-column indexes that are
+a leading prefix of a composite index on the same table, the duplicate
+current_crop index on plots and the unique constraint on inventory_items.sku
+that duplicated ix_inventory_items_sku. See bin/audit_indexes.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41d9e2a6b3'
+down_revision: Union[str, Sequence[str], None] = '5b7e0c2d9f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('inventory_items_sku_key', 'inventory_items', type_='unique')
+    op.drop_index('ix_animal_groups_created_at', table_name='animal_groups')
+    op.drop_index('ix_animal_groups_created_by_id', table_name='animal_groups')
+    op.drop_index('ix_animal_groups_deleted_at', table_name='animal_groups')
+    op.drop_index('ix_animal_groups_deleted_by_id', table_name='animal_groups')
+    op.drop_index('ix_animal_groups_id', table_name='animal_groups')
+    op.drop_index('ix_animal_groups_is_deleted', table_name='animal_groups')
+    op.drop_index('ix_animal_groups_updated_at', table_name='animal_groups')
+    op.drop_index('ix_animal_groups_updated_by_id', table_name='animal_groups')
+    op.drop_index('ix_animal_keeping_projects_project_id', table_name='animal_keeping_projects')
+    op.drop_index('ix_animals_created_at', table_name='animals')
+    op.drop_index('ix_animals_created_by_id', table_name='animals')
+    op.drop_index('ix_animals_deleted_at', table_name='animals')
+    op.drop_index('ix_animals_deleted_by_id', table_name='animals')
+    op.drop_index('ix_animals_id', table_name='animals')
+    op.drop_index('ix_animals_is_deleted', table_name='animals')
+    op.drop_index('ix_animals_updated_at', table_name='animals')
+    op.drop_index('ix_animals_updated_by_id', table_name='animals')
+    op.drop_index('ix_attachments_created_at', table_name='attachments')
+    op.drop_index('ix_attachments_created_by_id', table_name='attachments')
+    op.drop_index('ix_attachments_deleted_at', table_name='attachments')
+    op.drop_index('ix_attachments_deleted_by_id', table_name='attachments')
+    op.drop_index('ix_attachments_id', table_name='attachments')
+    op.drop_index('ix_attachments_is_deleted', table_name='attachments')
+    op.drop_index('ix_attachments_updated_at', table_name='attachments')
+    op.drop_index('ix_attachments_updated_by_id', table_name='attachments')
+    op.drop_index('ix_audit_logs_created_at', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_created_by_id', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_deleted_at', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_deleted_by_id', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_id', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_is_deleted', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_updated_at', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_updated_by_id', table_name='audit_logs')
+    op.drop_index('ix_contacts_created_at', table_name='contacts')
+    op.drop_index('ix_contacts_created_by_id', table_name='contacts')
+    op.drop_index('ix_contacts_deleted_at', table_name='contacts')
+    op.drop_index('ix_contacts_deleted_by_id', table_name='contacts')
+    op.drop_index('ix_contacts_id', table_name='contacts')
+    op.drop_index('ix_contacts_is_deleted', table_name='contacts')
+    op.drop_index('ix_contacts_updated_at', table_name='contacts')
+    op.drop_index('ix_contacts_updated_by_id', table_name='contacts')
+    op.drop_index('ix_crop_species_created_at', table_name='crop_species')
+    op.drop_index('ix_crop_species_created_by_id', table_name='crop_species')
+    op.drop_index('ix_crop_species_deleted_at', table_name='crop_species')
+    op.drop_index('ix_crop_species_deleted_by_id', table_name='crop_species')
+    op.drop_index('ix_crop_species_id', table_name='crop_species')
+    op.drop_index('ix_crop_species_is_deleted', table_name='crop_species')
+    op.drop_index('ix_crop_species_updated_at', table_name='crop_species')
+    op.drop_index('ix_crop_species_updated_by_id', table_name='crop_species')
+    op.drop_index('ix_daily_entries_created_at', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_created_by_id', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_deleted_at', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_deleted_by_id', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_farm_id', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_id', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_is_deleted', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_updated_at', table_name='daily_entries')
+    op.drop_index('ix_daily_entries_updated_by_id', table_name='daily_entries')
+    op.drop_index('ix_employees_created_at', table_name='employees')
+    op.drop_index('ix_employees_created_by_id', table_name='employees')
+    op.drop_index('ix_employees_deleted_at', table_name='employees')
+    op.drop_index('ix_employees_deleted_by_id', table_name='employees')
+    op.drop_index('ix_employees_id', table_name='employees')
+    op.drop_index('ix_employees_is_deleted', table_name='employees')
+    op.drop_index('ix_employees_updated_at', table_name='employees')
+    op.drop_index('ix_employees_updated_by_id', table_name='employees')
+    op.drop_index('ix_equipment_created_at', table_name='equipment')
+    op.drop_index('ix_equipment_created_by_id', table_name='equipment')
+    op.drop_index('ix_equipment_deleted_at', table_name='equipment')
+    op.drop_index('ix_equipment_deleted_by_id', table_name='equipment')
+    op.drop_index('ix_equipment_id', table_name='equipment')
+    op.drop_index('ix_equipment_is_deleted', table_name='equipment')
+    op.drop_index('ix_equipment_updated_at', table_name='equipment')
+    op.drop_index('ix_equipment_updated_by_id', table_name='equipment')
+    op.drop_index('ix_farms_created_at', table_name='farms')
+    op.drop_index('ix_farms_created_by_id', table_name='farms')
+    op.drop_index('ix_farms_deleted_at', table_name='farms')
+    op.drop_index('ix_farms_deleted_by_id', table_name='farms')
+    op.drop_index('ix_farms_id', table_name='farms')
+    op.drop_index('ix_farms_is_deleted', table_name='farms')
+    op.drop_index('ix_farms_owner_id', table_name='farms')
+    op.drop_index('ix_farms_updated_at', table_name='farms')
+    op.drop_index('ix_farms_updated_by_id', table_name='farms')
+    op.drop_index('ix_inventory_items_created_at', table_name='inventory_items')
+    op.drop_index('ix_inventory_items_created_by_id', table_name='inventory_items')
+    op.drop_index('ix_inventory_items_deleted_at', table_name='inventory_items')
+    op.drop_index('ix_inventory_items_deleted_by_id', table_name='inventory_items')
+    op.drop_index('ix_inventory_items_id', table_name='inventory_items')
+    op.drop_index('ix_inventory_items_is_deleted', table_name='inventory_items')
+    op.drop_index('ix_inventory_items_updated_at', table_name='inventory_items')
+    op.drop_index('ix_inventory_items_updated_by_id', table_name='inventory_items')
+    op.drop_index('ix_planting_events_created_at', table_name='planting_events')
+    op.drop_index('ix_planting_events_created_by_id', table_name='planting_events')
+    op.drop_index('ix_planting_events_deleted_at', table_name='planting_events')
+    op.drop_index('ix_planting_events_deleted_by_id', table_name='planting_events')
+    op.drop_index('ix_planting_events_id', table_name='planting_events')
+    op.drop_index('ix_planting_events_is_deleted', table_name='planting_events')
+    op.drop_index('ix_planting_events_project_id', table_name='planting_events')
+    op.drop_index('ix_planting_events_updated_at', table_name='planting_events')
+    op.drop_index('ix_planting_events_updated_by_id', table_name='planting_events')
+    op.drop_index('ix_planting_projects_project_id', table_name='planting_projects')
+    op.drop_index('ix_plots_created_at', table_name='plots')
+    op.drop_index('ix_plots_created_by_id', table_name='plots')
+    op.drop_index('ix_plots_current_crop_id', table_name='plots')
+    op.drop_index('ix_plots_deleted_at', table_name='plots')
+    op.drop_index('ix_plots_deleted_by_id', table_name='plots')
+    op.drop_index('ix_plots_farm_id', table_name='plots')
+    op.drop_index('ix_plots_id', table_name='plots')
+    op.drop_index('ix_plots_is_deleted', table_name='plots')
+    op.drop_index('ix_plots_updated_at', table_name='plots')
+    op.drop_index('ix_plots_updated_by_id', table_name='plots')
+    op.drop_index('ix_projects_created_at', table_name='projects')
+    op.drop_index('ix_projects_created_by_id', table_name='projects')
+    op.drop_index('ix_projects_deleted_at', table_name='projects')
+    op.drop_index('ix_projects_deleted_by_id', table_name='projects')
+    op.drop_index('ix_projects_farm_id', table_name='projects')
+    op.drop_index('ix_projects_id', table_name='projects')
+    op.drop_index('ix_projects_is_deleted', table_name='projects')
+    op.drop_index('ix_projects_updated_at', table_name='projects')
+    op.drop_index('ix_projects_updated_by_id', table_name='projects')
+    op.drop_index('ix_seasons_created_at', table_name='seasons')
+    op.drop_index('ix_seasons_created_by_id', table_name='seasons')
+    op.drop_index('ix_seasons_deleted_at', table_name='seasons')
+    op.drop_index('ix_seasons_deleted_by_id', table_name='seasons')
+    op.drop_index('ix_seasons_id', table_name='seasons')
+    op.drop_index('ix_seasons_is_deleted', table_name='seasons')
+    op.drop_index('ix_seasons_updated_at', table_name='seasons')
+    op.drop_index('ix_seasons_updated_by_id', table_name='seasons')
+    op.drop_index('ix_soil_analyses_created_at', table_name='soil_analyses')
+    op.drop_index('ix_soil_analyses_created_by_id', table_name='soil_analyses')
+    op.drop_index('ix_soil_analyses_deleted_at', table_name='soil_analyses')
+    op.drop_index('ix_soil_analyses_deleted_by_id', table_name='soil_analyses')
+    op.drop_index('ix_soil_analyses_id', table_name='soil_analyses')
+    op.drop_index('ix_soil_analyses_is_deleted', table_name='soil_analyses')
+    op.drop_index('ix_soil_analyses_updated_at', table_name='soil_analyses')
+    op.drop_index('ix_soil_analyses_updated_by_id', table_name='soil_analyses')
+    op.drop_index('ix_tasks_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_created_by_id', table_name='tasks')
+    op.drop_index('ix_tasks_deleted_at', table_name='tasks')
+    op.drop_index('ix_tasks_deleted_by_id', table_name='tasks')
+    op.drop_index('ix_tasks_id', table_name='tasks')
+    op.drop_index('ix_tasks_is_deleted', table_name='tasks')
+    op.drop_index('ix_tasks_updated_at', table_name='tasks')
+    op.drop_index('ix_tasks_updated_by_id', table_name='tasks')
+    op.drop_index('ix_transactions_created_at', table_name='transactions')
+    op.drop_index('ix_transactions_deleted_at', table_name='transactions')
+    op.drop_index('ix_transactions_deleted_by_id', table_name='transactions')
+    op.drop_index('ix_transactions_farm_id', table_name='transactions')
+    op.drop_index('ix_transactions_id', table_name='transactions')
+    op.drop_index('ix_transactions_is_deleted', table_name='transactions')
+    op.drop_index('ix_transactions_updated_at', table_name='transactions')
+    op.drop_index('ix_transactions_updated_by_id', table_name='transactions')
+    op.drop_index('ix_users_created_at', table_name='users')
+    op.drop_index('ix_users_created_by_id', table_name='users')
+    op.drop_index('ix_users_deleted_at', table_name='users')
+    op.drop_index('ix_users_deleted_by_id', table_name='users')
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_index('ix_users_is_deleted', table_name='users')
+    op.drop_index('ix_users_updated_at', table_name='users')
+    op.drop_index('ix_users_updated_by_id', table_name='users')
+    op.drop_index('ix_veterinary_visits_created_at', table_name='veterinary_visits')
+    op.drop_index('ix_veterinary_visits_created_by_id', table_name='veterinary_visits')
+    op.drop_index('ix_veterinary_visits_deleted_at', table_name='veterinary_visits')
+    op.drop_index('ix_veterinary_visits_deleted_by_id', table_name='veterinary_visits')
+    op.drop_index('ix_veterinary_visits_id', table_name='veterinary_visits')
+    op.drop_index('ix_veterinary_visits_is_deleted', table_name='veterinary_visits')
+    op.drop_index('ix_veterinary_visits_updated_at', table_name='veterinary_visits')
+    op.drop_index('ix_veterinary_visits_updated_by_id', table_name='veterinary_visits')
+    op.drop_index('ix_weather_observations_created_at', table_name='weather_observations')
+    op.drop_index('ix_weather_observations_created_by_id', table_name='weather_observations')
+    op.drop_index('ix_weather_observations_deleted_at', table_name='weather_observations')
+    op.drop_index('ix_weather_observations_deleted_by_id', table_name='weather_observations')
+    op.drop_index('ix_weather_observations_id', table_name='weather_observations')
+    op.drop_index('ix_weather_observations_is_deleted', table_name='weather_observations')
+    op.drop_index('ix_weather_observations_updated_at', table_name='weather_observations')
+    op.drop_index('ix_weather_observations_updated_by_id', table_name='weather_observations')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_weather_observations_updated_by_id', 'weather_observations', ['updated_by_id'], unique=False)
+    op.create_index('ix_weather_observations_updated_at', 'weather_observations', ['updated_at'], unique=False)
+    op.create_index('ix_weather_observations_is_deleted', 'weather_observations', ['is_deleted'], unique=False)
+    op.create_index('ix_weather_observations_id', 'weather_observations', ['id'], unique=False)
+    op.create_index('ix_weather_observations_deleted_by_id', 'weather_observations', ['deleted_by_id'], unique=False)
+    op.create_index('ix_weather_observations_deleted_at', 'weather_observations', ['deleted_at'], unique=False)
+    op.create_index('ix_weather_observations_created_by_id', 'weather_observations', ['created_by_id'], unique=False)
+    op.create_index('ix_weather_observations_created_at', 'weather_observations', ['created_at'], unique=False)
+    op.create_index('ix_veterinary_visits_updated_by_id', 'veterinary_visits', ['updated_by_id'], unique=False)
+    op.create_index('ix_veterinary_visits_updated_at', 'veterinary_visits', ['updated_at'], unique=False)
+    op.create_index('ix_veterinary_visits_is_deleted', 'veterinary_visits', ['is_deleted'], unique=False)
+    op.create_index('ix_veterinary_visits_id', 'veterinary_visits', ['id'], unique=False)
+    op.create_index('ix_veterinary_visits_deleted_by_id', 'veterinary_visits', ['deleted_by_id'], unique=False)
+    op.create_index('ix_veterinary_visits_deleted_at', 'veterinary_visits', ['deleted_at'], unique=False)
+    op.create_index('ix_veterinary_visits_created_by_id', 'veterinary_visits', ['created_by_id'], unique=False)
+    op.create_index('ix_veterinary_visits_created_at', 'veterinary_visits', ['created_at'], unique=False)
+    op.create_index('ix_users_updated_by_id', 'users', ['updated_by_id'], unique=False)
+    op.create_index('ix_users_updated_at', 'users', ['updated_at'], unique=False)
+    op.create_index('ix_users_is_deleted', 'users', ['is_deleted'], unique=False)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
+    op.create_index('ix_users_deleted_by_id', 'users', ['deleted_by_id'], unique=False)
+    op.create_index('ix_users_deleted_at', 'users', ['deleted_at'], unique=False)
+    op.create_index('ix_users_created_by_id', 'users', ['created_by_id'], unique=False)
+    op.create_index('ix_users_created_at', 'users', ['created_at'], unique=False)
+    op.create_index('ix_transactions_updated_by_id', 'transactions', ['updated_by_id'], unique=False)
+    op.create_index('ix_transactions_updated_at', 'transactions', ['updated_at'], unique=False)
+    op.create_index('ix_transactions_is_deleted', 'transactions', ['is_deleted'], unique=False)
+    op.create_index('ix_transactions_id', 'transactions', ['id'], unique=False)
+    op.create_index('ix_transactions_farm_id', 'transactions', ['farm_id'], unique=False)
+    op.create_index('ix_transactions_deleted_by_id', 'transactions', ['deleted_by_id'], unique=False)
+    op.create_index('ix_transactions_deleted_at', 'transactions', ['deleted_at'], unique=False)
+    op.create_index('ix_transactions_created_at', 'transactions', ['created_at'], unique=False)
+    op.create_index('ix_tasks_updated_by_id', 'tasks', ['updated_by_id'], unique=False)
+    op.create_index('ix_tasks_updated_at', 'tasks', ['updated_at'], unique=False)
+    op.create_index('ix_tasks_is_deleted', 'tasks', ['is_deleted'], unique=False)
+    op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False)
+    op.create_index('ix_tasks_deleted_by_id', 'tasks', ['deleted_by_id'], unique=False)
+    op.create_index('ix_tasks_deleted_at', 'tasks', ['deleted_at'], unique=False)
+    op.create_index('ix_tasks_created_by_id', 'tasks', ['created_by_id'], unique=False)
+    op.create_index('ix_tasks_created_at', 'tasks', ['created_at'], unique=False)
+    op.create_index('ix_soil_analyses_updated_by_id', 'soil_analyses', ['updated_by_id'], unique=False)
+    op.create_index('ix_soil_analyses_updated_at', 'soil_analyses', ['updated_at'], unique=False)
+    op.create_index('ix_soil_analyses_is_deleted', 'soil_analyses', ['is_deleted'], unique=False)
+    op.create_index('ix_soil_analyses_id', 'soil_analyses', ['id'], unique=False)
+    op.create_index('ix_soil_analyses_deleted_by_id', 'soil_analyses', ['deleted_by_id'], unique=False)
+    op.create_index('ix_soil_analyses_deleted_at', 'soil_analyses', ['deleted_at'], unique=False)
+    op.create_index('ix_soil_analyses_created_by_id', 'soil_analyses', ['created_by_id'], unique=False)
+    op.create_index('ix_soil_analyses_created_at', 'soil_analyses', ['created_at'], unique=False)
+    op.create_index('ix_seasons_updated_by_id', 'seasons', ['updated_by_id'], unique=False)
+    op.create_index('ix_seasons_updated_at', 'seasons', ['updated_at'], unique=False)
+    op.create_index('ix_seasons_is_deleted', 'seasons', ['is_deleted'], unique=False)
+    op.create_index('ix_seasons_id', 'seasons', ['id'], unique=False)
+    op.create_index('ix_seasons_deleted_by_id', 'seasons', ['deleted_by_id'], unique=False)
+    op.create_index('ix_seasons_deleted_at', 'seasons', ['deleted_at'], unique=False)
+    op.create_index('ix_seasons_created_by_id', 'seasons', ['created_by_id'], unique=False)
+    op.create_index('ix_seasons_created_at', 'seasons', ['created_at'], unique=False)
+    op.create_index('ix_projects_updated_by_id', 'projects', ['updated_by_id'], unique=False)
+    op.create_index('ix_projects_updated_at', 'projects', ['updated_at'], unique=False)
+    op.create_index('ix_projects_is_deleted', 'projects', ['is_deleted'], unique=False)
+    op.create_index('ix_projects_id', 'projects', ['id'], unique=False)
+    op.create_index('ix_projects_farm_id', 'projects', ['farm_id'], unique=False)
+    op.create_index('ix_projects_deleted_by_id', 'projects', ['deleted_by_id'], unique=False)
+    op.create_index('ix_projects_deleted_at', 'projects', ['deleted_at'], unique=False)
+    op.create_index('ix_projects_created_by_id', 'projects', ['created_by_id'], unique=False)
+    op.create_index('ix_projects_created_at', 'projects', ['created_at'], unique=False)
+    op.create_index('ix_plots_updated_by_id', 'plots', ['updated_by_id'], unique=False)
+    op.create_index('ix_plots_updated_at', 'plots', ['updated_at'], unique=False)
+    op.create_index('ix_plots_is_deleted', 'plots', ['is_deleted'], unique=False)
+    op.create_index('ix_plots_id', 'plots', ['id'], unique=False)
+    op.create_index('ix_plots_farm_id', 'plots', ['farm_id'], unique=False)
+    op.create_index('ix_plots_deleted_by_id', 'plots', ['deleted_by_id'], unique=False)
+    op.create_index('ix_plots_deleted_at', 'plots', ['deleted_at'], unique=False)
+    op.create_index('ix_plots_current_crop_id', 'plots', ['current_crop_id'], unique=False)
+    op.create_index('ix_plots_created_by_id', 'plots', ['created_by_id'], unique=False)
+    op.create_index('ix_plots_created_at', 'plots', ['created_at'], unique=False)
+    op.create_index('ix_planting_projects_project_id', 'planting_projects', ['project_id'], unique=False)
+    op.create_index('ix_planting_events_updated_by_id', 'planting_events', ['updated_by_id'], unique=False)
+    op.create_index('ix_planting_events_updated_at', 'planting_events', ['updated_at'], unique=False)
+    op.create_index('ix_planting_events_project_id', 'planting_events', ['project_id'], unique=False)
+    op.create_index('ix_planting_events_is_deleted', 'planting_events', ['is_deleted'], unique=False)
+    op.create_index('ix_planting_events_id', 'planting_events', ['id'], unique=False)
+    op.create_index('ix_planting_events_deleted_by_id', 'planting_events', ['deleted_by_id'], unique=False)
+    op.create_index('ix_planting_events_deleted_at', 'planting_events', ['deleted_at'], unique=False)
+    op.create_index('ix_planting_events_created_by_id', 'planting_events', ['created_by_id'], unique=False)
+    op.create_index('ix_planting_events_created_at', 'planting_events', ['created_at'], unique=False)
+    op.create_index('ix_inventory_items_updated_by_id', 'inventory_items', ['updated_by_id'], unique=False)
+    op.create_index('ix_inventory_items_updated_at', 'inventory_items', ['updated_at'], unique=False)
+    op.create_index('ix_inventory_items_is_deleted', 'inventory_items', ['is_deleted'], unique=False)
+    op.create_index('ix_inventory_items_id', 'inventory_items', ['id'], unique=False)
+    op.create_index('ix_inventory_items_deleted_by_id', 'inventory_items', ['deleted_by_id'], unique=False)
+    op.create_index('ix_inventory_items_deleted_at', 'inventory_items', ['deleted_at'], unique=False)
+    op.create_index('ix_inventory_items_created_by_id', 'inventory_items', ['created_by_id'], unique=False)
+    op.create_index('ix_inventory_items_created_at', 'inventory_items', ['created_at'], unique=False)
+    op.create_index('ix_farms_updated_by_id', 'farms', ['updated_by_id'], unique=False)
+    op.create_index('ix_farms_updated_at', 'farms', ['updated_at'], unique=False)
+    op.create_index('ix_farms_owner_id', 'farms', ['owner_id'], unique=False)
+    op.create_index('ix_farms_is_deleted', 'farms', ['is_deleted'], unique=False)
+    op.create_index('ix_farms_id', 'farms', ['id'], unique=False)
+    op.create_index('ix_farms_deleted_by_id', 'farms', ['deleted_by_id'], unique=False)
+    op.create_index('ix_farms_deleted_at', 'farms', ['deleted_at'], unique=False)
+    op.create_index('ix_farms_created_by_id', 'farms', ['created_by_id'], unique=False)
+    op.create_index('ix_farms_created_at', 'farms', ['created_at'], unique=False)
+    op.create_index('ix_equipment_updated_by_id', 'equipment', ['updated_by_id'], unique=False)
+    op.create_index('ix_equipment_updated_at', 'equipment', ['updated_at'], unique=False)
+    op.create_index('ix_equipment_is_deleted', 'equipment', ['is_deleted'], unique=False)
+    op.create_index('ix_equipment_id', 'equipment', ['id'], unique=False)
+    op.create_index('ix_equipment_deleted_by_id', 'equipment', ['deleted_by_id'], unique=False)
+    op.create_index('ix_equipment_deleted_at', 'equipment', ['deleted_at'], unique=False)
+    op.create_index('ix_equipment_created_by_id', 'equipment', ['created_by_id'], unique=False)
+    op.create_index('ix_equipment_created_at', 'equipment', ['created_at'], unique=False)
+    op.create_index('ix_employees_updated_by_id', 'employees', ['updated_by_id'], unique=False)
+    op.create_index('ix_employees_updated_at', 'employees', ['updated_at'], unique=False)
+    op.create_index('ix_employees_is_deleted', 'employees', ['is_deleted'], unique=False)
+    op.create_index('ix_employees_id', 'employees', ['id'], unique=False)
+    op.create_index('ix_employees_deleted_by_id', 'employees', ['deleted_by_id'], unique=False)
+    op.create_index('ix_employees_deleted_at', 'employees', ['deleted_at'], unique=False)
+    op.create_index('ix_employees_created_by_id', 'employees', ['created_by_id'], unique=False)
+    op.create_index('ix_employees_created_at', 'employees', ['created_at'], unique=False)
+    op.create_index('ix_daily_entries_updated_by_id', 'daily_entries', ['updated_by_id'], unique=False)
+    op.create_index('ix_daily_entries_updated_at', 'daily_entries', ['updated_at'], unique=False)
+    op.create_index('ix_daily_entries_is_deleted', 'daily_entries', ['is_deleted'], unique=False)
+    op.create_index('ix_daily_entries_id', 'daily_entries', ['id'], unique=False)
+    op.create_index('ix_daily_entries_farm_id', 'daily_entries', ['farm_id'], unique=False)
+    op.create_index('ix_daily_entries_deleted_by_id', 'daily_entries', ['deleted_by_id'], unique=False)
+    op.create_index('ix_daily_entries_deleted_at', 'daily_entries', ['deleted_at'], unique=False)
+    op.create_index('ix_daily_entries_created_by_id', 'daily_entries', ['created_by_id'], unique=False)
+    op.create_index('ix_daily_entries_created_at', 'daily_entries', ['created_at'], unique=False)
+    op.create_index('ix_crop_species_updated_by_id', 'crop_species', ['updated_by_id'], unique=False)
+    op.create_index('ix_crop_species_updated_at', 'crop_species', ['updated_at'], unique=False)
+    op.create_index('ix_crop_species_is_deleted', 'crop_species', ['is_deleted'], unique=False)
+    op.create_index('ix_crop_species_id', 'crop_species', ['id'], unique=False)
+    op.create_index('ix_crop_species_deleted_by_id', 'crop_species', ['deleted_by_id'], unique=False)
+    op.create_index('ix_crop_species_deleted_at', 'crop_species', ['deleted_at'], unique=False)
+    op.create_index('ix_crop_species_created_by_id', 'crop_species', ['created_by_id'], unique=False)
+    op.create_index('ix_crop_species_created_at', 'crop_species', ['created_at'], unique=False)
+    op.create_index('ix_contacts_updated_by_id', 'contacts', ['updated_by_id'], unique=False)
+    op.create_index('ix_contacts_updated_at', 'contacts', ['updated_at'], unique=False)
+    op.create_index('ix_contacts_is_deleted', 'contacts', ['is_deleted'], unique=False)
+    op.create_index('ix_contacts_id', 'contacts', ['id'], unique=False)
+    op.create_index('ix_contacts_deleted_by_id', 'contacts', ['deleted_by_id'], unique=False)
+    op.create_index('ix_contacts_deleted_at', 'contacts', ['deleted_at'], unique=False)
+    op.create_index('ix_contacts_created_by_id', 'contacts', ['created_by_id'], unique=False)
+    op.create_index('ix_contacts_created_at', 'contacts', ['created_at'], unique=False)
+    op.create_index('ix_audit_logs_updated_by_id', 'audit_logs', ['updated_by_id'], unique=False)
+    op.create_index('ix_audit_logs_updated_at', 'audit_logs', ['updated_at'], unique=False)
+    op.create_index('ix_audit_logs_is_deleted', 'audit_logs', ['is_deleted'], unique=False)
+    op.create_index('ix_audit_logs_id', 'audit_logs', ['id'], unique=False)
+    op.create_index('ix_audit_logs_deleted_by_id', 'audit_logs', ['deleted_by_id'], unique=False)
+    op.create_index('ix_audit_logs_deleted_at', 'audit_logs', ['deleted_at'], unique=False)
+    op.create_index('ix_audit_logs_created_by_id', 'audit_logs', ['created_by_id'], unique=False)
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'], unique=False)
+    op.create_index('ix_attachments_updated_by_id', 'attachments', ['updated_by_id'], unique=False)
+    op.create_index('ix_attachments_updated_at', 'attachments', ['updated_at'], unique=False)
+    op.create_index('ix_attachments_is_deleted', 'attachments', ['is_deleted'], unique=False)
+    op.create_index('ix_attachments_id', 'attachments', ['id'], unique=False)
+    op.create_index('ix_attachments_deleted_by_id', 'attachments', ['deleted_by_id'], unique=False)
+    op.create_index('ix_attachments_deleted_at', 'attachments', ['deleted_at'], unique=False)
+    op.create_index('ix_attachments_created_by_id', 'attachments', ['created_by_id'], unique=False)
+    op.create_index('ix_attachments_created_at', 'attachments', ['created_at'], unique=False)
+    op.create_index('ix_animals_updated_by_id', 'animals', ['updated_by_id'], unique=False)
+    op.create_index('ix_animals_updated_at', 'animals', ['updated_at'], unique=False)
+    op.create_index('ix_animals_is_deleted', 'animals', ['is_deleted'], unique=False)
+    op.create_index('ix_animals_id', 'animals', ['id'], unique=False)
+    op.create_index('ix_animals_deleted_by_id', 'animals', ['deleted_by_id'], unique=False)
+    op.create_index('ix_animals_deleted_at', 'animals', ['deleted_at'], unique=False)
+    op.create_index('ix_animals_created_by_id', 'animals', ['created_by_id'], unique=False)
+    op.create_index('ix_animals_created_at', 'animals', ['created_at'], unique=False)
+    op.create_index('ix_animal_keeping_projects_project_id', 'animal_keeping_projects', ['project_id'], unique=False)
+    op.create_index('ix_animal_groups_updated_by_id', 'animal_groups', ['updated_by_id'], unique=False)
+    op.create_index('ix_animal_groups_updated_at', 'animal_groups', ['updated_at'], unique=False)
+    op.create_index('ix_animal_groups_is_deleted', 'animal_groups', ['is_deleted'], unique=False)
+    op.create_index('ix_animal_groups_id', 'animal_groups', ['id'], unique=False)
+    op.create_index('ix_animal_groups_deleted_by_id', 'animal_groups', ['deleted_by_id'], unique=False)
+    op.create_index('ix_animal_groups_deleted_at', 'animal_groups', ['deleted_at'], unique=False)
+    op.create_index('ix_animal_groups_created_by_id', 'animal_groups', ['created_by_id'], unique=False)
+    op.create_index('ix_animal_groups_created_at', 'animal_groups', ['created_at'], unique=False)
+    op.create_unique_constraint('inventory_items_sku_key', 'inventory_items', ['sku'])
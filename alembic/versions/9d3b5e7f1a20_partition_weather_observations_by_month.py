@@ -0,0 +1,101 @@
+"""partition weather_observations by month
+
+Revision ID: 9d3b5e7f1a20
+Revises: 2f8a6d0c4e19
+Create Date: 2026-10-19 16:40:52.117603
+
+Rebuilds weather_observations as a table range-partitioned on observed_at,
+one partition per month (weather_observations_yYYYYmMM) plus a DEFAULT
+partition, and copies the existing rows across. The primary key becomes
+(id, observed_at) because Postgres requires the partition key in it;
+id leads so lookups by id keep using the key, and observed_at keeps its
+own index for time-range scans.
+Partitions from the oldest row to three months ahead are created here;
+bin/maintain_partitions.py keeps them going.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3b5e7f1a20'
+down_revision: Union[str, Sequence[str], None] = '2f8a6d0c4e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE weather_observations RENAME TO weather_observations_old")
+    op.execute("ALTER TABLE weather_observations_old RENAME CONSTRAINT weather_observations_pkey TO weather_observations_old_pkey")
+    op.execute("ALTER INDEX ix_weather_observations_farm_id RENAME TO ix_weather_observations_old_farm_id")
+    op.execute("ALTER INDEX ix_weather_observations_observed_at RENAME TO ix_weather_observations_old_observed_at")
+
+    op.execute(
+        "CREATE TABLE weather_observations "
+        "(LIKE weather_observations_old INCLUDING DEFAULTS INCLUDING COMMENTS) "
+        "PARTITION BY RANGE (observed_at)"
+    )
+    op.create_primary_key('weather_observations_pkey', 'weather_observations', ['id', 'observed_at'])
+    op.create_foreign_key(
+        'weather_observations_farm_id_fkey', 'weather_observations', 'farms',
+        ['farm_id'], ['id'], ondelete='CASCADE',
+    )
+    op.create_index('ix_weather_observations_farm_id', 'weather_observations', ['farm_id'], unique=False)
+    op.create_index('ix_weather_observations_observed_at', 'weather_observations', ['observed_at'], unique=False)
+    op.execute("CREATE TABLE weather_observations_default PARTITION OF weather_observations DEFAULT")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            first_month date;
+            each_month date;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(observed_at), now()) AT TIME ZONE 'UTC')::date
+            INTO first_month FROM weather_observations_old;
+            FOR each_month IN
+                SELECT generate_series(
+                    first_month,
+                    (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months')::date,
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE weather_observations_y%sm%s PARTITION OF weather_observations '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(each_month, 'YYYY'),
+                    to_char(each_month, 'MM'),
+                    each_month::text || ' 00:00+00',
+                    (each_month + interval '1 month')::date::text || ' 00:00+00'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute("INSERT INTO weather_observations SELECT * FROM weather_observations_old")
+    op.drop_table('weather_observations_old')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE weather_observations RENAME TO weather_observations_partitioned")
+    op.execute("ALTER TABLE weather_observations_partitioned RENAME CONSTRAINT weather_observations_pkey TO weather_observations_partitioned_pkey")
+    op.execute("ALTER INDEX ix_weather_observations_farm_id RENAME TO ix_weather_observations_partitioned_farm_id")
+    op.execute("ALTER INDEX ix_weather_observations_observed_at RENAME TO ix_weather_observations_partitioned_observed_at")
+
+    op.execute(
+        "CREATE TABLE weather_observations "
+        "(LIKE weather_observations_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS)"
+    )
+    op.create_primary_key('weather_observations_pkey', 'weather_observations', ['id'])
+    op.create_foreign_key(
+        'weather_observations_farm_id_fkey', 'weather_observations', 'farms',
+        ['farm_id'], ['id'], ondelete='CASCADE',
+    )
+    op.create_index('ix_weather_observations_farm_id', 'weather_observations', ['farm_id'], unique=False)
+    op.create_index('ix_weather_observations_observed_at', 'weather_observations', ['observed_at'], unique=False)
+    op.execute("INSERT INTO weather_observations SELECT * FROM weather_observations_partitioned")
+    op.drop_table('weather_observations_partitioned')
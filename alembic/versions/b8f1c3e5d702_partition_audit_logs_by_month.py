@@ -0,0 +1,96 @@
+"""partition audit_logs by month
+
+Revision ID: b8f1c3e5d702
+Revises: 4e6c8a1b3d57
+Create Date: 2026-10-19 19:12:44.730915
+
+Rebuilds audit_logs as a table range-partitioned on changed_at, one
+partition per month (audit_logs_yYYYYmMM) plus a DEFAULT partition, and
+copies the existing rows across. The primary key becomes (id, changed_at).
+Partitions from the oldest row to three months ahead are created here;
+bin/maintain_partitions.py archives months past AUDIT_LOG_RETAIN_MONTHS.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f1c3e5d702'
+down_revision: Union[str, Sequence[str], None] = '4e6c8a1b3d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_audit_logs_entity_type_id', ['entity_type', 'entity_id'], {}),
+    ('ix_audit_logs_changed_by_id', ['changed_by_id'], {}),
+    ('ix_audit_logs_entity_id', ['entity_id'], {}),
+    ('ix_audit_logs_changed_at', ['changed_at'], {'postgresql_using': 'brin'}),
+]
+
+
+def _rename_away(suffix: str) -> None:
+    op.execute(f"ALTER TABLE audit_logs RENAME TO audit_logs_{suffix}")
+    op.execute(f"ALTER TABLE audit_logs_{suffix} RENAME CONSTRAINT audit_logs_pkey TO audit_logs_{suffix}_pkey")
+    for name, _, _ in INDEXES:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name.replace('audit_logs', f'audit_logs_{suffix}')}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rename_away('old')
+    op.execute(
+        "CREATE TABLE audit_logs "
+        "(LIKE audit_logs_old INCLUDING DEFAULTS INCLUDING COMMENTS) "
+        "PARTITION BY RANGE (changed_at)"
+    )
+    op.create_primary_key('audit_logs_pkey', 'audit_logs', ['id', 'changed_at'])
+    for name, columns, kwargs in INDEXES:
+        op.create_index(name, 'audit_logs', columns, unique=False, **kwargs)
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            first_month date;
+            each_month date;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(changed_at), now()) AT TIME ZONE 'UTC')::date
+            INTO first_month FROM audit_logs_old;
+            FOR each_month IN
+                SELECT generate_series(
+                    first_month,
+                    (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months')::date,
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE audit_logs_y%sm%s PARTITION OF audit_logs '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(each_month, 'YYYY'),
+                    to_char(each_month, 'MM'),
+                    each_month::text || ' 00:00+00',
+                    (each_month + interval '1 month')::date::text || ' 00:00+00'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_old")
+    op.drop_table('audit_logs_old')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_away('partitioned')
+    op.execute(
+        "CREATE TABLE audit_logs "
+        "(LIKE audit_logs_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS)"
+    )
+    op.create_primary_key('audit_logs_pkey', 'audit_logs', ['id'])
+    for name, columns, kwargs in INDEXES:
+        op.create_index(name, 'audit_logs', columns, unique=False, **kwargs)
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned")
+    op.drop_table('audit_logs_partitioned')
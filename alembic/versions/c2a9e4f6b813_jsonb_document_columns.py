@@ -0,0 +1,71 @@
+"""jsonb document columns
+
+Revision ID: c2a9e4f6b813
+Revises: b8f1c3e5d702
+Create Date: 2026-10-19 20:31:09.258461
+
+Converts the remaining json columns to jsonb so they can be indexed and
+queried with containment (@>), and adds GIN jsonb_path_ops indexes on the
+columns that are filtered on. jsonb_path_ops only supports @> and the
+jsonpath operators, but is smaller and faster for them than the default
+operator class.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a9e4f6b813'
+down_revision: Union[str, Sequence[str], None] = 'b8f1c3e5d702'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ('plots', 'soil_profile'),
+    ('plots', 'gps_bounds'),
+    ('farms', 'geo_coordinate'),
+    ('farms', 'rectangle_boundary'),
+    ('daily_entries', 'content'),
+    ('planting_events', 'species_details'),
+    ('audit_logs', 'diff'),
+]
+GIN_INDEXES = [
+    ('ix_plots_soil_profile', 'plots', 'soil_profile'),
+    ('ix_daily_entries_content', 'daily_entries', 'content'),
+    ('ix_planting_events_species_details', 'planting_events', 'species_details'),
+    ('ix_audit_logs_diff', 'audit_logs', 'diff'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb',
+        )
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name, table, [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json',
+        )
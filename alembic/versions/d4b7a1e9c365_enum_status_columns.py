@@ -0,0 +1,105 @@
+"""enum status columns
+
+Revision ID: d4b7a1e9c365
+Revises: c2a9e4f6b813
+Create Date: 2026-10-19 21:12:47.503118
+
+Stores the closed-set status, role and type columns as native Postgres enums
+instead of varchar. A label takes a fixed four bytes on disk, and the
+indexes on these columns shrink with them; the values read back are the
+same strings. Each ALTER rewrites its table and rebuilds its indexes under
+an ACCESS EXCLUSIVE lock, so run it in a maintenance window on large
+databases. Rows holding a value outside the enum abort the upgrade before
+anything is changed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b7a1e9c365'
+down_revision: Union[str, Sequence[str], None] = 'c2a9e4f6b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENUMS = {
+    'project_type': ('Project', 'PlantingProject', 'AnimalKeepingProject'),
+    'project_status': ('Planning', 'Active', 'Completed', 'Archived'),
+    'planting_stage': ('Seedling', 'Vegetative', 'Flowering', 'Fruiting', 'Mature'),
+    'task_status': ('Pending', 'In Progress', 'Completed', 'Cancelled'),
+    'task_priority': ('Low', 'Medium', 'High', 'Critical'),
+    'daily_entry_type': ('Activity', 'Note', 'Expense', 'Observation'),
+    'health_status': ('Healthy', 'Sick', 'Recovering', 'Quarantined'),
+    'user_role': ('ADMIN', 'FARMER', 'MANAGER', 'EMPLOYEE', 'VET', 'AGRONOMIST', 'CONSULTANT'),
+    'transaction_type': ('PURCHASE', 'SALE', 'EXPENSE', 'INCOME'),
+    'inventory_unit': ('KG', 'LITER', 'UNIT', 'POUND'),
+    'equipment_status': ('Active', 'Maintenance', 'Retired'),
+    'contact_type': ('SUPPLIER', 'BUYER', 'SERVICE_PROVIDER', 'VET', 'AGRONOMIST'),
+    'change_type': ('CREATE', 'UPDATE', 'DELETE'),
+}
+# (table, column, enum type, previous varchar length)
+COLUMNS = [
+    ('projects', 'project_type', 'project_type', 50),
+    ('projects', 'status', 'project_status', 50),
+    ('planting_events', 'stage', 'planting_stage', 50),
+    ('tasks', 'status', 'task_status', 50),
+    ('tasks', 'priority', 'task_priority', 20),
+    ('daily_entries', 'entry_type', 'daily_entry_type', 50),
+    ('animals', 'health_status', 'health_status', 50),
+    ('users', 'role', 'user_role', 50),
+    ('transactions', 'transaction_type', 'transaction_type', 50),
+    ('inventory_items', 'unit', 'inventory_unit', 20),
+    ('equipment', 'status', 'equipment_status', 50),
+    ('contacts', 'contact_type', 'contact_type', 50),
+    ('audit_logs', 'change_type', 'change_type', 50),
+]
+
+
+def _check_values() -> None:
+    connection = op.get_bind()
+    unexpected = []
+    for table, column, enum_name, _ in COLUMNS:
+        values = connection.execute(
+            sa.text(
+                f"SELECT DISTINCT {column} FROM {table} "
+                f"WHERE {column} IS NOT NULL AND NOT ({column} = ANY(:labels))"
+            ),
+            {'labels': list(ENUMS[enum_name])},
+        ).scalars().all()
+        unexpected.extend(f"{table}.{column}={value!r}" for value in values)
+    if unexpected:
+        raise RuntimeError(
+            "Fix or map these values before converting to enums: " + ", ".join(unexpected)
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _check_values()
+    for enum_name, labels in ENUMS.items():
+        postgresql.ENUM(*labels, name=enum_name).create(op.get_bind())
+    for table, column, enum_name, length in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.String(length=length),
+            type_=postgresql.ENUM(*ENUMS[enum_name], name=enum_name, create_type=False),
+            existing_nullable=False,
+            postgresql_using=f'{column}::{enum_name}',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, enum_name, length in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=postgresql.ENUM(*ENUMS[enum_name], name=enum_name, create_type=False),
+            type_=sa.String(length=length),
+            existing_nullable=False,
+            postgresql_using=f'{column}::text',
+        )
+    for enum_name, labels in ENUMS.items():
+        postgresql.ENUM(*labels, name=enum_name).drop(op.get_bind())
@@ -0,0 +1,114 @@
+"""farm coordinates and geohash
+
+Revision ID: e1c5f7a3b920
+Revises: 6a2d8f0b4c71
+Create Date: 2026-10-19 22:26:41.083512
+
+Adds latitude, longitude and a geohash column to farms, backfilled from
+geo_coordinate, with a B-tree index for nearby search. The geohash column
+uses C collation so prefix ranges compare byte-wise. Farms whose
+geo_coordinate cannot be read are left without coordinates and do not
+appear in nearby results until it is corrected.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1c5f7a3b920'
+down_revision: Union[str, Sequence[str], None] = '6a2d8f0b4c71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_DELETED = sa.text('is_deleted = false')
+
+# Frozen copies of the geohash encoding and geo_coordinate parsing as of this
+# revision, so the backfill does not change if the application's versions do
+GEOHASH_PRECISION = 9
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def _parse_coordinate(value):
+    if not isinstance(value, dict):
+        raise ValueError('geo_coordinate must be an object')
+    if value.get('type') == 'Point' and isinstance(value.get('coordinates'), list):
+        lon, lat = value['coordinates'][:2]
+    else:
+        lat = next((value[key] for key in ('lat', 'latitude') if key in value), None)
+        lon = next((value[key] for key in ('lon', 'lng', 'longitude') if key in value), None)
+        if lat is None or lon is None:
+            raise ValueError('geo_coordinate needs lat and lon (or a GeoJSON Point)')
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        raise ValueError('geo_coordinate lat and lon must be numbers')
+    if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        raise ValueError('geo_coordinate is out of range')
+    return lat, lon
+
+
+def _geohash(lat, lon):
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < GEOHASH_PRECISION:
+        interval, value = (lon_range, lon) if even else (lat_range, lat)
+        middle = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits, bit_count = 0, 0
+    return ''.join(chars)
+
+
+def _backfill() -> None:
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, geo_coordinate FROM farms WHERE geo_coordinate IS NOT NULL")
+    ).all()
+    updates = []
+    for id, geo_coordinate in rows:
+        try:
+            lat, lon = _parse_coordinate(geo_coordinate)
+        except ValueError:
+            continue
+        updates.append({'id': id, 'lat': lat, 'lon': lon, 'geohash': _geohash(lat, lon)})
+    if updates:
+        connection.execute(
+            sa.text(
+                "UPDATE farms SET latitude = :lat, longitude = :lon, geohash = :geohash "
+                "WHERE id = :id"
+            ),
+            updates,
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('farms', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('farms', sa.Column('longitude', sa.Float(), nullable=True))
+    op.add_column(
+        'farms',
+        sa.Column('geohash', sa.String(length=9, collation='C'), nullable=True),
+    )
+    _backfill()
+    op.create_index(
+        'ix_farms_geohash', 'farms', ['geohash'], unique=False,
+        postgresql_where=NOT_DELETED,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_farms_geohash', table_name='farms', postgresql_where=NOT_DELETED)
+    op.drop_column('farms', 'geohash')
+    op.drop_column('farms', 'longitude')
+    op.drop_column('farms', 'latitude')
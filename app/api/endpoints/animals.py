@@ -1,10 +1,13 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from chavfana.controllers.animals import AnimalController
-from chavfana.db.database import get_db
+from chavfana.db.database import get_read_db
 from chavfana.dependencies.auth import GetCurrentUser
+from chavfana.schemas.animal import AnimalRead
 
 animals_router = APIRouter()
 
@@ -12,18 +15,18 @@ animals_router = APIRouter()
 async def get_animal(
     animal_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     animal = await AnimalController.get_animal_by_id(db, animal_id)
     if not animal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found")
     return animal
 
-@animals_router.get("/project/{project_id}")
+@animals_router.get("/project/{project_id}", response_model=List[AnimalRead])
 async def get_animals_by_project(
     project_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     animals = await AnimalController.get_animals_by_project(db, project_id)
     return animals
@@ -32,7 +35,7 @@ async def get_animals_by_project(
 async def get_animal_groups(
     project_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     groups = await AnimalController.get_animal_groups_by_project(db, project_id)
     return groups
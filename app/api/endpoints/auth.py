@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from uuid import UUID
 
 from chavfana.controllers.auth import AuthController
-from chavfana.db.database import get_db
+from chavfana.db.budget import query_budget
+from chavfana.db.database import get_db, get_read_db
+from chavfana.models.enums import UserRole
 from chavfana.schemas.user import (
     UserCreate,
     UserRead,
+    UserPage,
     UserUpdate,
     EmployeeCreate,
     EmployeeRead,
+    EmployeeUpdate,
 )
 from chavfana.core.exceptions import (
     NotFoundError,
@@ -33,39 +37,62 @@ async def register_user(request_data: UserCreate, db: AsyncSession = Depends(get
 
 @auth_router.post("/login", status_code=status.HTTP_200_OK)
 async def login(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
     return await auth_controller.login(
-        db=db, email=form_data.username, password=form_data.password
+        db=db,
+        email=form_data.username,
+        password=form_data.password,
+        background_tasks=background_tasks,
     )
 
 
 @auth_router.get("/users/{user_id}", response_model=UserRead)
-async def get_user(user_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_user(user_id: UUID, db: AsyncSession = Depends(get_read_db)):
     return await auth_controller.get_user_by_id(db=db, user_id=user_id)
 
 
 @auth_router.get("/users/email/{email}", response_model=UserRead)
-async def get_user_by_email(email: str, db: AsyncSession = Depends(get_db)):
+async def get_user_by_email(email: str, db: AsyncSession = Depends(get_read_db)):
     return await auth_controller.get_user_by_email(db=db, email=email)
 
 
-@auth_router.get("/users", response_model=List[UserRead])
+@auth_router.get(
+    "/users",
+    response_model=UserPage,
+    dependencies=[Depends(query_budget(max_statements=5, statement_timeout_ms=2000))],
+)
 async def get_all_users(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await auth_controller.get_all_users(db=db, skip=skip, limit=limit)
+    return await auth_controller.get_all_users(
+        db=db, cursor=cursor, limit=limit, include_total=include_total
+    )
 
 
-@auth_router.get("/users/role/{role}", response_model=List[UserRead])
+@auth_router.get(
+    "/users/role/{role}",
+    response_model=UserPage,
+    dependencies=[Depends(query_budget(max_statements=5, statement_timeout_ms=2000))],
+)
 async def get_users_by_role(
-    role: str, skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
+    role: UserRole,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await auth_controller.get_users_by_role(
-        db=db, role=role, skip=skip, limit=limit
+        db=db, role=role.value, cursor=cursor, limit=limit, include_total=include_total
     )
 
 
+@auth_router.patch("/users/{user_id}", response_model=UserRead)
 @auth_router.put("/users/{user_id}", response_model=UserRead)
 async def update_user(
     user_id: UUID, request_data: UserUpdate, db: AsyncSession = Depends(get_db)
@@ -107,18 +134,19 @@ async def create_employee(
 
 
 @auth_router.get("/employees/{employee_id}", response_model=EmployeeRead)
-async def get_employee(employee_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_employee(employee_id: UUID, db: AsyncSession = Depends(get_read_db)):
     return await auth_controller.get_employee_by_id(db=db, employee_id=employee_id)
 
 
 @auth_router.get("/employees/farm/{farm_id}", response_model=List[EmployeeRead])
-async def get_employees_by_farm(farm_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_employees_by_farm(farm_id: UUID, db: AsyncSession = Depends(get_read_db)):
     return await auth_controller.get_employees_by_farm(db=db, farm_id=farm_id)
 
 
+@auth_router.patch("/employees/{employee_id}", response_model=EmployeeRead)
 @auth_router.put("/employees/{employee_id}", response_model=EmployeeRead)
 async def update_employee(
-    employee_id: UUID, request_data: Dict[str, Any], db: AsyncSession = Depends(get_db)
+    employee_id: UUID, request_data: EmployeeUpdate, db: AsyncSession = Depends(get_db)
 ):
     return await auth_controller.update_employee(
         db=db, employee_id=employee_id, request_data=request_data
@@ -1,12 +1,22 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from chavfana.controllers.farms import FarmController
 from chavfana.dependencies.auth import GetCurrentUser
-from chavfana.schemas.farm import FarmCreate, FarmRead, PlotCreate, PlotRead
-from chavfana.db.database import get_db
+from chavfana.dependencies.filters import containment_filter
+from chavfana.schemas.daily_tasks import DailyEntryRead
+from chavfana.schemas.farm import (
+    FarmCreate,
+    FarmNearbyRead,
+    FarmRead,
+    FarmUpdate,
+    PlotCreate,
+    PlotRead,
+    PlotUpdate,
+)
+from chavfana.db.database import get_db, get_read_db
 
 farms_router = APIRouter()
 
@@ -20,11 +30,32 @@ async def create_farm(
     return await FarmController.create_farm(db, request_data)
 
 
+@farms_router.get("/nearby", response_model=List[FarmNearbyRead])
+async def get_nearby_farms(
+    current_user: GetCurrentUser,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(..., gt=0, le=1000),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+):
+    nearby = await FarmController.get_nearby_farms(db, lat, lon, radius_km, limit)
+    return [
+        FarmNearbyRead(
+            **FarmRead.model_validate(farm).model_dump(),
+            latitude=farm.latitude,
+            longitude=farm.longitude,
+            distance_km=distance_km,
+        )
+        for farm, distance_km in nearby
+    ]
+
+
 @farms_router.get("/{farm_id}", response_model=FarmRead)
 async def get_farm(
     farm_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await FarmController.get_farm_by_id(db, farm_id)
 
@@ -33,7 +64,7 @@ async def get_farm(
 async def get_farms_by_owner(
     owner_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await FarmController.get_farms_by_owner(db, owner_id)
 
@@ -41,7 +72,7 @@ async def get_farms_by_owner(
 @farms_router.patch("/{farm_id}", response_model=FarmRead)
 async def update_farm(
     farm_id: UUID,
-    request_data: dict,
+    request_data: FarmUpdate,
     current_user: GetCurrentUser,
     db: AsyncSession = Depends(get_db),
 ):
@@ -61,7 +92,7 @@ async def create_plot(
 async def get_plot(
     plot_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await FarmController.get_plot_by_id(db, plot_id)
 
@@ -70,15 +101,33 @@ async def get_plot(
 async def get_plots_by_farm(
     farm_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    soil_profile_contains: Optional[Dict[str, Any]] = Depends(
+        containment_filter("soil_profile_contains")
+    ),
+    db: AsyncSession = Depends(get_read_db),
+):
+    return await FarmController.get_plots_by_farm(db, farm_id, soil_profile_contains)
+
+
+@farms_router.get("/{farm_id}/daily-entries", response_model=List[DailyEntryRead])
+async def get_daily_entries_by_farm(
+    farm_id: UUID,
+    current_user: GetCurrentUser,
+    content_contains: Optional[Dict[str, Any]] = Depends(
+        containment_filter("content_contains")
+    ),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await FarmController.get_plots_by_farm(db, farm_id)
+    return await FarmController.get_daily_entries_by_farm(
+        db, farm_id, content_contains, limit
+    )
 
 
 @farms_router.patch("/plots/{plot_id}", response_model=PlotRead)
 async def update_plot(
     plot_id: UUID,
-    request_data: dict,
+    request_data: PlotUpdate,
     current_user: GetCurrentUser,
     db: AsyncSession = Depends(get_db),
 ):
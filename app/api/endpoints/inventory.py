@@ -0,0 +1,36 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chavfana.controllers.inventory import InventoryController
+from chavfana.db.database import get_db
+from chavfana.dependencies.auth import GetCurrentUser
+from chavfana.schemas.finance import (
+    InventoryImportResult,
+    InventoryItemCreate,
+    InventoryItemRead,
+)
+
+inventory_router = APIRouter()
+
+
+@inventory_router.post("/", response_model=InventoryItemRead, status_code=201)
+async def create_inventory_item(
+    request_data: InventoryItemCreate,
+    current_user: GetCurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    return await InventoryController.create_item(db, request_data)
+
+
+@inventory_router.post("/import", response_model=InventoryImportResult)
+async def import_inventory_items(
+    items: List[InventoryItemCreate],
+    current_user: GetCurrentUser,
+    upsert: bool = Query(
+        False, description="Update existing SKUs instead of rejecting the import"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    return await InventoryController.import_items(db, items, upsert=upsert)
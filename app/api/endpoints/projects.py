@@ -1,10 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from chavfana.controllers.projects import ProjectController
 from chavfana.dependencies.auth import GetCurrentUser
+from chavfana.dependencies.filters import containment_filter
+from chavfana.models.enums import ProjectStatus
 from chavfana.schemas.project import (
     PlantingProjectCreate,
     PlantingProjectRead,
@@ -14,7 +16,8 @@ from chavfana.schemas.project import (
     PlantingEventRead,
     ProjectRead,
 )
-from chavfana.db.database import get_db
+from chavfana.db.budget import query_budget
+from chavfana.db.database import get_db, get_read_db
 
 projects_router = APIRouter()
 
@@ -26,11 +29,8 @@ async def create_planting_project(
 ):
     try:
         project = await ProjectController.create_planting_project(db, request_data)
-        await db.commit()
-        await db.refresh(project)
         return project
     except Exception as e:
-        await db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @projects_router.post("/animal-keeping", response_model=AnimalKeepingProjectRead)
@@ -41,15 +41,16 @@ async def create_animal_keeping_project(
 ):
     try:
         project = await ProjectController.create_animal_keeping_project(db, request_data)
-        await db.commit()
-        await db.refresh(project)
         return project
     except Exception as e:
-        await db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-@projects_router.get("/", response_model=List[ProjectRead])
-async def get_all_projects(current_user: GetCurrentUser, db: AsyncSession = Depends(get_db)):
+@projects_router.get(
+    "/",
+    response_model=List[ProjectRead],
+    dependencies=[Depends(query_budget(max_statements=10, statement_timeout_ms=5000))],
+)
+async def get_all_projects(current_user: GetCurrentUser, db: AsyncSession = Depends(get_read_db)):
     projects = await ProjectController.get_all_projects(db)
     if not projects:
         raise HTTPException(status_code=404, detail="Projects not found")
@@ -59,20 +60,27 @@ async def get_all_projects(current_user: GetCurrentUser, db: AsyncSession = Depe
 async def get_project(
     project_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     project = await ProjectController.get_project_by_id(db, project_id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     return project
 
-@projects_router.get("/farm/{farm_id}", response_model=List[ProjectRead])
+@projects_router.get(
+    "/farm/{farm_id}",
+    response_model=List[ProjectRead],
+    dependencies=[Depends(query_budget(max_statements=10, statement_timeout_ms=5000))],
+)
 async def get_projects_by_farm(
     farm_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    project_status: Optional[ProjectStatus] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    projects = await ProjectController.get_projects_by_farm(db, farm_id)
+    projects = await ProjectController.get_projects_by_farm(
+        db, farm_id, project_status.value if project_status else None
+    )
     if not projects:
         raise HTTPException(status_code=404, detail="Projects not found")
     return [ProjectRead.model_validate(p, from_attributes=True) for p in projects]
@@ -85,18 +93,20 @@ async def create_planting_event(
 ):
     try:
         event = await ProjectController.create_planting_event(db, request_data)
-        await db.commit()
-        await db.refresh(event)
         return event
     except Exception as e:
-        await db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @projects_router.get("/planting-events/{project_id}")
 async def get_planting_events(
     project_id: UUID,
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    species_details_contains: Optional[Dict[str, Any]] = Depends(
+        containment_filter("species_details_contains")
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    events = await ProjectController.get_planting_events_by_project(db, project_id)
+    events = await ProjectController.get_planting_events_by_project(
+        db, project_id, species_details_contains
+    )
     return events
@@ -2,19 +2,27 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chavfana.controllers.statistics import StatisticsController
-from chavfana.db.database import get_db
+from chavfana.core.exceptions import BaseAPIException
+from chavfana.db.budget import query_budget
+from chavfana.db.database import get_read_db
 from chavfana.dependencies.auth import GetCurrentUser
 
 statistics_router = APIRouter()
 
 
-@statistics_router.get("/", summary="Get system-wide farm statistics")
+@statistics_router.get(
+    "/",
+    summary="Get system-wide farm statistics",
+    dependencies=[Depends(query_budget(max_statements=40, statement_timeout_ms=5000))],
+)
 async def get_statistics(
     current_user: GetCurrentUser,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     try:
         return await StatisticsController.get_all_statistics(db)
+    except BaseAPIException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
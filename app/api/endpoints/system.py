@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from chavfana.core.exceptions import NotFoundError
+from chavfana.db.database import get_pool_stats
+from chavfana.db.slow_queries import plan_buffer
+from chavfana.dependencies.auth import GetAdminUser
+
+system_router = APIRouter()
+
+
+@system_router.get("/db-pool", summary="Connection pool gauges and checkout wait histogram")
+async def get_db_pool_stats(current_user: GetAdminUser):
+    return get_pool_stats()
+
+
+@system_router.get("/slow-queries", summary="Captured slow-query plans, newest first")
+async def list_slow_query_plans(current_user: GetAdminUser):
+    return plan_buffer.list()
+
+
+@system_router.get("/slow-queries/{seq}", summary="A captured EXPLAIN (ANALYZE, BUFFERS) plan")
+async def get_slow_query_plan(seq: int, current_user: GetAdminUser):
+    entry = plan_buffer.get(seq)
+    if entry is None:
+        raise NotFoundError(resource_type="Query plan", resource_id=str(seq))
+    return entry
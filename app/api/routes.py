@@ -1,14 +1,19 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from app.api.endpoints.statistics import statistics_router
 from app.api.endpoints.auth import auth_router
 from app.api.endpoints.animals import animals_router
 from app.api.endpoints.farms import farms_router
+from app.api.endpoints.inventory import inventory_router
 from app.api.endpoints.projects import projects_router
+from app.api.endpoints.system import system_router
+from chavfana.db.budget import query_budget
 
-api_router = APIRouter()
+api_router = APIRouter(dependencies=[Depends(query_budget())])
 
 api_router.include_router(statistics_router, prefix="/statistics", tags=["Statistics"])
 api_router.include_router(auth_router, prefix="/auth", tags=["Auth"])
 api_router.include_router(animals_router, prefix="/animals", tags=["Animals"])
 api_router.include_router(farms_router, prefix="/farms", tags=["Farms"])
+api_router.include_router(inventory_router, prefix="/inventory", tags=["Inventory"])
 api_router.include_router(projects_router, prefix="/projects", tags=["Projects"])
+api_router.include_router(system_router, prefix="/system", tags=["System"])
\ No newline at end of file
@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from fastapi import FastAPI, Request, Depends, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,6 +11,11 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from chavfana.core.config import settings
 from app.api.routes import api_router
 from chavfana.core.exceptions import setup_exception_handlers
+from chavfana.core.warmup import warm_up, warmup_state
+from chavfana.db.budget import QueryStatsHeadersMiddleware
+from chavfana.db.database import UnitOfWorkMiddleware, engine, replica_engine
+from chavfana.db.notifications import invalidation_listener
+from chavfana.db.replica import ReadYourWritesMiddleware
 import logging
 
 
@@ -17,8 +23,18 @@ import logging
 async def lifespan(app: FastAPI):
     logging.basicConfig(level=logging.INFO)
     logging.info("Starting ChavFana System API...")
+    await invalidation_listener.start()
+    warmup_task = asyncio.create_task(warm_up())
     yield
     logging.info("Shutting down...")
+    warmup_task.cancel()
+    # Let a running attempt release its connections before the engines close
+    with suppress(asyncio.CancelledError):
+        await warmup_task
+    await invalidation_listener.stop()
+    for bind in (engine, replica_engine):
+        if bind is not None:
+            await bind.dispose()
 
 
 app = FastAPI(
@@ -51,6 +67,18 @@ app.add_middleware(
 )
 
 
+app.add_middleware(UnitOfWorkMiddleware)
+app.add_middleware(ReadYourWritesMiddleware, enabled=replica_engine is not None)
+app.add_middleware(
+    QueryStatsHeadersMiddleware,
+    enabled=(
+        settings.DB_QUERY_STATS_HEADERS
+        if settings.DB_QUERY_STATS_HEADERS is not None
+        else settings.ENVIRONMENT.lower() == "development"
+    ),
+)
+
+
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 directory = Path(__file__).joinpath("../../static").resolve()
@@ -82,6 +110,16 @@ async def root():
         "status": "running",
     }
 
+
+@app.get("/ready", tags=["Root"])
+async def ready():
+    body = {
+        "ready": warmup_state.ready,
+        "attempts": warmup_state.attempts,
+        "duration_ms": warmup_state.duration_ms,
+    }
+    return JSONResponse(status_code=200 if warmup_state.ready else 503, content=body)
+
 from fastapi import WebSocket
 
 
@@ -0,0 +1,45 @@
+"""Hashes per second per core for each bcrypt cost.
+
+    python benchmarks/bcrypt_cost.py --min-rounds 8 --max-rounds 14
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+
+
+def _hash_for(rounds: int, seconds: float) -> int:
+    password = b"benchmark-password"
+    deadline = time.perf_counter() + seconds
+    count = 0
+    while time.perf_counter() < deadline or count == 0:
+        bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-rounds", type=int, default=8)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'cost':>4} {'hashes/s/core':>14} {'hashes/s total':>15} {'ms/hash':>9}")
+    with ProcessPoolExecutor(max_workers=args.cores) as pool:
+        for rounds in range(args.min_rounds, args.max_rounds + 1):
+            started = time.perf_counter()
+            counts = list(pool.map(_hash_for, [rounds] * args.cores, [args.seconds] * args.cores))
+            elapsed = time.perf_counter() - started
+            per_core = sum(counts) / args.cores / elapsed
+            print(
+                f"{rounds:>4} {per_core:>14.2f} {sum(counts) / elapsed:>15.2f} "
+                f"{1000 / per_core:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Index size, insert rate and range-query latency: B-tree versus BRIN.
+
+Seeds a scratch table with rows whose timestamp follows insertion order (as
+audit_logs.changed_at and weather_observations.observed_at do), then for each
+index type reports its size, the rate of further time-ordered inserts and the
+latency of a one-day range count. The scratch table is dropped at the end.
+
+    python benchmarks/brin_indexes.py --rows 10000000
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from sqlalchemy import text
+
+from chavfana.db.database import engine
+
+TABLE = "bench_time_index"
+# One row per second from 2025-01-01, so 10M rows span about four months
+SEED_SQL = f"""
+    INSERT INTO {TABLE} (happened_at, payload)
+    SELECT timestamptz '2025-01-01' + make_interval(secs => n), md5(n::text)
+    FROM generate_series(:start, :stop - 1) AS n
+"""
+RANGE_SQL = text(
+    f"SELECT count(*) FROM {TABLE} "
+    "WHERE happened_at >= :since AND happened_at < :since + interval '1 day'"
+)
+
+
+async def _seed(rows: int, chunk: int = 1_000_000) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await connection.execute(
+            text(
+                f"CREATE UNLOGGED TABLE {TABLE} "
+                "(id bigserial PRIMARY KEY, happened_at timestamptz NOT NULL, payload text)"
+            )
+        )
+    for start in range(0, rows, chunk):
+        async with engine.begin() as connection:
+            await connection.execute(
+                text(SEED_SQL), {"start": start, "stop": min(start + chunk, rows)}
+            )
+    async with engine.connect() as connection:
+        # VACUUM cannot run inside a transaction block
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text(f"VACUUM ANALYZE {TABLE}"))
+
+
+async def _measure(method: str, rows: int, inserts: int, queries: int) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP INDEX IF EXISTS ix_{TABLE}"))
+        started = time.perf_counter()
+        await connection.execute(
+            text(f"CREATE INDEX ix_{TABLE} ON {TABLE} USING {method} (happened_at)")
+        )
+        build_s = time.perf_counter() - started
+        size = await connection.scalar(text(f"SELECT pg_relation_size('ix_{TABLE}')"))
+
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        started = time.perf_counter()
+        await connection.execute(text(SEED_SQL), {"start": rows, "stop": rows + inserts})
+        insert_rate = inserts / (time.perf_counter() - started)
+        await transaction.rollback()
+
+    timings = []
+    async with engine.connect() as connection:
+        for day in range(queries):
+            since = datetime(2025, 1, day % 28 + 1, tzinfo=timezone.utc)
+            started = time.perf_counter()
+            await connection.execute(RANGE_SQL, {"since": since})
+            timings.append((time.perf_counter() - started) * 1000)
+
+    print(
+        f"{method:<6} size {size / 1024 / 1024:9.2f} MB  build {build_s:6.1f} s  "
+        f"insert {insert_rate:9.0f} rows/s  1-day range p50 {statistics.median(timings):7.2f} ms"
+    )
+
+
+async def main(rows: int, inserts: int, queries: int, keep: bool) -> None:
+    print(f"Seeding {rows} rows into {TABLE}...")
+    await _seed(rows)
+    try:
+        for method in ("btree", "brin"):
+            await _measure(method, rows, inserts, queries)
+    finally:
+        if not keep:
+            async with engine.begin() as connection:
+                await connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--inserts", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch table")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.inserts, args.queries, args.keep))
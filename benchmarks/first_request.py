@@ -0,0 +1,96 @@
+"""First-request latency after startup, with and without the warm-up phase.
+
+Starts a fresh uvicorn process per round, waits for /ready, then times the
+first few requests to a set of hot endpoints. Without warm-up those requests
+pay for mapper configuration, opening connections and compiling statements;
+with it they should cost about the same as the steady state.
+
+    python benchmarks/first_request.py --rounds 5 --port 8011
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+import httpx
+
+from chavfana.controllers.auth import AuthController
+
+ROOT = Path(__file__).parents[1]
+
+
+def _paths() -> list[str]:
+    return [
+        f"/api/v1/auth/users/{uuid.uuid4()}",
+        f"/api/v1/farms/{uuid.uuid4()}",
+        f"/api/v1/farms/{uuid.uuid4()}/plots",
+        f"/api/v1/projects/{uuid.uuid4()}",
+        "/api/v1/auth/users?limit=10",
+    ]
+
+
+def _wait_ready(client: httpx.Client, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if client.get("/ready").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    raise RuntimeError("server did not become ready")
+
+
+def _round(warmup: bool, port: int, token: str) -> list[float]:
+    env = {**os.environ, "WARMUP_ENABLED": str(warmup).lower()}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+    )
+    try:
+        with httpx.Client(
+            base_url=f"http://127.0.0.1:{port}",
+            headers={"Authorization": f"Bearer {token}"},
+        ) as client:
+            _wait_ready(client, timeout=60)
+            timings = []
+            for path in _paths():
+                started = time.perf_counter()
+                client.get(path)
+                timings.append((time.perf_counter() - started) * 1000)
+            return timings
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def _report(name: str, rounds: list[list[float]]) -> None:
+    first = [timings[0] for timings in rounds]
+    total = [sum(timings) for timings in rounds]
+    print(
+        f"{name:<12} first request {statistics.median(first):8.2f} ms  "
+        f"first {len(rounds[0])} requests {statistics.median(total):8.2f} ms (median of {len(rounds)})"
+    )
+
+
+def main(rounds: int, port: int) -> None:
+    token = AuthController.create_access_token(uuid.uuid4(), "ADMIN")
+    cold = [_round(False, port, token) for _ in range(rounds)]
+    warm = [_round(True, port, token) for _ in range(rounds)]
+    _report("no warm-up", cold)
+    _report("warm-up", warm)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8011)
+    args = parser.parse_args()
+    main(args.rounds, args.port)
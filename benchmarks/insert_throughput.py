@@ -0,0 +1,88 @@
+"""Insert throughput for write-heavy tables, to compare index sets.
+
+Inserts batches of synthetic rows into audit_logs and users inside a
+transaction that is rolled back, and reports rows per second next to the
+number of indexes each table currently has. Run it once per schema version:
+
+    alembic downgrade -1 && python benchmarks/insert_throughput.py
+    alembic upgrade head && python benchmarks/insert_throughput.py
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from sqlalchemy import insert, text
+
+from chavfana.db.database import engine
+from chavfana.models.attachments_audit import AuditLog
+from chavfana.models.ids import uuid7
+from chavfana.models.user import User
+
+INDEX_COUNT_SQL = text("SELECT count(*) FROM pg_indexes WHERE tablename = :table")
+
+
+def _audit_log_row() -> dict:
+    return {
+        "id": uuid7(),
+        "entity_type": "Plot",
+        "entity_id": uuid.uuid4(),
+        "change_type": "UPDATE",
+        "changed_by_id": uuid.uuid4(),
+        "changed_at": datetime.now(timezone.utc),
+        "diff": {"name": ["old", "new"]},
+    }
+
+
+def _user_row() -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "email": f"{uuid.uuid4()}@bench.invalid",
+        "full_name": "Bench User",
+        "role": "FARMER",
+        "is_active": True,
+        "password_hash": "x",
+    }
+
+
+TABLES = {AuditLog: _audit_log_row, User: _user_row}
+
+
+async def _measure(model, make_row, rows: int, batch_size: int) -> float:
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            started = time.perf_counter()
+            for _ in range(0, rows, batch_size):
+                await connection.execute(
+                    insert(model), [make_row() for _ in range(batch_size)]
+                )
+            elapsed = time.perf_counter() - started
+        finally:
+            await transaction.rollback()
+    return rows / elapsed
+
+
+async def main(rows: int, batch_size: int) -> None:
+    for model, make_row in TABLES.items():
+        table = model.__tablename__
+        async with engine.connect() as connection:
+            index_count = await connection.scalar(INDEX_COUNT_SQL, {"table": table})
+        # Warm the connection and plan caches before timing
+        await _measure(model, make_row, batch_size, batch_size)
+        throughput = await _measure(model, make_row, rows, batch_size)
+        print(f"{table:<12} {index_count:3d} indexes  {throughput:10.0f} rows/s")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch_size))
@@ -0,0 +1,70 @@
+"""Per-request cost of get_db (BEGIN ... COMMIT) versus get_read_db (autocommit).
+
+Runs the same primary-key lookup through both session types against the
+configured database and reports latency; the difference is the BEGIN and
+COMMIT round trips that read-only requests no longer pay.
+
+    python benchmarks/read_session.py --iterations 2000
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from sqlalchemy import select
+
+from chavfana.db.database import async_session_factory, engine, read_session_factory
+from chavfana.models.user import User
+
+
+async def _write_style(user_id) -> None:
+    async with async_session_factory() as session:
+        await session.execute(select(User.id).where(User.id == user_id))
+        await session.commit()
+
+
+async def _read_style(user_id) -> None:
+    async with read_session_factory() as session:
+        await session.execute(select(User.id).where(User.id == user_id))
+
+
+async def _measure(fn, iterations: int, user_id) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await fn(user_id)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(name: str, timings: list[float]) -> float:
+    ordered = sorted(timings)
+    mean = statistics.fmean(ordered)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{name:<10} mean {mean:7.3f} ms  p50 {statistics.median(ordered):7.3f} ms  p95 {p95:7.3f} ms")
+    return mean
+
+
+async def main(iterations: int) -> None:
+    async with read_session_factory() as session:
+        user_id = await session.scalar(select(User.id).limit(1))
+
+    # Warm the pool and statement caches for both paths
+    await _measure(_write_style, 50, user_id)
+    await _measure(_read_style, 50, user_id)
+
+    write_mean = _report("get_db", await _measure(_write_style, iterations, user_id))
+    read_mean = _report("get_read_db", await _measure(_read_style, iterations, user_id))
+    print(f"saved per request: {write_mean - read_mean:.3f} ms")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,113 @@
+"""Insert throughput, WAL volume and index bloat: UUIDv4 versus UUIDv7 keys.
+
+For each UUID version, inserts rows into a scratch table keyed by a uuid
+primary key with an indexed uuid foreign-key column, as the model tables are,
+then reports the insert rate, the WAL written, the size of both indexes and,
+when the pgstattuple extension is installed, their leaf density and
+fragmentation. Random v4 keys split pages all over the index and leave them
+half full; v7 keys append to the rightmost page. Scratch tables are dropped
+at the end.
+
+    python benchmarks/uuid_keys.py --rows 2000000
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from sqlalchemy import text
+
+from chavfana.db.database import engine
+from chavfana.models.ids import uuid7
+
+GENERATORS = {"v4": uuid.uuid4, "v7": uuid7}
+WAL_LSN_SQL = text("SELECT pg_current_wal_lsn()")
+WAL_BYTES_SQL = text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), CAST(:since AS pg_lsn))")
+INDEX_SIZE_SQL = text("SELECT pg_relation_size(CAST(:index AS regclass))")
+PGSTATTUPLE_SQL = text("SELECT 1 FROM pg_extension WHERE extname = 'pgstattuple'")
+INDEX_STATS_SQL = text(
+    "SELECT avg_leaf_density, leaf_fragmentation FROM pgstatindex(CAST(:index AS regclass))"
+)
+
+
+def _mb(size_bytes: float) -> str:
+    return f"{size_bytes / 1024 / 1024:8.1f} MB"
+
+
+async def _create(table: str) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await connection.execute(
+            text(
+                f"CREATE TABLE {table} "
+                "(id uuid PRIMARY KEY, parent_id uuid NOT NULL, payload text)"
+            )
+        )
+        await connection.execute(
+            text(f"CREATE INDEX ix_{table}_parent_id ON {table} (parent_id)")
+        )
+
+
+async def _measure(version: str, rows: int, batch_size: int, stats: bool) -> None:
+    new_id = GENERATORS[version]
+    table = f"bench_uuid_{version}"
+    await _create(table)
+    insert_sql = text(f"INSERT INTO {table} (id, parent_id, payload) VALUES (:id, :parent_id, 'x')")
+    # Children reference parents created shortly before them, as rows do
+    parents = [new_id() for _ in range(1000)]
+
+    async with engine.connect() as connection:
+        since = await connection.scalar(WAL_LSN_SQL)
+        await connection.commit()
+        started = time.perf_counter()
+        for start in range(0, rows, batch_size):
+            batch = [
+                {"id": new_id(), "parent_id": parents[(start + n) % len(parents)]}
+                for n in range(min(batch_size, rows - start))
+            ]
+            await connection.execute(insert_sql, batch)
+            await connection.commit()
+            if start % (batch_size * 100) == 0:
+                parents = [new_id() for _ in range(1000)]
+        elapsed = time.perf_counter() - started
+        wal_bytes = await connection.scalar(WAL_BYTES_SQL, {"since": str(since)})
+
+        line = f"{version}  insert {rows / elapsed:9.0f} rows/s  WAL {_mb(wal_bytes)}"
+        for index in (f"{table}_pkey", f"ix_{table}_parent_id"):
+            size = await connection.scalar(INDEX_SIZE_SQL, {"index": index})
+            line += f"\n    {index:<28} {_mb(size)}"
+            if stats:
+                density, fragmentation = (
+                    await connection.execute(INDEX_STATS_SQL, {"index": index})
+                ).one()
+                line += f"  leaf density {density:5.1f}%  fragmentation {fragmentation:5.1f}%"
+        print(line)
+
+
+async def main(rows: int, batch_size: int, keep: bool) -> None:
+    async with engine.connect() as connection:
+        stats = bool(await connection.scalar(PGSTATTUPLE_SQL))
+    if not stats:
+        print("pgstattuple is not installed; reporting index sizes only\n")
+    try:
+        for version in GENERATORS:
+            await _measure(version, rows, batch_size, stats)
+    finally:
+        if not keep:
+            async with engine.begin() as connection:
+                for version in GENERATORS:
+                    await connection.execute(text(f"DROP TABLE IF EXISTS bench_uuid_{version}"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch tables")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch_size, args.keep))
@@ -0,0 +1,207 @@
+"""Report duplicate, redundant and unused indexes in the configured database.
+
+Duplicate: same table, columns, operator classes, expressions and predicate.
+Redundant: a plain btree index whose key columns are a leading prefix of
+another btree index on the same table with the same predicate, and whose
+INCLUDE columns that index also holds.
+Unused: never scanned since the statistics were last reset, according to
+pg_stat_user_indexes. Unique and primary-key indexes are never reported as
+unused, since they enforce a constraint even when no query reads them.
+Poorly correlated BRIN: the column's physical order no longer follows its
+values (pg_stats.correlation), so every block range matches most queries.
+
+    python bin/audit_indexes.py --min-size-kb 64
+"""
+import argparse
+import asyncio
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from sqlalchemy import text
+
+from chavfana.db.database import engine
+
+INDEXES_SQL = text(
+    """
+    SELECT s.schemaname AS schema,
+           s.relname AS table_name,
+           s.indexrelname AS index_name,
+           i.indisunique AS is_unique,
+           i.indisprimary AS is_primary,
+           c.conname AS constraint_name,
+           am.amname AS method,
+           i.indkey::text AS columns,
+           i.indnkeyatts AS key_count,
+           i.indclass::text AS opclasses,
+           COALESCE(pg_get_expr(i.indexprs, i.indrelid), '') AS expressions,
+           COALESCE(pg_get_expr(i.indpred, i.indrelid), '') AS predicate,
+           s.idx_scan AS scans,
+           pg_relation_size(s.indexrelid) AS size_bytes,
+           pg_get_indexdef(s.indexrelid) AS definition
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    JOIN pg_class ic ON ic.oid = s.indexrelid
+    JOIN pg_am am ON am.oid = ic.relam
+    LEFT JOIN pg_constraint c ON c.conindid = s.indexrelid
+    WHERE s.schemaname NOT IN ('pg_catalog', 'information_schema')
+    ORDER BY s.schemaname, s.relname, s.indexrelname
+    """
+)
+BRIN_CORRELATION_SQL = text(
+    """
+    SELECT s.relname AS table_name,
+           s.indexrelname AS index_name,
+           a.attname AS column_name,
+           st.correlation
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    JOIN pg_class ic ON ic.oid = s.indexrelid
+    JOIN pg_am am ON am.oid = ic.relam
+    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+    JOIN pg_stats st
+      ON st.schemaname = s.schemaname AND st.tablename = s.relname AND st.attname = a.attname
+    WHERE am.amname = 'brin' AND abs(st.correlation) < :min_correlation
+    ORDER BY s.relname, s.indexrelname
+    """
+)
+STATS_RESET_SQL = text(
+    "SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()"
+)
+
+
+def _size(size_bytes: int) -> str:
+    return f"{size_bytes / 1024:.0f} kB"
+
+
+def _droppable(index) -> bool:
+    return not index.is_primary and index.constraint_name is None
+
+
+def _split_columns(index):
+    """Key columns and INCLUDE columns of ``index``, as attribute numbers."""
+    columns = index.columns.split()
+    return columns[: index.key_count], columns[index.key_count :]
+
+
+def find_duplicates(indexes):
+    groups = defaultdict(list)
+    for index in indexes:
+        key = (
+            index.schema,
+            index.table_name,
+            index.method,
+            index.columns,
+            index.opclasses,
+            index.expressions,
+            index.predicate,
+        )
+        groups[key].append(index)
+    findings = []
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        # Keep whatever backs a constraint, else the first by name
+        keep = next((index for index in group if not _droppable(index)), group[0])
+        findings.extend((index, keep) for index in group if index is not keep)
+    return findings
+
+
+def find_redundant(indexes, duplicates):
+    already = {index.index_name for index, _ in duplicates}
+    by_table = defaultdict(list)
+    for index in indexes:
+        if index.method == "btree" and not index.expressions:
+            by_table[(index.schema, index.table_name)].append(index)
+    findings = []
+    for table_indexes in by_table.values():
+        for index in table_indexes:
+            if index.is_unique or not _droppable(index) or index.index_name in already:
+                continue
+            keys, included = _split_columns(index)
+            for other in table_indexes:
+                other_keys, other_included = _split_columns(other)
+                if (
+                    other is not index
+                    and other.predicate == index.predicate
+                    and other_keys[: len(keys)] == keys
+                    and set(included) <= set(other_keys + other_included)
+                    and (
+                        len(other_keys) > len(keys)
+                        or len(other_included) > len(included)
+                    )
+                ):
+                    findings.append((index, other))
+                    break
+    return findings
+
+
+def find_unused(indexes, reported):
+    return [
+        index
+        for index in indexes
+        if index.scans == 0
+        and not index.is_unique
+        and _droppable(index)
+        and index.index_name not in reported
+    ]
+
+
+async def main(min_size_kb: int, min_correlation: float) -> int:
+    async with engine.connect() as connection:
+        indexes = (await connection.execute(INDEXES_SQL)).all()
+        stats_reset = await connection.scalar(STATS_RESET_SQL)
+        uncorrelated = (
+            await connection.execute(
+                BRIN_CORRELATION_SQL, {"min_correlation": min_correlation}
+            )
+        ).all()
+    await engine.dispose()
+
+    duplicates = find_duplicates(indexes)
+    redundant = find_redundant(indexes, duplicates)
+    reported = {index.index_name for index, _ in duplicates + redundant}
+    unused = [
+        index
+        for index in find_unused(indexes, reported)
+        if index.size_bytes >= min_size_kb * 1024
+    ]
+
+    print(f"{len(indexes)} indexes, statistics collected since {stats_reset or 'cluster start'}\n")
+    print("Duplicate indexes:")
+    for index, keep in duplicates:
+        print(f"  {index.table_name}.{index.index_name} ({_size(index.size_bytes)}) duplicates {keep.index_name}")
+    print("\nRedundant indexes (leading prefix of another index):")
+    for index, covering in redundant:
+        print(f"  {index.table_name}.{index.index_name} ({_size(index.size_bytes)}) covered by {covering.index_name}")
+    print("\nUnused indexes (0 scans):")
+    for index in unused:
+        print(f"  {index.table_name}.{index.index_name} ({_size(index.size_bytes)}): {index.definition}")
+    print(f"\nBRIN indexes on poorly correlated columns (|correlation| < {min_correlation}):")
+    for index in uncorrelated:
+        print(f"  {index.table_name}.{index.index_name} on {index.column_name}: {index.correlation:.2f}")
+
+    wasted = sum(index.size_bytes for index, _ in duplicates + redundant)
+    wasted += sum(index.size_bytes for index in unused)
+    print(f"\n{len(duplicates) + len(redundant) + len(unused)} findings, {_size(wasted)} in total")
+    return 1 if duplicates or redundant else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--min-size-kb",
+        type=int,
+        default=0,
+        help="Only report unused indexes at least this large",
+    )
+    parser.add_argument(
+        "--min-correlation",
+        type=float,
+        default=0.9,
+        help="Report BRIN indexes whose column correlation is below this",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.min_size_kb, args.min_correlation)))
@@ -0,0 +1,45 @@
+import argparse
+import statistics
+import time
+
+import bcrypt
+
+
+def time_hash(rounds: int, samples: int) -> float:
+    """Median wall time in milliseconds to hash one password at ``rounds``."""
+    password = b"calibration-password"
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, samples: int, min_rounds: int = 10, max_rounds: int = 16) -> int:
+    """Return the highest cost whose hash time stays within ``target_ms``."""
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        elapsed = time_hash(rounds, samples)
+        print(f"cost {rounds:>2}: {elapsed:8.1f} ms")
+        if elapsed > target_ms:
+            break
+        chosen = rounds
+    return chosen
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Pick a bcrypt cost for a target login latency on this machine"
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    rounds = calibrate(args.target_ms, args.samples, min_rounds=args.min_rounds)
+    print(f"\nBCRYPT_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Snapshot the plans of the covered listing queries and check they are index-only.
+
+Runs EXPLAIN (ANALYZE, BUFFERS) for the farm plot, project animal and farm
+employee listings, using the key with the most rows in each table, writes each
+plan to ``<out>/<listing>.txt`` and exits 1 if any plan is not an Index Only
+Scan on its covering index. On a small development database the planner
+prefers a sequential scan; --force-index disables that to check the shape of
+the plan.
+
+    python bin/explain_listings.py --vacuum --out docs/explain
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from chavfana.controllers.animals import AnimalController
+from chavfana.controllers.auth import AuthController
+from chavfana.controllers.farms import FarmController
+from chavfana.db.database import engine
+from chavfana.db.soft_delete import not_deleted
+
+# listing name: (table, key column, query builder, covering index)
+LISTINGS = {
+    "plots_by_farm": ("plots", "farm_id", FarmController.plots_by_farm_query, "ix_plots_farm_id"),
+    "animals_by_project": (
+        "animals",
+        "project_id",
+        AnimalController.animals_by_project_query,
+        "ix_animals_project_id",
+    ),
+    "employees_by_farm": (
+        "employees",
+        "farm_id",
+        AuthController.employees_by_farm_query,
+        "ix_employees_farm_id",
+    ),
+}
+
+
+async def _vacuum() -> None:
+    async with engine.connect() as connection:
+        # VACUUM cannot run inside a transaction block
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        for table, *_ in LISTINGS.values():
+            await connection.execute(text(f"VACUUM (ANALYZE) {table}"))
+
+
+async def _explain(connection, table: str, key: str, build, force_index: bool):
+    transaction = await connection.begin()
+    try:
+        sample = await connection.scalar(
+            text(
+                f"SELECT {key} FROM {table} WHERE is_deleted = false "
+                f"GROUP BY {key} ORDER BY count(*) DESC LIMIT 1"
+            )
+        )
+        if sample is None:
+            return None
+        # Compiled outside the session, so the soft-delete filter is added here
+        compiled = build(sample).options(not_deleted()).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        if force_index:
+            await connection.execute(text("SET LOCAL enable_seqscan = off"))
+            await connection.execute(text("SET LOCAL enable_bitmapscan = off"))
+        rows = await connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}"))
+        return "\n".join(row[0] for row in rows)
+    finally:
+        await transaction.rollback()
+
+
+async def main(out: str, vacuum: bool, force_index: bool) -> int:
+    if vacuum:
+        await _vacuum()
+    Path(out).mkdir(parents=True, exist_ok=True)
+    failures = 0
+    async with engine.connect() as connection:
+        for name, (table, key, build, index) in LISTINGS.items():
+            plan = await _explain(connection, table, key, build, force_index)
+            if plan is None:
+                print(f"{name:<20} skipped: {table} has no live rows")
+                continue
+            (Path(out) / f"{name}.txt").write_text(plan + "\n")
+            if f"Index Only Scan using {index}" in plan:
+                heap_fetches = next(
+                    (line.strip() for line in plan.splitlines() if "Heap Fetches" in line),
+                    "",
+                )
+                print(f"{name:<20} Index Only Scan using {index}  {heap_fetches}")
+            else:
+                failures += 1
+                print(f"{name:<20} NOT index-only:\n{plan}")
+    await engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="docs/explain", help="Directory for plan snapshots")
+    parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="VACUUM (ANALYZE) the tables first so the visibility map is current",
+    )
+    parser.add_argument(
+        "--force-index",
+        action="store_true",
+        help="Disable sequential and bitmap scans, for small databases",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.out, args.vacuum, args.force_index)))
@@ -0,0 +1,46 @@
+"""Create upcoming monthly partitions and expire the ones past retention.
+
+Run it daily (cron or a scheduled job); it is idempotent. Expired months of
+tables with an archive directory (audit_logs) are archived and dropped; other
+expired months are detached, which keeps their data as standalone tables,
+unless --drop is given.
+
+    python bin/maintain_partitions.py --drop
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from chavfana.db.database import engine
+from chavfana.db.partitions import PARTITIONED_TABLES
+
+
+async def main(drop: bool) -> None:
+    today = datetime.now(timezone.utc).date()
+    for partitions in PARTITIONED_TABLES:
+        async with engine.connect() as connection:
+            created, expired = await partitions.maintain(connection, today, drop=drop)
+        if partitions.archive_dir:
+            action = "archived"
+        else:
+            action = "dropped" if drop else "detached"
+        print(
+            f"{partitions.table}: created {', '.join(created) or 'none'}; "
+            f"{action} {', '.join(expired) or 'none'}"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="Drop expired partitions instead of only detaching them",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.drop))
@@ -0,0 +1,38 @@
+"""Load an archived month of a partitioned table back for investigation.
+
+The rows go into a standalone <table>_restored_yYYYYmMM table that the
+application and partition maintenance ignore; drop it when you are done.
+
+    python bin/restore_archive.py --table audit_logs --month 2025-03
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from chavfana.db.database import engine
+from chavfana.db.partitions import PARTITIONED_TABLES
+
+
+async def main(table: str, month: date) -> None:
+    partitions = next(p for p in PARTITIONED_TABLES if p.table == table)
+    async with engine.connect() as connection:
+        name, rows = await partitions.restore(connection, month)
+    await engine.dispose()
+    print(f"Restored {rows} rows into {name}")
+
+
+if __name__ == "__main__":
+    archived = [p.table for p in PARTITIONED_TABLES if p.archive_dir]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--table", default="audit_logs", choices=archived)
+    parser.add_argument("--month", required=True, help="YYYY-MM")
+    args = parser.parse_args()
+    try:
+        month = date.fromisoformat(f"{args.month}-01")
+    except ValueError:
+        parser.error("--month must be YYYY-MM")
+    asyncio.run(main(args.table, month))
@@ -0,0 +1,35 @@
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from chavfana.core.config import settings
+from chavfana.core.keyring import ASYMMETRIC_ALGORITHMS, SYMMETRIC_ALGORITHMS, rotate_keyring
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rotate the JWT signing keyring")
+    parser.add_argument("--keyring", default=settings.JWT_KEYRING_FILE)
+    parser.add_argument(
+        "--alg",
+        default="ES256",
+        choices=sorted(SYMMETRIC_ALGORITHMS | ASYMMETRIC_ALGORITHMS),
+    )
+    parser.add_argument(
+        "--retain-minutes",
+        type=int,
+        default=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+        help="How long retired keys keep verifying tokens",
+    )
+    args = parser.parse_args()
+
+    if not args.keyring:
+        parser.error("--keyring or JWT_KEYRING_FILE is required")
+
+    kid = rotate_keyring(args.keyring, args.alg, args.retain_minutes)
+    print(f"Active signing key is now {kid}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Report table and index sizes, and what changed since a saved snapshot.
+
+Take a snapshot before a storage migration (such as the enum conversion of
+the status and role columns), run it, then compare. A column type change
+rewrites its table, so VACUUM FULL the tables before the first snapshot for
+a like-for-like comparison.
+
+    python bin/table_sizes.py --save before.json
+    alembic upgrade head
+    python bin/table_sizes.py --compare before.json
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from sqlalchemy import text
+
+from chavfana.db.database import engine
+
+# Partitions are folded into their parent so partitioned tables report as one
+SIZES_SQL = text(
+    """
+    SELECT COALESCE(parent.relname, c.relname) AS table_name,
+           sum(pg_table_size(c.oid)) AS table_bytes,
+           sum(pg_indexes_size(c.oid)) AS index_bytes,
+           sum(c.reltuples)::bigint AS row_estimate
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_inherits i ON i.inhrelid = c.oid
+    LEFT JOIN pg_class parent ON parent.oid = i.inhparent
+    WHERE c.relkind = 'r' AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+    GROUP BY 1
+    ORDER BY 1
+    """
+)
+
+
+def _mb(size_bytes: float) -> str:
+    return f"{size_bytes / 1024 / 1024:10.2f} MB"
+
+
+def _change(before: int, after: int) -> str:
+    if not before:
+        return "      -"
+    return f"{(after - before) / before * 100:+6.1f}%"
+
+
+async def collect() -> dict:
+    async with engine.connect() as connection:
+        rows = (await connection.execute(SIZES_SQL)).all()
+    await engine.dispose()
+    return {
+        row.table_name: {
+            "table_bytes": int(row.table_bytes),
+            "index_bytes": int(row.index_bytes),
+            "rows": max(int(row.row_estimate), 0),
+        }
+        for row in rows
+    }
+
+
+def print_sizes(sizes: dict) -> None:
+    print(f"{'table':<28}{'rows':>12}{'table':>14}{'indexes':>14}")
+    for name, size in sizes.items():
+        print(
+            f"{name:<28}{size['rows']:>12}"
+            f"{_mb(size['table_bytes'])}  {_mb(size['index_bytes'])}"
+        )
+
+
+def print_comparison(before: dict, after: dict) -> None:
+    print(f"{'table':<28}{'table before':>14}{'after':>14}{'':>8}{'indexes before':>16}{'after':>14}")
+    totals = [0, 0, 0, 0]
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name], after[name]
+        print(
+            f"{name:<28}{_mb(old['table_bytes'])}  {_mb(new['table_bytes'])}  "
+            f"{_change(old['table_bytes'], new['table_bytes'])}  "
+            f"{_mb(old['index_bytes'])}  {_mb(new['index_bytes'])}  "
+            f"{_change(old['index_bytes'], new['index_bytes'])}"
+        )
+        for position, value in enumerate(
+            (old["table_bytes"], new["table_bytes"], old["index_bytes"], new["index_bytes"])
+        ):
+            totals[position] += value
+    print(
+        f"{'total':<28}{_mb(totals[0])}  {_mb(totals[1])}  {_change(totals[0], totals[1])}  "
+        f"{_mb(totals[2])}  {_mb(totals[3])}  {_change(totals[2], totals[3])}"
+    )
+
+
+async def main(save: str, compare: str) -> None:
+    sizes = await collect()
+    if compare:
+        print_comparison(json.loads(Path(compare).read_text()), sizes)
+    else:
+        print_sizes(sizes)
+    if save:
+        Path(save).write_text(json.dumps(sizes, indent=2))
+        print(f"\nSaved snapshot to {save}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", help="Write the current sizes to this JSON file")
+    parser.add_argument("--compare", help="Compare against a snapshot written by --save")
+    args = parser.parse_args()
+    asyncio.run(main(args.save, args.compare))
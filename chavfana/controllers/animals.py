@@ -1,10 +1,12 @@
 from typing import Optional, List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chavfana.db.projections import load_read_columns
 from chavfana.models.animal import Animal, AnimalGroup
+from chavfana.schemas.animal import AnimalRead
 from chavfana.core.exceptions import NotFoundError
 
 
@@ -15,9 +17,17 @@ class AnimalController:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def animals_by_project_query(project_id: UUID) -> Select:
+        return (
+            select(Animal)
+            .options(load_read_columns(Animal, AnimalRead))
+            .where(Animal.project_id == project_id)
+        )
+
     @staticmethod
     async def get_animals_by_project(db: AsyncSession, project_id: UUID) -> List[Animal]:
-        stmt = select(Animal).where(Animal.project_id == project_id)
+        stmt = AnimalController.animals_by_project_query(project_id)
         result = await db.execute(stmt)
         return result.scalars().all()
 
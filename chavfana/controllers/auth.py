@@ -1,30 +1,74 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 import uuid
 import bcrypt
-from jose import jwt
+from fastapi import BackgroundTasks
 
-from sqlalchemy import select, update
+from sqlalchemy import Select, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from chavfana.models.user import User, Employee
-from chavfana.schemas.user import UserCreate, UserUpdate, UserRead, EmployeeCreate, EmployeeRead
-from chavfana.core.exceptions import NotFoundError, BusinessLogicError, AuthenticationError, DatabaseIntegrityError
+from chavfana.schemas.user import UserCreate, UserUpdate, UserRead, UserPage, EmployeeCreate, EmployeeUpdate, EmployeeRead
+from chavfana.core.exceptions import NotFoundError, BusinessLogicError, AuthenticationError, DatabaseIntegrityError, ValidationError
 from chavfana.core.logging import logger
 from chavfana.core.config import settings
+from chavfana.core.keyring import keyring
+from chavfana.core.cache import user_cache
+from chavfana.db.database import async_session_factory, is_replica_session
+from chavfana.db.pagination import estimate_count, keyset_page
+from chavfana.db.projections import load_read_columns
+from chavfana.db.updates import update_returning
+from chavfana.db.upserts import insert_unique
+from chavfana.db.notifications import USER_CACHE_CHANNEL, invalidation_listener, publish_invalidation
+
+invalidation_listener.register(
+    USER_CACHE_CHANNEL,
+    on_keys=lambda keys: user_cache.delete(*keys),
+    on_reset=user_cache.clear,
+)
 
 
 class AuthController:
     @staticmethod
-    def hash_password(password: str) -> str:
-        salt = bcrypt.gensalt()
+    def hash_password(password: str, rounds: Optional[int] = None) -> str:
+        salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
         return bcrypt.hashpw(password.encode(), salt).decode()
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
         return bcrypt.checkpw(password.encode(), password_hash.encode())
 
+    @staticmethod
+    def password_cost(password_hash: str) -> Optional[int]:
+        # Modular crypt format: $2b$<cost>$<salt+hash>
+        try:
+            return int(password_hash.split("$")[2])
+        except (IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def needs_rehash(password_hash: str) -> bool:
+        return AuthController.password_cost(password_hash) != settings.BCRYPT_ROUNDS
+
+    @staticmethod
+    async def rehash_password(user_id: uuid.UUID, password: str, old_hash: str) -> None:
+        try:
+            new_hash = await asyncio.to_thread(AuthController.hash_password, password)
+            async with async_session_factory() as session:
+                # Only replace the hash we verified, never a concurrent password change
+                await session.execute(
+                    update(User)
+                    .where(User.id == user_id, User.password_hash == old_hash)
+                    .values(password_hash=new_hash)
+                )
+                await session.commit()
+            logger.info(f"Rehashed password for user {user_id} at cost {settings.BCRYPT_ROUNDS}")
+        except Exception as e:
+            logger.error(f"Error rehashing password: {str(e)}")
+
     @staticmethod
     def create_access_token(user_id: uuid.UUID, role: str) -> str:
         payload = {
@@ -33,32 +77,45 @@ class AuthController:
             "exp": datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
             "iat": datetime.now(timezone.utc),
         }
-        return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        return keyring.sign(payload)
+
+    @staticmethod
+    def _cache_user(db: AsyncSession, user: UserRead) -> UserRead:
+        # A lagging replica can return a row an invalidation has just
+        # replaced; caching it would serve it for the whole TTL
+        if not is_replica_session(db):
+            user_cache.set(f"id:{user.id}", user)
+            user_cache.set(f"email:{user.email}", user)
+        return user
+
+    @staticmethod
+    async def invalidate_user(db: AsyncSession, user_id: uuid.UUID, *emails: str) -> None:
+        keys = [f"id:{user_id}"] + [f"email:{email}" for email in emails if email]
+        user_cache.delete(*keys)
+        # Delivered on commit, so other workers (and this one) drop the entry
+        # only once the new row is visible
+        await publish_invalidation(db, USER_CACHE_CHANNEL, keys)
 
     @staticmethod
     async def create_user(db: AsyncSession, request_data: UserCreate) -> UserRead:
         try:
-            existing_user = await db.execute(
-                select(User).where(User.email == request_data.email)
-            )
-            if existing_user.scalar_one_or_none():
-                raise BusinessLogicError(message="Email already registered")
-
             hashed_password = AuthController.hash_password(request_data.password)
-            
-            new_user = User(
-                email=request_data.email,
-                full_name=request_data.full_name,
-                phone=request_data.phone,
-                role=request_data.role,
-                password_hash=hashed_password,
-                profile_data=request_data.profile_data,
+
+            new_user = await insert_unique(
+                db,
+                User,
+                dict(
+                    email=request_data.email,
+                    full_name=request_data.full_name,
+                    phone=request_data.phone,
+                    role=request_data.role,
+                    password_hash=hashed_password,
+                    profile_data=request_data.profile_data,
+                ),
+                conflict_on=["email"],
+                message="Email already registered",
             )
-            
-            db.add(new_user)
-            await db.flush()
-            await db.refresh(new_user)
-            
+
             logger.info(f"User created: {new_user.email} with role {new_user.role}")
             return UserRead.model_validate(new_user)
         except BusinessLogicError:
@@ -68,7 +125,12 @@ class AuthController:
             raise DatabaseIntegrityError(message="Failed to create user")
 
     @staticmethod
-    async def login(db: AsyncSession, email: str, password: str) -> Dict[str, Any]:
+    async def login(
+        db: AsyncSession,
+        email: str,
+        password: str,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Dict[str, Any]:
         try:
             result = await db.execute(
                 select(User).where(User.email == email)
@@ -84,9 +146,14 @@ class AuthController:
             if not AuthController.verify_password(password, user.password_hash):
                 raise AuthenticationError(message="Invalid email or password")
             
+            if background_tasks is not None and AuthController.needs_rehash(user.password_hash):
+                background_tasks.add_task(
+                    AuthController.rehash_password, user.id, password, user.password_hash
+                )
+            
             user.last_login = datetime.now(timezone.utc)
             await db.flush()
-            await db.refresh(user)
+            await AuthController.invalidate_user(db, user.id, user.email)
             
             access_token = AuthController.create_access_token(user.id, user.role)
             
@@ -104,6 +171,9 @@ class AuthController:
 
     @staticmethod
     async def get_user_by_id(db: AsyncSession, user_id: uuid.UUID) -> UserRead:
+        cached = user_cache.get(f"id:{user_id}")
+        if cached is not None:
+            return cached
         try:
             result = await db.execute(
                 select(User).where(User.id == user_id)
@@ -113,7 +183,7 @@ class AuthController:
             if not user:
                 raise NotFoundError(resource_type="User", resource_id=str(user_id))
             
-            return UserRead.model_validate(user)
+            return AuthController._cache_user(db, UserRead.model_validate(user))
         except NotFoundError:
             raise
         except Exception as e:
@@ -122,6 +192,9 @@ class AuthController:
 
     @staticmethod
     async def get_user_by_email(db: AsyncSession, email: str) -> UserRead:
+        cached = user_cache.get(f"email:{email}")
+        if cached is not None:
+            return cached
         try:
             result = await db.execute(
                 select(User).where(User.email == email)
@@ -131,7 +204,7 @@ class AuthController:
             if not user:
                 raise NotFoundError(resource_type="User", resource_id=email)
             
-            return UserRead.model_validate(user)
+            return AuthController._cache_user(db, UserRead.model_validate(user))
         except NotFoundError:
             raise
         except Exception as e:
@@ -140,34 +213,27 @@ class AuthController:
 
     @staticmethod
     async def update_user(db: AsyncSession, user_id: uuid.UUID, request_data: UserUpdate) -> UserRead:
+        update_data = request_data.model_dump(exclude_unset=True)
         try:
-            result = await db.execute(
-                select(User).where(User.id == user_id)
+            # Evaluated against the pre-update snapshot, so this is the old email
+            previous = aliased(User)
+            previous_email = (
+                select(previous.email).where(previous.id == user_id).scalar_subquery()
             )
-            user = result.scalar_one_or_none()
-            
-            if not user:
-                raise NotFoundError(resource_type="User", resource_id=str(user_id))
-            
-            update_data = request_data.model_dump(exclude_unset=True)
-            
-            if "email" in update_data and update_data["email"] != user.email:
-                existing = await db.execute(
-                    select(User).where(User.email == update_data["email"])
-                )
-                if existing.scalar_one_or_none():
-                    raise BusinessLogicError(message="Email already in use")
-            
-            for field, value in update_data.items():
-                setattr(user, field, value)
-            
-            await db.flush()
-            await db.refresh(user)
-            
+            user, previous_email = await update_returning(
+                db, User, user_id, update_data, previous_email
+            )
+            await AuthController.invalidate_user(db, user.id, previous_email, user.email)
+
             logger.info(f"User updated: {user.email}")
             return UserRead.model_validate(user)
-        except (NotFoundError, BusinessLogicError):
+        except (NotFoundError, ValidationError):
             raise
+        except IntegrityError as e:
+            if "email" in update_data:
+                raise BusinessLogicError(message="Email already in use")
+            logger.error(f"Error updating user: {str(e)}")
+            raise DatabaseIntegrityError(message="Failed to update user")
         except Exception as e:
             logger.error(f"Error updating user: {str(e)}")
             raise DatabaseIntegrityError(message="Failed to update user")
@@ -185,7 +251,7 @@ class AuthController:
             
             user.is_active = False
             await db.flush()
-            await db.refresh(user)
+            await AuthController.invalidate_user(db, user.id, user.email)
             
             logger.info(f"User deactivated: {user.email}")
             return UserRead.model_validate(user)
@@ -208,7 +274,7 @@ class AuthController:
             
             user.is_active = True
             await db.flush()
-            await db.refresh(user)
+            await AuthController.invalidate_user(db, user.id, user.email)
             
             logger.info(f"User activated: {user.email}")
             return UserRead.model_validate(user)
@@ -234,6 +300,7 @@ class AuthController:
             
             user.password_hash = AuthController.hash_password(new_password)
             await db.flush()
+            await AuthController.invalidate_user(db, user.id, user.email)
             
             logger.info(f"Password changed for user: {user.email}")
             return {"message": "Password changed successfully"}
@@ -244,25 +311,42 @@ class AuthController:
             raise DatabaseIntegrityError(message="Failed to change password")
 
     @staticmethod
-    async def get_all_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> list[UserRead]:
+    async def _users_page(
+        db: AsyncSession, stmt, cursor: Optional[str], limit: int, include_total: bool
+    ) -> UserPage:
+        users, next_cursor = await keyset_page(db, stmt, User, cursor, limit)
+        return UserPage(
+            items=[UserRead.model_validate(user) for user in users],
+            next_cursor=next_cursor,
+            estimated_total=await estimate_count(db, stmt) if include_total else None,
+        )
+
+    @staticmethod
+    async def get_all_users(
+        db: AsyncSession, cursor: Optional[str] = None, limit: int = 100, include_total: bool = False
+    ) -> UserPage:
         try:
-            result = await db.execute(
-                select(User).offset(skip).limit(limit)
-            )
-            users = result.scalars().all()
-            return [UserRead.model_validate(user) for user in users]
+            return await AuthController._users_page(db, select(User), cursor, limit, include_total)
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching users: {str(e)}")
             raise
 
     @staticmethod
-    async def get_users_by_role(db: AsyncSession, role: str, skip: int = 0, limit: int = 100) -> list[UserRead]:
+    async def get_users_by_role(
+        db: AsyncSession,
+        role: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include_total: bool = False,
+    ) -> UserPage:
         try:
-            result = await db.execute(
-                select(User).where(User.role == role).offset(skip).limit(limit)
+            return await AuthController._users_page(
+                db, select(User).where(User.role == role), cursor, limit, include_total
             )
-            users = result.scalars().all()
-            return [UserRead.model_validate(user) for user in users]
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching users by role: {str(e)}")
             raise
@@ -270,11 +354,7 @@ class AuthController:
     @staticmethod
     async def create_employee(db: AsyncSession, request_data: EmployeeCreate) -> EmployeeRead:
         try:
-            result = await db.execute(
-                select(User).where(User.id == request_data.user_id)
-            )
-            if not result.scalar_one_or_none():
-                raise NotFoundError(resource_type="User", resource_id=str(request_data.user_id))
+            await AuthController.get_user_by_id(db, request_data.user_id)
             
             new_employee = Employee(
                 user_id=request_data.user_id,
@@ -288,7 +368,6 @@ class AuthController:
             
             db.add(new_employee)
             await db.flush()
-            await db.refresh(new_employee)
             
             logger.info(f"Employee created: {new_employee.id}")
             return EmployeeRead.model_validate(new_employee)
@@ -316,12 +395,18 @@ class AuthController:
             logger.error(f"Error fetching employee: {str(e)}")
             raise
 
+    @staticmethod
+    def employees_by_farm_query(farm_id: uuid.UUID) -> Select:
+        return (
+            select(Employee)
+            .options(load_read_columns(Employee, EmployeeRead))
+            .where(Employee.farm_id == farm_id)
+        )
+
     @staticmethod
     async def get_employees_by_farm(db: AsyncSession, farm_id: uuid.UUID) -> list[EmployeeRead]:
         try:
-            result = await db.execute(
-                select(Employee).where(Employee.farm_id == farm_id)
-            )
+            result = await db.execute(AuthController.employees_by_farm_query(farm_id))
             employees = result.scalars().all()
             return [EmployeeRead.model_validate(emp) for emp in employees]
         except Exception as e:
@@ -329,26 +414,15 @@ class AuthController:
             raise
 
     @staticmethod
-    async def update_employee(db: AsyncSession, employee_id: uuid.UUID, request_data: Dict[str, Any]) -> EmployeeRead:
+    async def update_employee(db: AsyncSession, employee_id: uuid.UUID, request_data: EmployeeUpdate) -> EmployeeRead:
         try:
-            result = await db.execute(
-                select(Employee).where(Employee.id == employee_id)
+            (employee,) = await update_returning(
+                db, Employee, employee_id, request_data.model_dump(exclude_unset=True)
             )
-            employee = result.scalar_one_or_none()
-            
-            if not employee:
-                raise NotFoundError(resource_type="Employee", resource_id=str(employee_id))
-            
-            for field, value in request_data.items():
-                if value is not None:
-                    setattr(employee, field, value)
-            
-            await db.flush()
-            await db.refresh(employee)
-            
+
             logger.info(f"Employee updated: {employee.id}")
             return EmployeeRead.model_validate(employee)
-        except NotFoundError:
+        except (NotFoundError, ValidationError):
             raise
         except Exception as e:
             logger.error(f"Error updating employee: {str(e)}")
@@ -1,13 +1,25 @@
-from typing import Optional, List
+import math
+from typing import Any, Dict, Optional, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import ColumnElement, Select, and_, delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from chavfana.core.geo import (
+    EARTH_RADIUS_KM,
+    encode,
+    parse_coordinate,
+    prefix_upper_bound,
+    search_cells,
+)
+from chavfana.models.daily_tasks import DailyEntry
 from chavfana.models.farm import Farm
 from chavfana.models.plot import Plot
-from chavfana.schemas.farm import FarmCreate, PlotCreate
+from chavfana.schemas.farm import FarmCreate, FarmUpdate, PlotCreate, PlotRead, PlotUpdate
+from chavfana.db.projections import load_read_columns
+from chavfana.db.updates import update_returning
+from chavfana.db.upserts import insert_unique
 from chavfana.core.exceptions import (
     NotFoundError,
     DatabaseError,
@@ -15,6 +27,28 @@ from chavfana.core.exceptions import (
     BusinessLogicError,
 )
 
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _coordinate_columns(geo_coordinate: Optional[dict]) -> Dict[str, Any]:
+    """Farm latitude, longitude and geohash derived from ``geo_coordinate``."""
+    coordinate = parse_coordinate(geo_coordinate)
+    if coordinate is None:
+        return {"latitude": None, "longitude": None, "geohash": None}
+    lat, lon = coordinate
+    return {"latitude": lat, "longitude": lon, "geohash": encode(lat, lon)}
+
+
+def _distance_km(lat: float, lon: float) -> ColumnElement[float]:
+    """Haversine distance in km from a farm's coordinates to ``(lat, lon)``."""
+    lat_delta = func.radians(Farm.latitude - lat) * 0.5
+    lon_delta = func.radians(Farm.longitude - lon) * 0.5
+    a = func.power(func.sin(lat_delta), 2) + math.cos(math.radians(lat)) * func.cos(
+        func.radians(Farm.latitude)
+    ) * func.power(func.sin(lon_delta), 2)
+    # least() guards asin against rounding just above 1 for antipodal points
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
 
 class FarmController:
     @staticmethod
@@ -28,6 +62,7 @@ class FarmController:
                 city=request_data.city,
                 address=request_data.address,
                 geo_coordinate=request_data.geo_coordinate,
+                **_coordinate_columns(request_data.geo_coordinate),
                 rectangle_boundary=request_data.rectangle_boundary,
                 area_size=request_data.area_size,
                 area_unit=request_data.area_unit,
@@ -35,11 +70,8 @@ class FarmController:
             )
             db.add(farm)
             await db.flush()
-            await db.commit()
-            await db.refresh(farm)
             return farm
         except SQLAlchemyError as e:
-            await db.rollback()
             raise DatabaseError(message=str(e))
 
     @staticmethod
@@ -58,43 +90,71 @@ class FarmController:
         return result.scalars().all()
 
     @staticmethod
-    async def update_farm(db: AsyncSession, farm_id: UUID, request_data: dict) -> Farm:
-        farm = await FarmController.get_farm_by_id(db, farm_id)
+    async def get_nearby_farms(
+        db: AsyncSession, lat: float, lon: float, radius_km: float, limit: int = 100
+    ) -> List[Tuple[Farm, float]]:
+        """Farms within ``radius_km`` of a point, nearest first, with distances.
+
+        Candidates come from ranges of ``ix_farms_geohash`` covering the
+        point's geohash cell and its neighbours; the exact haversine distance
+        is computed only for those rows.
+        """
+        distance = _distance_km(lat, lon).label("distance_km")
+        cells = search_cells(lat, lon, radius_km)
+        if cells is None:
+            candidates = Farm.geohash.is_not(None)
+        else:
+            candidates = or_(
+                *(
+                    and_(Farm.geohash >= cell, Farm.geohash < prefix_upper_bound(cell))
+                    for cell in cells
+                )
+            )
+        stmt = (
+            select(Farm, distance)
+            .where(candidates, distance <= radius_km)
+            .order_by(distance)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return result.all()
+
+    @staticmethod
+    async def update_farm(db: AsyncSession, farm_id: UUID, request_data: FarmUpdate) -> Farm:
+        changes = request_data.model_dump(exclude_unset=True)
+        if "geo_coordinate" in changes:
+            changes.update(_coordinate_columns(changes["geo_coordinate"]))
         try:
-            for key, value in request_data.items():
-                if value is not None:
-                    setattr(farm, key, value)
-            await db.flush()
-            await db.commit()
-            await db.refresh(farm)
+            (farm,) = await update_returning(db, Farm, farm_id, changes)
             return farm
         except SQLAlchemyError as e:
-            await db.rollback()
             raise DatabaseError(message=str(e))
 
     @staticmethod
     async def create_plot(db: AsyncSession, request_data: PlotCreate) -> Plot:
         try:
-            farm = await FarmController.get_farm_by_id(db, request_data.farm_id)
-
-            plot = Plot(
-                farm_id=farm.id,
-                name=request_data.name,
-                plot_code=request_data.plot_code,
-                area_size=request_data.area_size,
-                area_unit=request_data.area_unit,
-                soil_profile=request_data.soil_profile,
-                gps_bounds=request_data.gps_bounds,
-                current_crop_id=request_data.current_crop_id,
+            return await insert_unique(
+                db,
+                Plot,
+                dict(
+                    farm_id=request_data.farm_id,
+                    name=request_data.name,
+                    plot_code=request_data.plot_code,
+                    area_size=request_data.area_size,
+                    area_unit=request_data.area_unit,
+                    soil_profile=request_data.soil_profile,
+                    gps_bounds=request_data.gps_bounds,
+                    current_crop_id=request_data.current_crop_id,
+                ),
+                conflict_on=["farm_id", "plot_code"],
+                message="Plot code already used on this farm",
             )
-
-            db.add(plot)
-            await db.flush()
-            await db.commit()
-            await db.refresh(plot)
-            return plot
+        except IntegrityError as e:
+            # The farm is checked by its foreign key rather than a SELECT first
+            if getattr(e.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+                raise NotFoundError(resource_type="Farm", resource_id=str(request_data.farm_id))
+            raise DatabaseIntegrityError(message=str(e))
         except SQLAlchemyError as e:
-            await db.rollback()
             raise DatabaseError(message=str(e))
 
     @staticmethod
@@ -107,24 +167,33 @@ class FarmController:
         return plot
 
     @staticmethod
-    async def get_plots_by_farm(db: AsyncSession, farm_id: UUID) -> List[Plot]:
-        stmt = select(Plot).where(Plot.farm_id == farm_id)
+    def plots_by_farm_query(farm_id: UUID) -> Select:
+        return (
+            select(Plot)
+            .options(load_read_columns(Plot, PlotRead))
+            .where(Plot.farm_id == farm_id)
+        )
+
+    @staticmethod
+    async def get_plots_by_farm(
+        db: AsyncSession,
+        farm_id: UUID,
+        soil_profile_contains: Optional[Dict[str, Any]] = None,
+    ) -> List[Plot]:
+        stmt = FarmController.plots_by_farm_query(farm_id)
+        if soil_profile_contains is not None:
+            stmt = stmt.where(Plot.soil_profile.contains(soil_profile_contains))
         result = await db.execute(stmt)
         return result.scalars().all()
 
     @staticmethod
-    async def update_plot(db: AsyncSession, plot_id: UUID, request_data: dict) -> Plot:
-        plot = await FarmController.get_plot_by_id(db, plot_id)
+    async def update_plot(db: AsyncSession, plot_id: UUID, request_data: PlotUpdate) -> Plot:
         try:
-            for key, value in request_data.items():
-                if value is not None:
-                    setattr(plot, key, value)
-            await db.flush()
-            await db.commit()
-            await db.refresh(plot)
+            (plot,) = await update_returning(
+                db, Plot, plot_id, request_data.model_dump(exclude_unset=True)
+            )
             return plot
         except SQLAlchemyError as e:
-            await db.rollback()
             raise DatabaseError(message=str(e))
 
     @staticmethod
@@ -132,7 +201,20 @@ class FarmController:
         plot = await FarmController.get_plot_by_id(db, plot_id)
         try:
             await db.delete(plot)
-            await db.commit()
+            await db.flush()
         except SQLAlchemyError as e:
-            await db.rollback()
             raise DatabaseError(message=str(e))
+
+    @staticmethod
+    async def get_daily_entries_by_farm(
+        db: AsyncSession,
+        farm_id: UUID,
+        content_contains: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+    ) -> List[DailyEntry]:
+        stmt = select(DailyEntry).where(DailyEntry.farm_id == farm_id)
+        if content_contains is not None:
+            stmt = stmt.where(DailyEntry.content.contains(content_contains))
+        stmt = stmt.order_by(DailyEntry.date.desc()).limit(limit)
+        result = await db.execute(stmt)
+        return result.scalars().all()
@@ -0,0 +1,68 @@
+from typing import List
+
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chavfana.models.finance import InventoryItem
+from chavfana.schemas.finance import (
+    InventoryImportResult,
+    InventoryItemCreate,
+    InventoryItemRead,
+)
+from chavfana.db.upserts import bulk_upsert, insert_unique
+from chavfana.core.exceptions import DatabaseError, DatabaseIntegrityError
+
+# Columns an import may overwrite on an existing SKU; farm_id stays put
+IMPORT_UPDATE_COLUMNS = [
+    "name",
+    "quantity",
+    "unit",
+    "unit_cost",
+    "currency",
+    "supplier_id",
+    "reorder_level",
+]
+
+
+class InventoryController:
+    @staticmethod
+    async def create_item(db: AsyncSession, request_data: InventoryItemCreate) -> InventoryItem:
+        try:
+            return await insert_unique(
+                db,
+                InventoryItem,
+                request_data.model_dump(),
+                conflict_on=["sku"],
+                message="SKU already exists",
+            )
+        except IntegrityError as e:
+            raise DatabaseIntegrityError(message=str(e))
+        except SQLAlchemyError as e:
+            raise DatabaseError(message=str(e))
+
+    @staticmethod
+    async def import_items(
+        db: AsyncSession, items: List[InventoryItemCreate], upsert: bool = False
+    ) -> InventoryImportResult:
+        try:
+            result = await bulk_upsert(
+                db,
+                InventoryItem,
+                [item.model_dump() for item in items],
+                conflict_on=["sku"],
+                update_columns=IMPORT_UPDATE_COLUMNS,
+                message="SKUs already exist",
+                upsert=upsert,
+                # SKUs are unique across farms; never update another farm's item
+                owner_columns=["farm_id"],
+                owner_message="SKUs belong to another farm",
+            )
+        except IntegrityError as e:
+            raise DatabaseIntegrityError(message=str(e))
+        except SQLAlchemyError as e:
+            raise DatabaseError(message=str(e))
+        return InventoryImportResult(
+            inserted=[InventoryItemRead.model_validate(item) for item in result.inserted],
+            updated=[InventoryItemRead.model_validate(item) for item in result.updated],
+            unchanged=result.unchanged,
+        )
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 
 from sqlalchemy import select
@@ -89,7 +89,6 @@ class ProjectController:
                 selectinload(project_with_subclasses.owner),
                 selectinload(project_with_subclasses.farm).selectinload(Farm.plots),
             )
-            .where(project_with_subclasses.is_deleted == False)
         )
 
         result = await db.execute(stmt)
@@ -117,7 +116,9 @@ class ProjectController:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def get_projects_by_farm(db: AsyncSession, farm_id: UUID) -> List[ProjectRead]:
+    async def get_projects_by_farm(
+        db: AsyncSession, farm_id: UUID, status: Optional[str] = None
+    ) -> List[ProjectRead]:
         project_with_subclasses = with_polymorphic(
             Project, [PlantingProject, AnimalKeepingProject]
         )
@@ -128,9 +129,10 @@ class ProjectController:
                 selectinload(project_with_subclasses.owner),
                 selectinload(project_with_subclasses.farm).selectinload(Farm.plots),
             )
-            .where(project_with_subclasses.is_deleted == False)
             .where(project_with_subclasses.farm_id == farm_id)
         )
+        if status is not None:
+            stmt = stmt.where(project_with_subclasses.status == status)
 
         result = await db.execute(stmt)
         return result.scalars().unique().all()
@@ -156,8 +158,14 @@ class ProjectController:
 
     @staticmethod
     async def get_planting_events_by_project(
-        db: AsyncSession, project_id: UUID
+        db: AsyncSession,
+        project_id: UUID,
+        species_details_contains: Optional[Dict[str, Any]] = None,
     ) -> List[PlantingEvent]:
         stmt = select(PlantingEvent).where(PlantingEvent.project_id == project_id)
+        if species_details_contains is not None:
+            stmt = stmt.where(
+                PlantingEvent.species_details.contains(species_details_contains)
+            )
         result = await db.execute(stmt)
         return result.scalars().all()
@@ -2,10 +2,36 @@ import os
 import secrets
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import AnyHttpUrl, field_validator
+from pydantic import AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _shared_development_secret(path: str) -> str:
+    """Return a per-machine secret so all local workers sign with the same key."""
+    try:
+        with open(path) as fh:
+            secret = fh.read().strip()
+        if secret:
+            return secret
+    except FileNotFoundError:
+        pass
+
+    tmp_path = f"{path}.{os.getpid()}"
+    with open(tmp_path, "w") as fh:
+        fh.write(secrets.token_urlsafe(32))
+    os.chmod(tmp_path, 0o600)
+    try:
+        # link() is atomic and fails if another worker won the race
+        os.link(tmp_path, path)
+    except FileExistsError:
+        pass
+    finally:
+        os.unlink(tmp_path)
+
+    with open(path) as fh:
+        return fh.read().strip()
+
+
 class Settings(BaseSettings):
     # API Settings
     API_V1_STR: str = "/api/v1"
@@ -17,10 +43,25 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
 
     # Security Settings
-    SECRET_KEY: str = secrets.token_urlsafe(32)
+    SECRET_KEY_FILE: str = "/tmp/chavfana_secret_key"
+    SECRET_KEY: Optional[str] = Field(default=None, validate_default=True)
     AUTH_URL: str = "https://np-auth.nullchemy.com/api/v1/auth/login"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     ALGORITHM: str = "HS256"
+    JWT_KEYRING_FILE: Optional[str] = None
+    JWT_KEYRING_RELOAD_SECONDS: int = 30
+    BCRYPT_ROUNDS: int = 12  # calibrate with `make calibrate-bcrypt`
+
+    @field_validator("SECRET_KEY", mode="before")
+    @classmethod
+    def resolve_secret_key(cls, v: Optional[str], values: Dict[str, Any]) -> str:
+        if v:
+            return v
+        if str(values.data.get("ENVIRONMENT", "")).lower() != "development":
+            raise ValueError(
+                "SECRET_KEY must be set outside development, otherwise every worker signs tokens with its own key"
+            )
+        return _shared_development_secret(values.data.get("SECRET_KEY_FILE"))
 
     # CORS Settings
     CORS_ORIGINS: List[AnyHttpUrl] = []
@@ -48,6 +89,70 @@ class Settings(BaseSettings):
             return v
         return f"postgresql+asyncpg://{values.data.get('POSTGRES_USER')}:{values.data.get('POSTGRES_PASSWORD')}@{values.data.get('POSTGRES_SERVER')}/{values.data.get('POSTGRES_DB') or ''}"
 
+    # Connection pool, per worker process: total server connections are
+    # roughly workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds
+    DB_POOL_RECYCLE: int = 3600  # seconds
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_SLOW_CHECKOUT_MS: float = 100.0
+
+    # Per-request limits; routes override them with chavfana.db.budget.query_budget
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    DB_MAX_STATEMENTS_PER_REQUEST: Optional[int] = 200
+    DB_N_PLUS_ONE_THRESHOLD: int = 5  # same statement shape this often flags an N+1
+    DB_QUERY_STATS_HEADERS: Optional[bool] = None  # defaults to on in development
+
+    # Slow-query log; a sample of slow statements is re-run under
+    # EXPLAIN (ANALYZE, BUFFERS) and the plans kept in a ring of files
+    DB_SLOW_QUERY_MS: Optional[float] = 500.0  # None disables the log
+    DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    DB_SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = 10000
+    DB_SLOW_QUERY_PLAN_DIR: str = "/tmp/chavfana_query_plans"
+    DB_SLOW_QUERY_PLAN_SLOTS: int = 200
+
+    # Startup warm-up: configure mappers, open pool_size connections and run
+    # the hot statements once on each; /ready answers 503 until it is done
+    WARMUP_ENABLED: bool = True
+    WARMUP_RETRY_SECONDS: float = 5.0
+
+    # weather_observations is range-partitioned by month of observed_at;
+    # bin/maintain_partitions.py creates months ahead and expires old ones
+    WEATHER_PARTITION_MONTHS_AHEAD: int = 3
+    WEATHER_PARTITION_RETAIN_MONTHS: Optional[int] = None  # None keeps every month
+    # audit_logs is partitioned the same way by changed_at; expired months are
+    # archived to <dir>/audit_logs_yYYYYmMM.ndjson.gz, then dropped
+    AUDIT_LOG_PARTITION_MONTHS_AHEAD: int = 3
+    AUDIT_LOG_RETAIN_MONTHS: Optional[int] = 12
+    AUDIT_LOG_ARCHIVE_DIR: str = "/var/lib/chavfana/audit_archive"
+
+    # External pooler (PgBouncer in transaction mode). Prepared statements are
+    # not cached, pre-ping is dropped and the local pool is kept small, since
+    # the pooler owns the server connections
+    DB_EXTERNAL_POOLER: bool = False
+    DB_EXTERNAL_POOLER_POOL_SIZE: int = 5
+    DB_EXTERNAL_POOLER_MAX_OVERFLOW: int = 5
+    DB_EXTERNAL_POOLER_RECYCLE: int = 300  # keep below the pooler's client_idle_timeout
+    # Direct (non-pooled) URI for session-level features such as LISTEN
+    SQLALCHEMY_DIRECT_URI: Optional[str] = None
+
+    # Read replica (optional). Reads are routed here once it has replayed
+    # past the client's last write; see chavfana.db.replica
+    SQLALCHEMY_REPLICA_URI: Optional[str] = None
+    READ_YOUR_WRITES_COOKIE: str = "chavfana_min_lsn"
+    READ_YOUR_WRITES_MAX_AGE: int = 300  # seconds
+    # Past this, reads fall back to the primary instead of waiting on the replica
+    REPLICA_CONNECT_TIMEOUT: float = 2.0  # seconds
+    # How long a replayed LSN read from the replica is trusted; bounds how long
+    # clients keep being routed to a standby that was swapped or rebuilt
+    REPLICA_REPLAY_LSN_TTL: float = 5.0  # seconds
+
+    # Cache Settings
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+
     # SSH Settings
     SSH_KEY_PATH: str = "/app/ssh_keys"
     SSH_KNOWN_HOSTS_PATH: str = "/app/ssh_keys/known_hosts"
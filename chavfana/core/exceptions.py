@@ -161,6 +161,24 @@ class ResourceLimitExceededError(BaseAPIException):
     default_message = "Resource limit exceeded"
 
 
+class QueryBudgetExceededError(BaseAPIException):
+    """Request ran more SQL statements than its route allows."""
+
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    error_code = "QUERY_BUDGET_EXCEEDED"
+    error_source = ErrorSource.RESOURCE_LIMIT
+    default_message = "Request exceeded its SQL statement budget"
+
+
+class StatementTimeoutError(BaseAPIException):
+    """A statement was cancelled by the route's statement_timeout."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    error_code = "STATEMENT_TIMEOUT"
+    error_source = ErrorSource.RESOURCE_LIMIT
+    default_message = "A database query took too long and was cancelled"
+
+
 class BusinessLogicError(BaseAPIException):
     """Business logic error exception."""
 
@@ -213,6 +231,27 @@ class DeploymentError(BaseAPIException):
     default_message = "Deployment failed"
 
 
+QUERY_CANCELED_SQLSTATE = "57014"
+
+
+def _query_limit_violation(request: Request) -> Optional[BaseAPIException]:
+    """Limit violation recorded for this request, even if a caller re-wrapped it."""
+    budget = getattr(request.state, "query_budget", None)
+    return getattr(budget, "violation", None)
+
+
+def _is_statement_timeout(exc: BaseException) -> bool:
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        orig = getattr(exc, "orig", None)
+        for candidate in (exc, orig):
+            if getattr(candidate, "sqlstate", None) == QUERY_CANCELED_SQLSTATE:
+                return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """Set up exception handlers for the application."""
 
@@ -221,6 +260,9 @@ def setup_exception_handlers(app: FastAPI) -> None:
         request: Request, exc: BaseAPIException
     ) -> JSONResponse:
         """Handle all custom API exceptions."""
+        if _is_statement_timeout(exc):
+            exc = StatementTimeoutError()
+        exc = _query_limit_violation(request) or exc
 
         if exc.status_code >= 500:
             logger.error(f"{exc.error_code}: {exc.message}")
@@ -261,7 +303,9 @@ def setup_exception_handlers(app: FastAPI) -> None:
         error_traceback = traceback.format_exc()
         logger.error(f"Database error: {str(exc)}\n{error_traceback}")
 
-        if isinstance(exc, IntegrityError):
+        if _is_statement_timeout(exc):
+            db_error = StatementTimeoutError()
+        elif isinstance(exc, IntegrityError):
             error_message = str(exc)
             if "unique constraint" in error_message.lower():
                 message = "A record with this information already exists"
@@ -284,5 +328,5 @@ def setup_exception_handlers(app: FastAPI) -> None:
         error_traceback = traceback.format_exc()
         logger.error(f"Unhandled exception: {str(exc)}\n{error_traceback}")
 
-        generic_error = BaseAPIException()
+        generic_error = _query_limit_violation(request) or BaseAPIException()
         return generic_error.to_response(request)
@@ -0,0 +1,111 @@
+import math
+from typing import Any, List, Optional, Tuple
+
+# Stored geohash length; 9 characters is a cell of about 4.8 m x 4.8 m
+GEOHASH_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 2 * math.pi * EARTH_RADIUS_KM / 360
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def parse_coordinate(value: Any) -> Optional[Tuple[float, float]]:
+    """``(latitude, longitude)`` from a ``geo_coordinate`` document.
+
+    Accepts ``{"lat": .., "lon": ..}`` (also ``latitude``, ``lng`` and
+    ``longitude`` keys) and GeoJSON points (``{"type": "Point",
+    "coordinates": [lon, lat]}``). Returns ``None`` for ``None``; raises
+    ``ValueError`` for anything else or for coordinates out of range.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        raise ValueError("geo_coordinate must be an object")
+    if value.get("type") == "Point" and isinstance(value.get("coordinates"), list):
+        lon, lat = value["coordinates"][:2]
+    else:
+        lat = next((value[key] for key in ("lat", "latitude") if key in value), None)
+        lon = next((value[key] for key in ("lon", "lng", "longitude") if key in value), None)
+        if lat is None or lon is None:
+            raise ValueError(
+                "geo_coordinate needs lat and lon (or a GeoJSON Point)"
+            )
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        raise ValueError("geo_coordinate lat and lon must be numbers")
+    if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        raise ValueError("geo_coordinate is out of range")
+    return lat, lon
+
+
+def encode(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        # Bits alternate longitude, latitude, starting with longitude
+        interval, value = (lon_range, lon) if even else (lat_range, lat)
+        middle = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def cell_degrees(precision: int) -> Tuple[float, float]:
+    """Height and width in degrees of a geohash cell of ``precision`` characters."""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180 / 2**lat_bits, 360 / 2**lon_bits
+
+
+def search_cells(lat: float, lon: float, radius_km: float) -> Optional[List[str]]:
+    """Geohash prefixes whose cells together cover ``radius_km`` around a point.
+
+    Uses the finest precision whose cells are at least ``radius_km`` high and
+    wide, so the point's cell and its eight neighbours contain the whole
+    circle. Width is measured at the circle's edge nearest a pole, where
+    cells are narrowest. Returns ``None`` when no precision is coarse enough
+    (very large radii, or circles reaching a pole); search without a
+    prefilter then.
+    """
+    edge_lat = min(90.0, abs(lat) + radius_km / KM_PER_DEGREE)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_degrees(precision)
+        if (
+            height * KM_PER_DEGREE >= radius_km
+            and width * KM_PER_DEGREE * math.cos(math.radians(edge_lat)) >= radius_km
+        ):
+            break
+    else:
+        return None
+
+    cells = []
+    for lat_step in (-1, 0, 1):
+        cell_lat = lat + lat_step * height
+        if not -90 <= cell_lat <= 90:
+            continue
+        for lon_step in (-1, 0, 1):
+            cell_lon = (lon + lon_step * width + 180) % 360 - 180
+            cell = encode(cell_lat, cell_lon, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with ``prefix``.
+
+    Geohash characters are ASCII, so with C collation ``prefix <= geohash <
+    upper bound`` is a B-tree range that any plan can use, unlike ``LIKE``
+    with a bound parameter.
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
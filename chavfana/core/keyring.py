@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from jose import jwk, jwt
+from jose.exceptions import JWTError
+
+from chavfana.core.config import settings
+from chavfana.core.logging import logger
+
+SYMMETRIC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    signing_material: Optional[str]
+    verification_material: str
+
+    @property
+    def can_sign(self) -> bool:
+        return self.signing_material is not None
+
+
+class KeyRing:
+    """Signing keys shared by every worker through SECRET_KEY or a keyring file.
+
+    The keyring file is JSON of the form::
+
+        {
+            "active_kid": "2026-10-19-ab12",
+            "keys": [
+                {"kid": "2026-10-19-ab12", "alg": "ES256",
+                 "private_key_file": "keys/2026-10-19-ab12.pem",
+                 "public_key_file": "keys/2026-10-19-ab12.pub.pem"},
+                {"kid": "2026-09-01-cd34", "alg": "HS256", "secret": "...",
+                 "retired_at": "2026-10-19T08:00:00+00:00"}
+            ]
+        }
+
+    Only the active key signs; every listed key verifies. Verification keys are
+    parsed once per process and cached by ``kid``; the file is re-read when its
+    mtime changes, so a rotation on a shared volume reaches all nodes.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        fallback_secret: str,
+        fallback_algorithm: str = "HS256",
+        reload_seconds: int = 30,
+    ):
+        self.path = Path(path) if path else None
+        self.reload_seconds = reload_seconds
+        self._fallback = SigningKey(
+            kid=f"sk-{hashlib.sha256(fallback_secret.encode()).hexdigest()[:12]}",
+            algorithm=fallback_algorithm,
+            signing_material=fallback_secret,
+            verification_material=fallback_secret,
+        )
+        self._keys: Dict[str, SigningKey] = {}
+        self._active_kid: str = self._fallback.kid
+        self._verifiers: Dict[str, Any] = {}
+        self._signer: Optional[Any] = None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def active_kid(self) -> str:
+        self._maybe_reload()
+        return self._active_kid
+
+    def sign(self, claims: Dict[str, Any]) -> str:
+        self._maybe_reload()
+        key = self._keys.get(self._active_kid, self._fallback)
+        if self._signer is None:
+            self._signer = jwk.construct(key.signing_material, key.algorithm)
+        return jwt.encode(
+            claims, self._signer, algorithm=key.algorithm, headers={"kid": key.kid}
+        )
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        header = jwt.get_unverified_header(token)
+        kid = header.get("kid")
+
+        # Tokens issued before the keyring existed carry no kid
+        key = self._fallback if kid is None else self._get_key(kid)
+        if key is None:
+            raise JWTError(f"Unknown signing key: {kid}")
+
+        verifier = self._verifiers.get(key.kid)
+        if verifier is None:
+            verifier = jwk.construct(key.verification_material, key.algorithm)
+            self._verifiers[key.kid] = verifier
+        return jwt.decode(token, verifier, algorithms=[key.algorithm])
+
+    def _get_key(self, kid: str) -> Optional[SigningKey]:
+        self._maybe_reload()
+        key = self._keys.get(kid)
+        if key is None and kid == self._fallback.kid:
+            return self._fallback
+        if key is None:
+            # Another node may have rotated since our last check
+            self._maybe_reload(force=True)
+            key = self._keys.get(kid)
+        return key
+
+    def _maybe_reload(self, force: bool = False) -> None:
+        if self.path is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.reload_seconds:
+            return
+        self._checked_at = now
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._mtime:
+            self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            self._keys = {}
+            self._active_kid = self._fallback.kid
+            return
+
+        with self._lock:
+            mtime = self.path.stat().st_mtime
+            data = json.loads(self.path.read_text())
+            base = self.path.parent
+            keys = {}
+            for entry in data.get("keys", []):
+                key = _key_from_entry(entry, base)
+                keys[key.kid] = key
+
+            active_kid = data.get("active_kid")
+            if active_kid not in keys or not keys[active_kid].can_sign:
+                raise ValueError(f"Keyring {self.path} has no usable active key")
+
+            self._verifiers = {
+                kid: verifier
+                for kid, verifier in self._verifiers.items()
+                if kid in keys or kid == self._fallback.kid
+            }
+            if active_kid != self._active_kid:
+                self._signer = None
+            self._keys = keys
+            self._active_kid = active_kid
+            self._mtime = mtime
+            logger.info(f"Loaded {len(keys)} signing keys, active kid {active_kid}")
+
+
+def _read_material(entry: Dict[str, Any], inline: str, file_field: str, base: Path) -> Optional[str]:
+    if entry.get(inline):
+        return entry[inline]
+    if entry.get(file_field):
+        return (base / entry[file_field]).read_text()
+    return None
+
+
+def _key_from_entry(entry: Dict[str, Any], base: Path) -> SigningKey:
+    algorithm = entry["alg"]
+    if algorithm in SYMMETRIC_ALGORITHMS:
+        secret = _read_material(entry, "secret", "secret_file", base)
+        return SigningKey(entry["kid"], algorithm, secret, secret)
+    if algorithm in ASYMMETRIC_ALGORITHMS:
+        private_key = _read_material(entry, "private_key", "private_key_file", base)
+        public_key = _read_material(entry, "public_key", "public_key_file", base)
+        return SigningKey(entry["kid"], algorithm, private_key, public_key)
+    raise ValueError(f"Unsupported signing algorithm: {algorithm}")
+
+
+def generate_key_entry(algorithm: str, key_dir: Path) -> Dict[str, Any]:
+    """Create new key material for ``algorithm`` and return its keyring entry."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+    now = datetime.now(timezone.utc)
+    kid = f"{now.strftime('%Y-%m-%d')}-{secrets.token_hex(2)}"
+    entry: Dict[str, Any] = {"kid": kid, "alg": algorithm, "created_at": now.isoformat()}
+
+    if algorithm in SYMMETRIC_ALGORITHMS:
+        entry["secret"] = secrets.token_urlsafe(64)
+        return entry
+
+    if algorithm.startswith("RS"):
+        private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif algorithm in {"ES256", "ES384", "ES512"}:
+        curve = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+        private = ec.generate_private_key(curve[algorithm]())
+    else:
+        raise ValueError(f"Unsupported signing algorithm: {algorithm}")
+
+    key_dir.mkdir(parents=True, exist_ok=True)
+    private_path = key_dir / f"{kid}.pem"
+    public_path = key_dir / f"{kid}.pub.pem"
+    private_path.write_bytes(
+        private.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    os.chmod(private_path, 0o600)
+    public_path.write_bytes(
+        private.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    entry["private_key_file"] = os.path.relpath(private_path, key_dir.parent)
+    entry["public_key_file"] = os.path.relpath(public_path, key_dir.parent)
+    return entry
+
+
+def rotate_keyring(path: str, algorithm: str, retain_minutes: int) -> str:
+    """Add a new active key, retire the current one and prune expired keys.
+
+    Retired keys keep verifying until every token they signed has expired.
+    """
+    keyring_path = Path(path)
+    data: Dict[str, Any] = {"active_kid": None, "keys": []}
+    if keyring_path.exists():
+        data = json.loads(keyring_path.read_text())
+
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(minutes=retain_minutes)
+    keys = []
+    for entry in data.get("keys", []):
+        if entry["kid"] == data.get("active_kid"):
+            entry["retired_at"] = now.isoformat()
+        retired_at = entry.get("retired_at")
+        if retired_at and datetime.fromisoformat(retired_at) < cutoff:
+            continue
+        keys.append(entry)
+
+    new_entry = generate_key_entry(algorithm, keyring_path.parent / "keys")
+    keys.append(new_entry)
+    data = {"active_kid": new_entry["kid"], "keys": keys}
+
+    tmp_path = keyring_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2))
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, keyring_path)
+    return new_entry["kid"]
+
+
+keyring = KeyRing(
+    path=settings.JWT_KEYRING_FILE,
+    fallback_secret=settings.SECRET_KEY,
+    fallback_algorithm=settings.ALGORITHM,
+    reload_seconds=settings.JWT_KEYRING_RELOAD_SECONDS,
+)
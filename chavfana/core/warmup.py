@@ -0,0 +1,109 @@
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.orm import configure_mappers
+
+from chavfana.controllers.auth import AuthController
+from chavfana.controllers.farms import FarmController
+from chavfana.controllers.projects import ProjectController
+from chavfana.core.config import settings
+from chavfana.core.exceptions import BaseAPIException
+from chavfana.core.logging import logger
+from chavfana.db.database import engine, replica_engine
+
+# Run through the controllers themselves so the compiled-statement cache
+# keys match what requests will look up. Random ids match no rows.
+HOT_QUERIES: List[Callable[[AsyncSession], Awaitable[object]]] = [
+    lambda db: AuthController.get_user_by_id(db, uuid.uuid4()),
+    lambda db: AuthController.get_user_by_email(db, f"{uuid.uuid4()}@warmup.invalid"),
+    lambda db: AuthController.get_all_users(db, limit=1),
+    lambda db: AuthController.get_employee_by_id(db, uuid.uuid4()),
+    lambda db: FarmController.get_farm_by_id(db, uuid.uuid4()),
+    lambda db: FarmController.get_farms_by_owner(db, uuid.uuid4()),
+    lambda db: FarmController.get_plot_by_id(db, uuid.uuid4()),
+    lambda db: FarmController.get_plots_by_farm(db, uuid.uuid4()),
+    lambda db: ProjectController.get_project_by_id(db, uuid.uuid4()),
+    lambda db: ProjectController.get_projects_by_farm(db, uuid.uuid4()),
+]
+
+
+@dataclass
+class WarmupState:
+    ready: bool = False
+    attempts: int = 0
+    duration_ms: Optional[float] = None
+    connections: int = 0
+
+
+warmup_state = WarmupState()
+
+
+async def _warm_connection(connection: AsyncConnection) -> None:
+    for query in HOT_QUERIES:
+        # One transaction per query: a failing query must not abort the rest
+        async with AsyncSession(bind=connection, info={"read_only": True}) as session:
+            try:
+                await query(session)
+            except BaseAPIException:
+                pass
+            finally:
+                await session.rollback()
+
+
+async def _prefill(bind: AsyncEngine) -> int:
+    """Open ``pool_size`` connections at once and warm each of them.
+
+    Holding them all concurrently forces the pool to create new ones instead
+    of handing the same connection back; closing returns them to the pool.
+    """
+    size = bind.pool.size()
+    opened = await asyncio.gather(
+        *(bind.connect() for _ in range(size)), return_exceptions=True
+    )
+    connections = [c for c in opened if isinstance(c, AsyncConnection)]
+    try:
+        for result in opened:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*(_warm_connection(c) for c in connections))
+    finally:
+        await asyncio.gather(*(c.close() for c in connections))
+    return size
+
+
+async def warm_up() -> None:
+    """Configure mappers and prefill the pools, retrying until it succeeds."""
+    if not settings.WARMUP_ENABLED:
+        warmup_state.ready = True
+        return
+
+    while not warmup_state.ready:
+        warmup_state.attempts += 1
+        started = time.perf_counter()
+        try:
+            configure_mappers()
+            connections = 0
+            for bind in (engine, replica_engine):
+                if bind is not None:
+                    connections += await _prefill(bind)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Logged only: the error can name hosts, users and SQL, and /ready is public
+            logger.warning(
+                f"Warm-up attempt {warmup_state.attempts} failed: {str(e)}", exc_info=True
+            )
+            await asyncio.sleep(settings.WARMUP_RETRY_SECONDS)
+            continue
+
+        warmup_state.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        warmup_state.connections = connections
+        warmup_state.ready = True
+        logger.info(
+            f"Warm-up done in {warmup_state.duration_ms} ms "
+            f"({connections} connections, {len(HOT_QUERIES)} statements each)"
+        )
@@ -0,0 +1,89 @@
+import gzip
+import os
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from chavfana.core.exceptions import ValidationError
+
+ARCHIVE_BATCH_SIZE = 1000
+
+
+def archive_path(directory: str, table: str) -> Path:
+    return Path(directory) / f"{table}.ndjson.gz"
+
+
+async def archive_table(connection: AsyncConnection, table: str, directory: str) -> int:
+    """Stream every row of ``table`` into ``<directory>/<table>.ndjson.gz``.
+
+    Rows are read through a server-side cursor and written one JSON object per
+    line, so memory stays flat however large the table is. The file appears
+    under its final name only once it is complete, its row count matches the
+    table's and it has been fsynced along with its directory, so the table
+    can be dropped as soon as this returns; returns that count.
+    """
+    target = archive_path(directory, table)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            with gzip.open(raw, "wt", encoding="utf-8") as f:
+                result = await connection.stream(
+                    text(f"SELECT row_to_json(t)::text FROM {table} AS t"),
+                    execution_options={"yield_per": ARCHIVE_BATCH_SIZE},
+                )
+                async for (line,) in result:
+                    f.write(line)
+                    f.write("\n")
+                    written += 1
+            raw.flush()
+            os.fsync(raw.fileno())
+        expected = await connection.scalar(text(f"SELECT count(*) FROM {table}"))
+        if written != expected:
+            raise RuntimeError(f"Archived {written} rows of {table}, expected {expected}")
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    # Makes the rename itself durable
+    _fsync_directory(target.parent)
+    return written
+
+
+def _fsync_directory(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+async def restore_archive(connection: AsyncConnection, path: Path, table: str) -> int:
+    """Insert the rows of an NDJSON archive into ``table``; returns the count.
+
+    ``json_populate_recordset`` converts each object back to the table's row
+    type server-side, so columns keep their exact types.
+    """
+    if not path.is_file():
+        raise ValidationError(message=f"No archive at {path}")
+
+    restored = 0
+    statement = text(
+        f"INSERT INTO {table} SELECT * FROM json_populate_recordset(NULL::{table}, CAST(:rows AS json))"
+    )
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        batch = []
+        for line in f:
+            batch.append(line)
+            if len(batch) == ARCHIVE_BATCH_SIZE:
+                await connection.execute(statement, {"rows": f"[{','.join(batch)}]"})
+                restored += len(batch)
+                batch = []
+        if batch:
+            await connection.execute(statement, {"rows": f"[{','.join(batch)}]"})
+            restored += len(batch)
+    return restored
+
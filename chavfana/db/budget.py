@@ -0,0 +1,147 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from chavfana.core.config import settings
+from chavfana.core.exceptions import BaseAPIException, QueryBudgetExceededError
+from chavfana.core.logging import logger
+
+SET_TIMEOUT_SQL = "SET LOCAL statement_timeout = "
+# Expanded IN lists render one placeholder per value; fold them into one shape
+_PLACEHOLDER_LIST = re.compile(r"(\$\d+|%\(\w+\)s|\?)(\s*,\s*(\$\d+|%\(\w+\)s|\?))+")
+
+
+def statement_shape(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("?, ...", " ".join(statement.split()))
+
+
+@dataclass
+class QueryBudget:
+    max_statements: Optional[int] = None
+    statement_timeout_ms: Optional[int] = None
+    route: Optional[str] = None
+    statements: int = 0
+    db_time_ms: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    violation: Optional[BaseAPIException] = None
+
+    def repeated_shapes(
+        self, threshold: int = settings.DB_N_PLUS_ONE_THRESHOLD
+    ) -> dict[str, int]:
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+
+_current_budget: ContextVar[Optional[QueryBudget]] = ContextVar(
+    "query_budget", default=None
+)
+
+
+def current_budget() -> Optional[QueryBudget]:
+    return _current_budget.get()
+
+
+def query_budget(
+    max_statements: Optional[int] = settings.DB_MAX_STATEMENTS_PER_REQUEST,
+    statement_timeout_ms: Optional[int] = settings.DB_STATEMENT_TIMEOUT_MS,
+):
+    """Dependency factory limiting the statements and statement time of a request.
+
+    Attach it through the route's ``dependencies=[...]`` so it is resolved
+    before the session dependency; a route-level budget replaces the
+    router-wide default.
+    """
+
+    async def dependency(request: Request):
+        budget = QueryBudget(
+            max_statements=max_statements,
+            statement_timeout_ms=statement_timeout_ms,
+            route=f"{request.method} {request.url.path}",
+        )
+        request.state.query_budget = budget
+        token = _current_budget.set(budget)
+        try:
+            yield budget
+        finally:
+            _current_budget.reset(token)
+
+    return dependency
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    budget = _current_budget.get()
+    if budget is None or statement.startswith(SET_TIMEOUT_SQL):
+        return
+    budget.statements += 1
+    shape = statement_shape(statement)
+    budget.shapes[shape] += 1
+    if budget.shapes[shape] == settings.DB_N_PLUS_ONE_THRESHOLD:
+        logger.warning(
+            f"Possible N+1 in {budget.route}: statement repeated "
+            f"{settings.DB_N_PLUS_ONE_THRESHOLD} times: {shape[:200]}"
+        )
+    if budget.max_statements is not None and budget.statements > budget.max_statements:
+        budget.violation = QueryBudgetExceededError(
+            message=f"Request exceeded its budget of {budget.max_statements} SQL statements",
+            details=[{"max_statements": budget.max_statements}],
+        )
+        raise budget.violation
+    if context is not None:
+        context._budget_started_at = time.perf_counter()
+
+
+def _time_statement(conn, cursor, statement, parameters, context, executemany):
+    budget = _current_budget.get()
+    started = getattr(context, "_budget_started_at", None)
+    if budget is None or started is None:
+        return
+    budget.db_time_ms += (time.perf_counter() - started) * 1000
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    budget = _current_budget.get()
+    if budget is None or not budget.statement_timeout_ms:
+        return
+    if connection.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+        # SET LOCAL is a no-op outside a transaction block
+        return
+    connection.exec_driver_sql(f"{SET_TIMEOUT_SQL}{int(budget.statement_timeout_ms)}")
+
+
+def install_query_budget(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+    event.listen(engine.sync_engine, "after_cursor_execute", _time_statement)
+
+
+class QueryStatsHeadersMiddleware:
+    """Adds the request's statement count, DB time and repeated shapes as headers."""
+
+    def __init__(self, app: ASGIApp, enabled: bool = True):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_stats(message: Message) -> None:
+            budget = scope.get("state", {}).get("query_budget")
+            if message["type"] == "http.response.start" and budget is not None:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Statements"] = str(budget.statements)
+                headers["X-DB-Time-ms"] = f"{budget.db_time_ms:.2f}"
+                headers["X-DB-Repeated-Statements"] = str(len(budget.repeated_shapes()))
+            await send(message)
+
+        await self.app(scope, receive, send_with_stats)
@@ -1,29 +1,221 @@
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import uuid
+from typing import AsyncGenerator, Optional
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from chavfana.core.config import settings
-
-engine = create_async_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    echo=False,
-    future=True,
-    pool_size=20,
-    max_overflow=10,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+from chavfana.core.logging import logger
+from chavfana.db.budget import current_budget, install_query_budget
+from chavfana.db.metrics import InstrumentedQueuePool, pool_stats
+from chavfana.db.replica import (
+    SAFE_METHODS,
+    current_wal_lsn,
+    replay_tracker,
+    requested_min_lsn,
 )
+from chavfana.db.slow_queries import install_slow_query_log
+from chavfana.db.soft_delete import INCLUDE_DELETED  # noqa: F401 (registers the filter)
+
+
+def build_engine(
+    url: str,
+    external_pooler: bool = settings.DB_EXTERNAL_POOLER,
+    connect_timeout: Optional[float] = None,
+) -> AsyncEngine:
+    timeout_args = {"timeout": connect_timeout} if connect_timeout is not None else {}
+    if not external_pooler:
+        return create_async_engine(
+            url,
+            echo=False,
+            future=True,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            connect_args=timeout_args,
+        )
+
+    # In transaction pooling consecutive transactions can land on different
+    # server connections, so named prepared statements must neither be
+    # cached nor reuse names. Dead connections are detected on first use and
+    # invalidated instead of pinging on every checkout; LIFO keeps the few
+    # hot connections busy so idle ones age out at the pooler.
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_EXTERNAL_POOLER_POOL_SIZE,
+        max_overflow=settings.DB_EXTERNAL_POOLER_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=False,
+        pool_use_lifo=True,
+        pool_recycle=settings.DB_EXTERNAL_POOLER_RECYCLE,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            **timeout_args,
+        },
+    )
+
+
+engine = build_engine(settings.SQLALCHEMY_DATABASE_URI)
 
 async_session_factory = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+replica_engine = (
+    build_engine(
+        settings.SQLALCHEMY_REPLICA_URI, connect_timeout=settings.REPLICA_CONNECT_TIMEOUT
+    )
+    if settings.SQLALCHEMY_REPLICA_URI
+    else None
+)
+
+
+for _engine in (engine, replica_engine):
+    if _engine is not None:
+        install_query_budget(_engine)
+        install_slow_query_log(_engine)
+
+
+def _read_session_factory(
+    bind: AsyncEngine, autocommit: bool = True, replica: bool = False
+) -> sessionmaker:
+    # AUTOCOMMIT on the asyncpg driver sends no BEGIN/COMMIT/ROLLBACK at all,
+    # and the isolation level is reset client-side when the connection is
+    # returned, so read sessions share the write pool for free. Routes with a
+    # statement timeout need a real (READ ONLY) transaction for SET LOCAL.
+    options = (
+        {"isolation_level": "AUTOCOMMIT"} if autocommit else {"postgresql_readonly": True}
+    )
+    return sessionmaker(
+        bind.execution_options(**options),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        info={"read_only": True, "replica": replica},
+    )
+
+
+read_session_factory = _read_session_factory(engine)
+read_transaction_session_factory = _read_session_factory(engine, autocommit=False)
+
+replica_read_session_factory = (
+    _read_session_factory(replica_engine, replica=True) if replica_engine is not None else None
+)
+replica_read_transaction_session_factory = (
+    _read_session_factory(replica_engine, autocommit=False, replica=True)
+    if replica_engine is not None
+    else None
+)
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session, flush_context, instances):
+    if session.info.get("read_only"):
+        raise InvalidRequestError(
+            "Attempted to write through a read-only session; use get_db for writes"
+        )
+
+
+def is_replica_session(session: AsyncSession) -> bool:
+    """Whether ``session`` reads from the replica, which may lag the primary."""
+    return session.info.get("replica", False)
+
+
+def get_pool_stats() -> dict:
+    stats = {"primary": pool_stats(engine.pool)}
+    if replica_engine is not None:
+        stats["replica"] = pool_stats(replica_engine.pool)
+    return stats
+
+
+async def _open_read_session(request: Request) -> AsyncSession:
+    budget = current_budget()
+    timed = budget is not None and bool(budget.statement_timeout_ms)
+    primary_factory = read_transaction_session_factory if timed else read_session_factory
+    replica_factory = (
+        replica_read_transaction_session_factory if timed else replica_read_session_factory
+    )
+    if replica_factory is None:
+        return primary_factory()
+
+    session = replica_factory()
+    min_lsn = requested_min_lsn(request)
+    try:
+        # Sessions connect lazily; check out the connection now so an
+        # unreachable replica falls back here instead of failing the request
+        await session.connection()
+        if min_lsn is None or await replay_tracker.caught_up(session, min_lsn):
+            return session
+    except Exception as e:
+        replay_tracker.reset()
+        logger.warning(f"Replica unavailable, reading from primary: {str(e)}")
+
+    # The replica has not replayed this client's last write yet
+    await session.close()
+    return primary_factory()
+
+
+class UnitOfWorkMiddleware:
+    """Holds the response of a write until its transaction has committed.
+
+    ``get_db`` commits when FastAPI exits the dependency, which happens after
+    the response has been handed to ``send``. Buffering it here means a
+    failed commit propagates as an error response instead of the client
+    seeing a success for a write that was rolled back.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        messages: list[Message] = []
+
+        async def hold(message: Message) -> None:
+            messages.append(message)
+
+        await self.app(scope, receive, hold)
+        for message in messages:
+            await send(message)
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """The request's single transaction: committed here, rolled back on error.
+
+    Controllers only ``flush()`` (which also fetches server defaults through
+    RETURNING) and never commit, roll back or refresh themselves. Work that
+    must be undone on its own without failing the request goes in
+    ``async with db.begin_nested():``, a savepoint.
+    """
     async with async_session_factory() as session:
         try:
             yield session
             await session.commit()
+            if replica_engine is not None and request.method not in SAFE_METHODS:
+                request.state.commit_lsn = await current_wal_lsn(session)
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for handlers that only read: replica-routed, autocommit, never commits."""
+    session = await _open_read_session(request)
+    try:
+        yield session
+    finally:
+        await session.close()
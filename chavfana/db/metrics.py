@@ -0,0 +1,96 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from chavfana.core.config import settings
+from chavfana.core.logging import logger
+
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            self.max = max(self.max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            cumulative: List[int] = []
+            running = 0
+            for count in self._counts:
+                running += count
+                cumulative.append(running)
+            return {
+                "buckets": {
+                    **{f"le_{bound}": cumulative[i] for i, bound in enumerate(self.buckets)},
+                    "le_inf": cumulative[-1],
+                },
+                "count": self.count,
+                "sum": round(self.sum, 3),
+                "max": round(self.max, 3),
+            }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waits.
+
+    The wait covers queueing for a free connection, opening an overflow
+    connection and the pre-ping, i.e. everything a request spends before it
+    can send its first statement.
+    """
+
+    def __init__(self, *args, slow_checkout_ms: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait_ms = Histogram(CHECKOUT_BUCKETS_MS)
+        self.slow_checkout_ms = (
+            slow_checkout_ms
+            if slow_checkout_ms is not None
+            else settings.DB_POOL_SLOW_CHECKOUT_MS
+        )
+
+    def connect(self):
+        started = time.perf_counter()
+        connection = super().connect()
+        waited_ms = (time.perf_counter() - started) * 1000
+        self.checkout_wait_ms.observe(waited_ms)
+        if waited_ms > self.slow_checkout_ms:
+            logger.warning(
+                f"Slow connection checkout: waited {waited_ms:.1f} ms "
+                f"({self.checkedout()} checked out, overflow {self.overflow()}, "
+                f"pool_size {self.size()})"
+            )
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkout_wait_ms = self.checkout_wait_ms
+        pool.slow_checkout_ms = self.slow_checkout_ms
+        return pool
+
+
+def pool_stats(pool) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "idle": pool.checkedin(),
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        stats["checkout_wait_ms"] = pool.checkout_wait_ms.snapshot()
+    return stats
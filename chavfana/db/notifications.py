@@ -0,0 +1,102 @@
+import asyncio
+from typing import Callable, Dict, Iterable, Optional
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chavfana.core.config import settings
+from chavfana.core.logging import logger
+
+USER_CACHE_CHANNEL = "chavfana_user_cache"
+
+
+async def publish_invalidation(
+    db: AsyncSession, channel: str, keys: Iterable[str]
+) -> None:
+    """Queue a NOTIFY that Postgres delivers to every listener when ``db`` commits."""
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": channel, "payload": ",".join(keys)},
+    )
+
+
+class InvalidationListener:
+    """Dedicated LISTEN connection that fans NOTIFY payloads out to callbacks.
+
+    ``on_reset`` runs whenever the connection is (re)established, because any
+    notifications sent while we were disconnected are lost.
+    """
+
+    def __init__(self, dsn: str, retry_seconds: float = 5.0):
+        self.dsn = dsn
+        self.retry_seconds = retry_seconds
+        self._handlers: Dict[str, Callable[[list[str]], None]] = {}
+        self._resets: Dict[str, Callable[[], None]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._closed: Optional[asyncio.Event] = None
+
+    def register(
+        self,
+        channel: str,
+        on_keys: Callable[[list[str]], None],
+        on_reset: Callable[[], None],
+    ) -> None:
+        self._handlers[channel] = on_keys
+        self._resets[channel] = on_reset
+
+    async def start(self) -> None:
+        if self._handlers and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _dispatch(self, connection, pid, channel: str, payload: str) -> None:
+        handler = self._handlers.get(channel)
+        if handler is not None:
+            handler([key for key in payload.split(",") if key])
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                for channel in self._handlers:
+                    await connection.add_listener(channel, self._dispatch)
+                for reset in self._resets.values():
+                    reset()
+                logger.info(f"Listening for cache invalidations on {list(self._handlers)}")
+                await closed.wait()
+                logger.warning("Cache invalidation listener disconnected")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {str(e)}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            for reset in self._resets.values():
+                reset()
+            await asyncio.sleep(self.retry_seconds)
+
+
+if settings.DB_EXTERNAL_POOLER and not settings.SQLALCHEMY_DIRECT_URI:
+    logger.warning(
+        "DB_EXTERNAL_POOLER is on without SQLALCHEMY_DIRECT_URI; LISTEN does not "
+        "work through a transaction pooler, so cache invalidations may be missed"
+    )
+
+invalidation_listener = InvalidationListener(
+    (settings.SQLALCHEMY_DIRECT_URI or settings.SQLALCHEMY_DATABASE_URI).replace(
+        "postgresql+asyncpg://", "postgresql://"
+    )
+)
@@ -0,0 +1,67 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, Type
+
+from sqlalchemy import Select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chavfana.core.exceptions import ValidationError
+from chavfana.db.soft_delete import INCLUDE_DELETED, not_deleted
+from chavfana.models.base import BaseModel
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError(message="Invalid pagination cursor")
+
+
+async def keyset_page(
+    db: AsyncSession,
+    stmt: Select,
+    model: Type[BaseModel],
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """Fetch one page ordered by ``(created_at, id)`` starting after ``cursor``.
+
+    Seeks straight to the cursor through a ``(..., created_at, id)`` index, so
+    page N costs the same as page 1. Returns the rows and the next cursor, or
+    ``None`` on the last page.
+    """
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) > tuple_(created_at, id))
+
+    stmt = stmt.order_by(model.created_at, model.id).limit(limit + 1)
+    rows = (await db.execute(stmt)).scalars().all()
+
+    if len(rows) <= limit:
+        return list(rows), None
+    rows = rows[:limit]
+    return list(rows), encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+async def estimate_count(db: AsyncSession, stmt: Select) -> int:
+    """Planner row estimate for ``stmt``; cheap, but only as fresh as ANALYZE."""
+    if not stmt.get_execution_options().get(INCLUDE_DELETED, False):
+        # Compiled outside the session, so the soft-delete filter is added here
+        stmt = stmt.options(not_deleted())
+    compiled = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
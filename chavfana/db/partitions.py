@@ -0,0 +1,205 @@
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from chavfana.core.config import settings
+from chavfana.core.logging import logger
+from chavfana.db.archive import archive_path, archive_table, restore_archive
+
+PARTITIONS_SQL = text(
+    """
+    SELECT c.relname
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    JOIN pg_class p ON p.oid = i.inhparent
+    WHERE p.relname = :table
+    ORDER BY c.relname
+    """
+)
+# Month tables left detached by an archive run that did not finish
+DETACHED_SQL = text(
+    """
+    SELECT relname
+    FROM pg_class
+    WHERE relname LIKE :pattern AND relkind = 'r' AND NOT relispartition
+    ORDER BY relname
+    """
+)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass(frozen=True)
+class MonthlyPartitions:
+    """Range partitions of ``table``, one per calendar month of its partition key.
+
+    Partitions are named ``<table>_yYYYYmMM``; a ``<table>_default``
+    partition catches rows outside every month that exists, so an insert never
+    fails because maintenance has not run. Expiring a month detaches (and
+    optionally drops) its partition, a catalog change that costs the same
+    however many rows it holds. With ``archive_dir`` set, expired months are
+    written to compressed NDJSON there before they are dropped.
+    """
+
+    table: str
+    months_ahead: int
+    retain_months: Optional[int] = None
+    archive_dir: Optional[str] = None
+
+    @property
+    def default_name(self) -> str:
+        return f"{self.table}_default"
+
+    def name_for(self, month: date) -> str:
+        return f"{self.table}_y{month.year:04d}m{month.month:02d}"
+
+    def restored_name_for(self, month: date) -> str:
+        return f"{self.table}_restored_y{month.year:04d}m{month.month:02d}"
+
+    def month_of(self, name: str) -> Optional[date]:
+        match = re.fullmatch(rf"{re.escape(self.table)}_y(\d{{4}})m(\d{{2}})", name)
+        return date(int(match[1]), int(match[2]), 1) if match else None
+
+    def is_partition(self, name: str) -> bool:
+        return (
+            name == self.default_name
+            or self.month_of(name) is not None
+            or name.startswith(f"{self.table}_restored_")
+        )
+
+    def create_sql(self, month: date) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.name_for(month)} PARTITION OF {self.table} "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+            f"TO ('{add_months(month, 1).isoformat()} 00:00+00')"
+        )
+
+    def create_default_sql(self) -> str:
+        return f"CREATE TABLE IF NOT EXISTS {self.default_name} PARTITION OF {self.table} DEFAULT"
+
+    async def months(self, connection: AsyncConnection) -> List[Tuple[str, date]]:
+        names = (await connection.execute(PARTITIONS_SQL, {"table": self.table})).scalars()
+        return [(name, self.month_of(name)) for name in names if self.month_of(name)]
+
+    async def create_ahead(self, connection: AsyncConnection, today: date) -> List[str]:
+        """Create this month's partition and ``months_ahead`` more; returns new names."""
+        existing = {name for name, _ in await self.months(connection)}
+        created = []
+        current = month_start(today)
+        for offset in range(self.months_ahead + 1):
+            month = add_months(current, offset)
+            if self.name_for(month) not in existing:
+                await connection.execute(text(self.create_sql(month)))
+                created.append(self.name_for(month))
+        return created
+
+    async def _archive_and_drop(self, connection: AsyncConnection, name: str) -> None:
+        # archive_table returns only once the archive is durably on disk
+        rows = await archive_table(connection, name, self.archive_dir)
+        await connection.execute(text(f"DROP TABLE {name}"))
+        await connection.commit()
+        logger.info(f"Archived {rows} rows of {name} to {self.archive_dir}")
+
+    async def expire(
+        self, connection: AsyncConnection, today: date, drop: bool = False
+    ) -> List[str]:
+        """Detach months older than ``retain_months``; returns their names.
+
+        Each month is detached and committed on its own before anything slow
+        happens, so the parent table is only locked briefly. The detached
+        table is then archived and dropped (``archive_dir``), dropped
+        (``drop``) or kept as a standalone table.
+        """
+        if self.retain_months is None:
+            return []
+        cutoff = add_months(month_start(today), -self.retain_months)
+        expired = []
+        for name, month in await self.months(connection):
+            if month >= cutoff:
+                continue
+            await connection.execute(text(f"ALTER TABLE {self.table} DETACH PARTITION {name}"))
+            await connection.commit()
+            if self.archive_dir:
+                await self._archive_and_drop(connection, name)
+            elif drop:
+                await connection.execute(text(f"DROP TABLE {name}"))
+                await connection.commit()
+            expired.append(name)
+
+        if self.archive_dir:
+            leftovers = await connection.execute(
+                DETACHED_SQL, {"pattern": f"{self.table}\\_y%"}
+            )
+            for name in leftovers.scalars().all():
+                month = self.month_of(name)
+                if month is not None and month < cutoff:
+                    await self._archive_and_drop(connection, name)
+                    expired.append(name)
+        return expired
+
+    async def default_rows(self, connection: AsyncConnection) -> int:
+        return await connection.scalar(
+            text(f"SELECT count(*) FROM (SELECT 1 FROM {self.default_name} LIMIT 1000) AS s")
+        )
+
+    async def maintain(
+        self, connection: AsyncConnection, today: date, drop: bool = False
+    ) -> Tuple[List[str], List[str]]:
+        """Create upcoming months and expire old ones, committing as it goes."""
+        await connection.execute(text(self.create_default_sql()))
+        created = await self.create_ahead(connection, today)
+        await connection.commit()
+        expired = await self.expire(connection, today, drop=drop)
+        if await self.default_rows(connection):
+            # Rows here fall outside every month partition; creating a month
+            # that overlaps them would fail until they are moved
+            logger.warning(f"{self.default_name} holds rows outside the monthly partitions")
+        await connection.commit()
+        return created, expired
+
+    async def restore(self, connection: AsyncConnection, month: date) -> Tuple[str, int]:
+        """Load an archived month into a standalone ``<table>_restored_yYYYYmMM``.
+
+        The table is not attached, so the application and the next
+        maintenance run leave it alone; drop it when the investigation is
+        done. Returns its name and the number of rows loaded.
+        """
+        name = self.restored_name_for(month)
+        await connection.execute(
+            text(f"CREATE TABLE {name} (LIKE {self.table} INCLUDING DEFAULTS INCLUDING INDEXES)")
+        )
+        source = archive_path(self.archive_dir, self.name_for(month))
+        restored = await restore_archive(connection, source, name)
+        await connection.commit()
+        return name, restored
+
+
+weather_partitions = MonthlyPartitions(
+    table="weather_observations",
+    months_ahead=settings.WEATHER_PARTITION_MONTHS_AHEAD,
+    retain_months=settings.WEATHER_PARTITION_RETAIN_MONTHS,
+)
+
+audit_log_partitions = MonthlyPartitions(
+    table="audit_logs",
+    months_ahead=settings.AUDIT_LOG_PARTITION_MONTHS_AHEAD,
+    retain_months=settings.AUDIT_LOG_RETAIN_MONTHS,
+    archive_dir=settings.AUDIT_LOG_ARCHIVE_DIR,
+)
+
+PARTITIONED_TABLES = [weather_partitions, audit_log_partitions]
+
+
+def is_partition_table(name: str) -> bool:
+    return any(partitions.is_partition(name) for partitions in PARTITIONED_TABLES)
@@ -0,0 +1,25 @@
+from typing import List, Type
+
+from pydantic import BaseModel as Schema
+from sqlalchemy.orm import InstrumentedAttribute, load_only
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from chavfana.models.base import BaseModel
+
+
+def read_columns(model: Type[BaseModel], schema: Type[Schema]) -> List[InstrumentedAttribute]:
+    """Columns of ``model`` that ``schema`` serializes."""
+    columns = model.__table__.columns
+    return [getattr(model, name) for name in schema.model_fields if name in columns]
+
+
+def load_read_columns(model: Type[BaseModel], schema: Type[Schema]) -> LoaderOption:
+    """Load only the columns ``schema`` needs.
+
+    When a covering index holds the lookup key and every one of these columns
+    (``postgresql_include``), Postgres answers the query with an index-only
+    scan and skips every table page VACUUM has marked all-visible. Attributes
+    left out are not loaded at all, so only serialize the result with
+    ``schema``.
+    """
+    return load_only(*read_columns(model, schema))
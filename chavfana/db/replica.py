@@ -0,0 +1,107 @@
+import time
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from chavfana.core.config import settings
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+MIN_LSN_HEADER = "X-Min-LSN"
+COMMIT_LSN_HEADER = "X-Commit-LSN"
+
+
+def parse_lsn(lsn: str) -> int:
+    """Convert a Postgres ``pg_lsn`` such as ``16/B374D848`` to an integer."""
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+class ReplayTracker:
+    """Highest WAL position this process has seen the replica replay.
+
+    Replay only moves forward on one standby, so once the replica is known
+    to be past a client's write we can route that client to it without
+    asking again. The value is only trusted for ``ttl`` seconds and is reset
+    on connection errors, since after a failover or rebuild the standby
+    behind the URI may be further back.
+    """
+
+    def __init__(self, ttl: float = settings.REPLICA_REPLAY_LSN_TTL):
+        self.ttl = ttl
+        self.replayed_lsn = 0
+        self.checked_at = 0.0
+
+    def reset(self) -> None:
+        self.replayed_lsn = 0
+        self.checked_at = 0.0
+
+    async def caught_up(self, session: AsyncSession, min_lsn: int) -> bool:
+        fresh = time.monotonic() - self.checked_at < self.ttl
+        if fresh and self.replayed_lsn >= min_lsn:
+            return True
+        replayed = await session.scalar(text("SELECT pg_last_wal_replay_lsn()::text"))
+        if replayed is None:
+            # Not a standby (or not replaying); never trust it for this client
+            self.reset()
+            return False
+        # Replace rather than keep the maximum: a new standby may be behind
+        self.replayed_lsn = parse_lsn(replayed)
+        self.checked_at = time.monotonic()
+        return self.replayed_lsn >= min_lsn
+
+
+replay_tracker = ReplayTracker()
+
+
+def requested_min_lsn(request: Request) -> Optional[int]:
+    raw = request.headers.get(MIN_LSN_HEADER) or request.cookies.get(
+        settings.READ_YOUR_WRITES_COOKIE
+    )
+    if not raw:
+        return None
+    try:
+        return parse_lsn(raw)
+    except ValueError:
+        return None
+
+
+async def current_wal_lsn(session: AsyncSession) -> str:
+    return await session.scalar(text("SELECT pg_current_wal_lsn()::text"))
+
+
+class ReadYourWritesMiddleware:
+    """Hands the commit LSN of each write back to the client.
+
+    Must wrap ``UnitOfWorkMiddleware`` so the response start only passes
+    through here once ``get_db`` has committed and recorded
+    ``request.state.commit_lsn``. The client echoes it back as a cookie (or
+    ``X-Min-LSN``) and stays on the primary until the replica has replayed
+    past it.
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool = True):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_lsn(message: Message) -> None:
+            lsn = scope.get("state", {}).get("commit_lsn")
+            if lsn and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[COMMIT_LSN_HEADER] = lsn
+                headers.append(
+                    "set-cookie",
+                    f"{settings.READ_YOUR_WRITES_COOKIE}={lsn}; "
+                    f"Max-Age={settings.READ_YOUR_WRITES_MAX_AGE}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_lsn)
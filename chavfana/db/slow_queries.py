@@ -0,0 +1,231 @@
+import asyncio
+import fcntl
+import json
+import os
+import random
+import re
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from chavfana.core.config import settings
+from chavfana.core.logging import logger
+from chavfana.db.budget import current_budget, statement_shape
+
+# Only plain reads are re-executed; anything else gets an estimated plan
+_ANALYZABLE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_NOT_EXPLAINABLE = re.compile(r"^\s*(EXPLAIN|SET|SHOW|BEGIN|COMMIT|ROLLBACK)\b", re.IGNORECASE)
+# Constants Postgres prints in plan conditions: quoted literals and bare numbers
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMERIC_LITERAL = re.compile(r"(?<![\w$.])[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w.])")
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bound values with their type so logs carry no user data."""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    return f"<{type(parameters).__name__}>"
+
+
+def scrub_plan(plan: Any) -> Any:
+    """Replace the constants in a JSON plan with ``?``.
+
+    The plan is made with the real parameters, and Postgres prints them as
+    literals in ``Index Cond``, ``Filter`` and the like. Node types, relation,
+    index and column names and the numeric measurements are kept.
+    """
+    if isinstance(plan, dict):
+        return {key: scrub_plan(value) for key, value in plan.items()}
+    if isinstance(plan, list):
+        return [scrub_plan(value) for value in plan]
+    if isinstance(plan, str):
+        return _NUMERIC_LITERAL.sub("?", _STRING_LITERAL.sub("'?'", plan))
+    return plan
+
+
+class PlanRingBuffer:
+    """Fixed number of plan files on disk; the oldest slot is overwritten.
+
+    Files are written atomically, so a reader never sees half a plan. Sequence
+    numbers come from a counter file under an exclusive lock, so workers
+    sharing the directory never hand out the same number.
+    """
+
+    def __init__(self, directory: str, slots: int):
+        self.directory = Path(directory)
+        self.slots = slots
+
+    def _slot_path(self, slot: int) -> Path:
+        return self.directory / f"plan-{slot:05d}.json"
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _entries(self) -> List[Dict[str, Any]]:
+        if not self.directory.is_dir():
+            return []
+        entries = [self._read(path) for path in self.directory.glob("plan-*.json")]
+        return sorted(
+            (entry for entry in entries if entry is not None),
+            key=lambda entry: entry["seq"],
+            reverse=True,
+        )
+
+    def _next_seq(self) -> int:
+        fd = os.open(self.directory / "seq", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            current = os.read(fd, 32).strip()
+            if current:
+                seq = int(current) + 1
+            else:
+                # First use of the directory, or the counter predates it
+                entries = self._entries()
+                seq = (entries[0]["seq"] if entries else 0) + 1
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, str(seq).encode())
+            return seq
+        finally:
+            os.close(fd)
+
+    def append(self, entry: Dict[str, Any]) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        seq = self._next_seq()
+        entry = {**entry, "seq": seq}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f, default=str)
+        os.replace(tmp, self._slot_path(seq % self.slots))
+        return seq
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [
+            {key: value for key, value in entry.items() if key != "plan"}
+            for entry in self._entries()
+        ]
+
+    def get(self, seq: int) -> Optional[Dict[str, Any]]:
+        entry = self._read(self._slot_path(seq % self.slots))
+        return entry if entry is not None and entry["seq"] == seq else None
+
+
+plan_buffer = PlanRingBuffer(
+    settings.DB_SLOW_QUERY_PLAN_DIR, settings.DB_SLOW_QUERY_PLAN_SLOTS
+)
+
+
+class SlowQueryLog:
+    """Logs statements slower than the threshold and samples their plans.
+
+    The plan is captured on a separate, short-lived connection inside a READ
+    ONLY transaction that is always rolled back, so re-running the statement
+    can never write. At most one capture runs at a time per process; samples
+    arriving meanwhile are dropped rather than queued.
+    """
+
+    def __init__(self, dsn: str, threshold_ms: float, sample_rate: float):
+        self.dsn = dsn
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self._capture_task: Optional[asyncio.Task] = None
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_started_at = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started_at", None)
+        if started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        budget = current_budget()
+        route = budget.route if budget is not None else None
+        redacted = redact_parameters(parameters)
+        logger.warning(
+            f"Slow query ({elapsed_ms:.1f} ms) in {route}: "
+            f"{statement_shape(statement)[:500]} params={redacted}"
+        )
+        if (
+            executemany
+            or (self._capture_task is not None and not self._capture_task.done())
+            or _NOT_EXPLAINABLE.match(statement)
+            or random.random() >= self.sample_rate
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._capture_task = loop.create_task(
+            self._capture(statement, parameters, redacted, elapsed_ms, route)
+        )
+
+    async def _capture(
+        self,
+        statement: str,
+        parameters: Any,
+        redacted: Any,
+        elapsed_ms: float,
+        route: Optional[str],
+    ) -> None:
+        analyze = bool(_ANALYZABLE.match(statement))
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+        args = parameters if isinstance(parameters, (list, tuple)) else ()
+        connection = None
+        try:
+            connection = await asyncpg.connect(self.dsn, statement_cache_size=0)
+            transaction = connection.transaction(readonly=True)
+            await transaction.start()
+            try:
+                await connection.execute(
+                    f"SET LOCAL statement_timeout = {int(settings.DB_SLOW_QUERY_EXPLAIN_TIMEOUT_MS)}"
+                )
+                plan = await connection.fetchval(f"EXPLAIN ({options}) {statement}", *args)
+            finally:
+                await transaction.rollback()
+            seq = await asyncio.to_thread(
+                plan_buffer.append,
+                {
+                    "captured_at": datetime.now(timezone.utc).isoformat(),
+                    "route": route,
+                    "duration_ms": round(elapsed_ms, 3),
+                    "analyzed": analyze,
+                    "statement": statement,
+                    "parameters": redacted,
+                    "plan": scrub_plan(json.loads(plan) if isinstance(plan, str) else plan),
+                },
+            )
+            logger.info(f"Captured plan {seq} for slow query in {route}")
+        except Exception as e:
+            logger.warning(f"Could not capture plan for slow query: {str(e)}")
+        finally:
+            if connection is not None:
+                await connection.close()
+
+
+def install_slow_query_log(engine: AsyncEngine) -> None:
+    if settings.DB_SLOW_QUERY_MS is None:
+        return
+    dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    slow_log = SlowQueryLog(
+        dsn, settings.DB_SLOW_QUERY_MS, settings.DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+    )
+    event.listen(engine.sync_engine, "before_cursor_execute", slow_log._before)
+    event.listen(engine.sync_engine, "after_cursor_execute", slow_log._after)
@@ -0,0 +1,39 @@
+from sqlalchemy import event, false
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+from sqlalchemy.sql import Executable
+
+from chavfana.models.base import BaseMixin
+
+# Execution option that turns the filter off for one statement
+INCLUDE_DELETED = "include_deleted"
+
+
+def not_deleted():
+    """Loader option adding ``is_deleted = false`` for every model in a statement.
+
+    Rendered as ``= false`` rather than ``IS false`` so the planner can match
+    it against the partial indexes declared with ``NOT_DELETED``. The option
+    propagates to lazy and selectin loads of the objects it returns.
+    """
+    return with_loader_criteria(
+        BaseMixin,
+        lambda cls: cls.is_deleted == false(),
+        include_aliases=True,
+    )
+
+
+def include_deleted(stmt: Executable) -> Executable:
+    """Opt ``stmt`` out of the soft-delete filter, e.g. for restores and audits."""
+    return stmt.execution_options(**{INCLUDE_DELETED: True})
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_soft_deleted(execute_state: ORMExecuteState) -> None:
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        return
+    execute_state.statement = execute_state.statement.options(not_deleted())
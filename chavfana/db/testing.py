@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from typing import Iterator, Mapping
+
+from chavfana.db.budget import QueryBudget, _current_budget
+
+STATEMENTS_HEADER = "X-DB-Statements"
+REPEATED_HEADER = "X-DB-Repeated-Statements"
+
+
+def _describe(budget: QueryBudget, limit: int = 10) -> str:
+    return "\n".join(
+        f"  {count}x {shape[:200]}" for shape, count in budget.shapes.most_common(limit)
+    )
+
+
+@contextmanager
+def count_statements() -> Iterator[QueryBudget]:
+    """Count the statements run inside the block, without enforcing a limit."""
+    budget = QueryBudget(route="count_statements")
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+@contextmanager
+def assert_max_statements(max_statements: int, allow_repeats: bool = False) -> Iterator[QueryBudget]:
+    """Fail if the block runs more than ``max_statements`` statements.
+
+    Unless ``allow_repeats`` is set, a statement shape repeated often enough
+    to look like an N+1 also fails, even within the budget.
+    """
+    with count_statements() as budget:
+        yield budget
+    if budget.statements > max_statements:
+        raise AssertionError(
+            f"Ran {budget.statements} statements, budget is {max_statements}:\n"
+            f"{_describe(budget)}"
+        )
+    if not allow_repeats and budget.repeated_shapes():
+        raise AssertionError(f"Repeated statement shapes (N+1?):\n{_describe(budget)}")
+
+
+def assert_response_within_budget(
+    response, max_statements: int, allow_repeats: bool = False
+) -> None:
+    """Check the query stats headers of a response from the app's test client.
+
+    Needs ``DB_QUERY_STATS_HEADERS`` on (the default in development).
+    """
+    headers: Mapping[str, str] = response.headers
+    if STATEMENTS_HEADER not in headers:
+        raise AssertionError(
+            f"Response has no {STATEMENTS_HEADER} header; enable DB_QUERY_STATS_HEADERS"
+        )
+    statements = int(headers[STATEMENTS_HEADER])
+    if statements > max_statements:
+        raise AssertionError(
+            f"{response.request.method} {response.request.url} ran {statements} "
+            f"statements, budget is {max_statements}"
+        )
+    if not allow_repeats and int(headers.get(REPEATED_HEADER, "0")):
+        raise AssertionError(
+            f"{response.request.method} {response.request.url} repeated "
+            f"{headers[REPEATED_HEADER]} statement shape(s); see the N+1 warning in the log"
+        )
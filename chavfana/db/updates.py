@@ -0,0 +1,43 @@
+import uuid
+from typing import Any, Dict, Type
+
+from sqlalchemy import Row, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chavfana.core.exceptions import NotFoundError, ValidationError
+from chavfana.models.base import BaseModel
+
+
+async def update_returning(
+    db: AsyncSession,
+    model: Type[BaseModel],
+    id: uuid.UUID,
+    changes: Dict[str, Any],
+    *returning: Any,
+) -> Row:
+    """Apply ``changes`` to a live row in one ``UPDATE ... RETURNING`` statement.
+
+    Bumps ``version`` in the same statement and raises ``NotFoundError`` when
+    no undeleted row has ``id``. Extra ``returning`` expressions are
+    evaluated against the pre-update snapshot, so a scalar subquery on the
+    same table yields the old value. Returns ``(instance, *returning)``.
+    """
+    for key, value in changes.items():
+        if value is None and not model.__mapper__.columns[key].nullable:
+            raise ValidationError(message=f"{key} cannot be null")
+
+    live = (model.id == id, model.is_deleted.is_(False))
+    if changes:
+        stmt = (
+            update(model)
+            .where(*live)
+            .values(**changes, version=model.version + 1)
+            .returning(model, *returning)
+        )
+    else:
+        stmt = select(model, *returning).where(*live)
+
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        raise NotFoundError(resource_type=model.__name__, resource_id=str(id))
+    return row
@@ -0,0 +1,158 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Type
+
+from sqlalchemy import and_, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chavfana.core.exceptions import BusinessLogicError, ValidationError
+from chavfana.db.soft_delete import include_deleted
+from chavfana.models.base import BaseModel
+
+# Keeps each multi-row INSERT well under Postgres' 32767 bind parameters
+UPSERT_BATCH_SIZE = 500
+
+
+async def insert_unique(
+    db: AsyncSession,
+    model: Type[BaseModel],
+    values: Dict[str, Any],
+    conflict_on: Sequence[str],
+    message: str,
+):
+    """Insert one row, or raise ``BusinessLogicError`` if ``conflict_on`` is taken.
+
+    ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` checks and inserts in a
+    single round trip, and unlike a SELECT first it cannot race with a
+    concurrent insert of the same key.
+    """
+    stmt = (
+        insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=list(conflict_on))
+        .returning(model)
+    )
+    instance = (await db.execute(stmt)).scalar_one_or_none()
+    if instance is None:
+        raise BusinessLogicError(
+            message=message, details=[{key: str(values[key]) for key in conflict_on}]
+        )
+    return instance
+
+
+@dataclass
+class UpsertResult:
+    inserted: List[Any] = field(default_factory=list)
+    updated: List[Any] = field(default_factory=list)
+    unchanged: int = 0
+
+
+async def bulk_upsert(
+    db: AsyncSession,
+    model: Type[BaseModel],
+    rows: List[Dict[str, Any]],
+    conflict_on: Sequence[str],
+    update_columns: Sequence[str],
+    message: str,
+    upsert: bool = False,
+    owner_columns: Sequence[str] = (),
+    owner_message: str = "Keys belong to another owner",
+) -> UpsertResult:
+    """Insert many rows keyed by ``conflict_on`` in batches of multi-row INSERTs.
+
+    Without ``upsert`` any existing key fails the whole import with
+    ``BusinessLogicError``. With it, existing rows get ``update_columns``
+    from the import; rows whose values already match are left alone, so
+    re-running the same import changes nothing (not even ``version``).
+
+    An existing row is only updated when its ``owner_columns`` equal the
+    imported ones; keys held by another owner fail the import with
+    ``BusinessLogicError`` (``owner_message``) instead of being overwritten.
+    """
+    keys = [tuple(row[key] for key in conflict_on) for row in rows]
+    if len(set(keys)) != len(keys):
+        raise ValidationError(message=f"Duplicate {', '.join(conflict_on)} in import")
+
+    result = UpsertResult()
+    foreign: List[Dict[str, str]] = []
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start : start + UPSERT_BATCH_SIZE]
+        stmt = insert(model).values(batch)
+        if upsert:
+            excluded = stmt.excluded
+            current = tuple_(*(getattr(model, column) for column in update_columns))
+            incoming = tuple_(*(excluded[column] for column in update_columns))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_on),
+                set_={
+                    **{column: excluded[column] for column in update_columns},
+                    # Importing a soft-deleted key brings it back
+                    "is_deleted": False,
+                    "deleted_at": None,
+                    "deleted_by_id": None,
+                    "version": model.version + 1,
+                    "updated_at": func.now(),
+                },
+                where=and_(
+                    *(getattr(model, column) == excluded[column] for column in owner_columns),
+                    or_(current.is_distinct_from(incoming), model.is_deleted.is_(True)),
+                ),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_on))
+
+        returned = (await db.execute(stmt.returning(model))).scalars().all()
+        # New rows start at version 1; the upsert bumps every row it touches
+        for instance in returned:
+            (result.inserted if instance.version == 1 else result.updated).append(instance)
+        result.unchanged += len(batch) - len(returned)
+        if upsert and owner_columns and len(returned) < len(batch):
+            foreign += await _foreign_keys(db, model, batch, returned, conflict_on, owner_columns)
+
+    if foreign:
+        raise BusinessLogicError(message=owner_message, details=foreign)
+
+    if not upsert and result.unchanged:
+        returned_keys = {
+            tuple(getattr(instance, key) for key in conflict_on) for instance in result.inserted
+        }
+        conflicts = [
+            {key: str(value) for key, value in zip(conflict_on, row_key)}
+            for row_key in keys
+            if row_key not in returned_keys
+        ]
+        raise BusinessLogicError(message=message, details=conflicts)
+    return result
+
+
+async def _foreign_keys(
+    db: AsyncSession,
+    model: Type[BaseModel],
+    batch: List[Dict[str, Any]],
+    returned: Sequence[Any],
+    conflict_on: Sequence[str],
+    owner_columns: Sequence[str],
+) -> List[Dict[str, str]]:
+    """Keys in ``batch`` the upsert skipped because another owner holds them."""
+    returned_keys = {tuple(getattr(instance, key) for key in conflict_on) for instance in returned}
+    skipped = {
+        tuple(row[key] for key in conflict_on): tuple(row[column] for column in owner_columns)
+        for row in batch
+        if tuple(row[key] for key in conflict_on) not in returned_keys
+    }
+    key_columns = [getattr(model, key) for key in conflict_on]
+    # Soft-deleted rows are revived by the upsert, so they are checked too
+    existing = await db.execute(
+        include_deleted(
+            select(*key_columns, *(getattr(model, column) for column in owner_columns)).where(
+                tuple_(*key_columns).in_(list(skipped))
+            )
+        )
+    )
+    width = len(conflict_on)
+    # Only the key is reported; the other owner is not disclosed
+    return [
+        {key: str(value) for key, value in zip(conflict_on, row[:width])}
+        for row in existing
+        if tuple(row[width:]) != skipped[tuple(row[:width])]
+    ]
@@ -5,7 +5,8 @@ from jose import jwt
 from typing import Annotated
 
 from pydantic import BaseModel
-from chavfana.core.config import settings
+from chavfana.core.exceptions import AuthorizationError
+from chavfana.core.keyring import keyring
 from chavfana.core.logging import logger
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/v1/auth/login")
@@ -19,9 +20,7 @@ class UserData(BaseModel):
 
 async def get_current_user(token: GetToken):
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = keyring.verify(token)
 
         sub = payload.get("sub")
         role = payload.get("role")
@@ -54,5 +53,14 @@ async def get_current_user(token: GetToken):
 GetCurrentUser = Annotated[UserData, Depends(get_current_user)]
 
 
+async def get_admin_user(current_user: GetCurrentUser):
+    if current_user.role != "ADMIN":
+        raise AuthorizationError(message="Administrator access required")
+    return current_user
+
+
+GetAdminUser = Annotated[UserData, Depends(get_admin_user)]
+
+
 def get_auth_header(token: GetToken, client_name: str = Header(...)) -> dict:
     return {"Authorization": f"Bearer {token}", "Client-Name": f"{client_name.upper()}"}
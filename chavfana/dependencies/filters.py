@@ -0,0 +1,36 @@
+import json
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Query
+
+from chavfana.core.exceptions import ValidationError
+
+
+def containment_filter(name: str) -> Callable[..., Optional[Dict[str, Any]]]:
+    """Dependency reading query parameter ``name`` as a JSON object.
+
+    The object is matched with JSONB containment (``@>``), so
+    ``?content_contains={"weather": "rain"}`` selects rows whose document has
+    at least that key and value; nested objects and arrays match the same way.
+    """
+
+    def dependency(
+        value: Optional[str] = Query(
+            None,
+            alias=name,
+            description="JSON object the document must contain, e.g. {\"key\": \"value\"}",
+        ),
+    ) -> Optional[Dict[str, Any]]:
+        if value is None:
+            return None
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            raise ValidationError(
+                message=f"{name} must be a JSON object", details=[{name: value}]
+            )
+        return parsed
+
+    return dependency
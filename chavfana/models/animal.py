@@ -8,7 +8,8 @@ from sqlalchemy import Index, String, Float, Integer, Date, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from chavfana.models.base import BaseModel
+from chavfana.models.base import NOT_DELETED, BaseModel
+from chavfana.models.enums import HealthStatus, pg_enum
 
 if TYPE_CHECKING:
     from chavfana.models.project import AnimalKeepingProject
@@ -18,7 +19,11 @@ if TYPE_CHECKING:
 class AnimalGroup(BaseModel):
     __tablename__ = "animal_groups"
     __table_args__ = (
-        Index("ix_animal_groups_project_id", "project_id"),
+        Index(
+            "ix_animal_groups_project_id",
+            "project_id",
+            postgresql_where=NOT_DELETED,
+        ),
         Index("ix_animal_groups_housing", "housing"),
     )
 
@@ -26,7 +31,6 @@ class AnimalGroup(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("animal_keeping_projects.project_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     group_name: Mapped[str] = mapped_column(String(200), nullable=False)
     housing: Mapped[str] = mapped_column(
@@ -53,8 +57,24 @@ class AnimalGroup(BaseModel):
 class Animal(BaseModel):
     __tablename__ = "animals"
     __table_args__ = (
-        Index("ix_animals_project_id", "project_id"),
-        Index("ix_animals_group_id", "group_id"),
+        # Covers AnimalRead, so listing a project's animals is an index-only scan
+        Index(
+            "ix_animals_project_id",
+            "project_id",
+            postgresql_include=[
+                "id",
+                "tag",
+                "breed",
+                "name",
+                "animal_type",
+                "gender",
+                "health_status",
+                "is_active",
+                "created_at",
+            ],
+            postgresql_where=NOT_DELETED,
+        ),
+        Index("ix_animals_group_id", "group_id", postgresql_where=NOT_DELETED),
         Index("ix_animals_tag", "tag"),
         Index("ix_animals_is_active", "is_active"),
     )
@@ -63,15 +83,13 @@ class Animal(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("animal_keeping_projects.project_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     group_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("animal_groups.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
-    tag: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    tag: Mapped[str] = mapped_column(String(100), nullable=False)
     breed: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     arrival_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -82,9 +100,11 @@ class Animal(BaseModel):
     gender: Mapped[str] = mapped_column(String(20), nullable=False)
     weight: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     age_estimate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    is_active: Mapped[bool] = mapped_column(default=True, index=True)
+    is_active: Mapped[bool] = mapped_column(default=True)
     health_status: Mapped[str] = mapped_column(
-        String(50), default="Healthy", comment="Healthy, Sick, Recovering, Quarantined"
+        pg_enum(HealthStatus, "health_status"),
+        default="Healthy",
+        comment="Healthy, Sick, Recovering, Quarantined",
     )
     insurance_policy: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
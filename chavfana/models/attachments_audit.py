@@ -4,11 +4,12 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Index, String, Integer, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Index, String, Integer, DateTime, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from chavfana.models.base import BaseModel
+from chavfana.models.enums import ChangeType, pg_enum
 
 
 class Attachment(BaseModel):
@@ -28,7 +29,7 @@ class Attachment(BaseModel):
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
     size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
     uploaded_by_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+        UUID(as_uuid=True), nullable=False
     )
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
@@ -43,7 +44,17 @@ class AuditLog(BaseModel):
     __table_args__ = (
         Index("ix_audit_logs_entity_type_id", "entity_type", "entity_id"),
         Index("ix_audit_logs_changed_by_id", "changed_by_id"),
-        Index("ix_audit_logs_changed_at", "changed_at"),
+        Index("ix_audit_logs_changed_at", "changed_at", postgresql_using="brin"),
+        Index(
+            "ix_audit_logs_diff",
+            "diff",
+            postgresql_using="gin",
+            postgresql_ops={"diff": "jsonb_path_ops"},
+        ),
+        # Postgres requires the partition key in the primary key
+        PrimaryKeyConstraint("id", "changed_at"),
+        # One partition per month, managed and archived by chavfana.db.partitions
+        {"postgresql_partition_by": "RANGE (changed_at)"},
     )
 
     entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -51,15 +62,15 @@ class AuditLog(BaseModel):
         UUID(as_uuid=True), nullable=False, index=True
     )
     change_type: Mapped[str] = mapped_column(
-        String(50), nullable=False, comment="CREATE, UPDATE, DELETE"
+        pg_enum(ChangeType, "change_type"), nullable=False, comment="CREATE, UPDATE, DELETE"
     )
     changed_by_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+        UUID(as_uuid=True), nullable=False
     )
     changed_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, index=True
+        DateTime(timezone=True), primary_key=True
     )
-    diff: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    diff: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     def __repr__(self) -> str:
         return f"<AuditLog(id={self.id}, entity_type={self.entity_type})>"
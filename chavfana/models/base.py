@@ -2,15 +2,22 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Any, Optional, Type, TypeVar
+from typing import Any, ClassVar, Optional, Type, TypeVar
 
 from sqlalchemy import DateTime, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncAttrs
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, registry
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column, registry
+
+from chavfana.models.ids import uuid7
 
 T = TypeVar("T", bound="BaseModel")
 
+# Predicate for partial indexes on lookup columns. Soft-deleted rows are
+# filtered out of every ORM query (see chavfana.db.soft_delete), so indexes
+# only need to cover the live ones.
+NOT_DELETED = text("is_deleted = false")
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     registry = registry()
@@ -21,19 +28,28 @@ class Base(AsyncAttrs, DeclarativeBase):
 
 
 class BaseMixin:
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4,
-        index=True,
-        comment="Unique identifier for the record (UUID)",
-    )
+    # Fetch server-generated values (created_at, updated_at, ...) through
+    # INSERT/UPDATE ... RETURNING at flush time instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    # UUID version for new primary keys. Version 7 keys are time-ordered, so
+    # inserts append to the primary-key and foreign-key indexes; set 4 on a
+    # model whose ids must not reveal when the row was created.
+    __uuid_version__: ClassVar[int] = 7
+
+    @declared_attr
+    def id(cls) -> Mapped[uuid.UUID]:
+        return mapped_column(
+            UUID(as_uuid=True),
+            primary_key=True,
+            default=uuid.uuid4 if cls.__uuid_version__ == 4 else uuid7,
+            comment="Unique identifier for the record (UUID)",
+        )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
         nullable=False,
-        index=True,
         comment="Timestamp when the record was created",
     )
 
@@ -42,27 +58,23 @@ class BaseMixin:
         server_default=text("CURRENT_TIMESTAMP"),
         onupdate=text("CURRENT_TIMESTAMP"),
         nullable=False,
-        index=True,
         comment="Timestamp when the record was last updated",
     )
 
     created_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
-        index=True,
         nullable=True,
         comment="UUID of the user who created this record",
     )
 
     updated_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
-        index=True,
         nullable=True,
         comment="UUID of the user who last updated this record",
     )
 
     is_deleted: Mapped[bool] = mapped_column(
         default=False,
-        index=True,
         nullable=False,
         comment="Flag indicating if the record has been soft-deleted",
     )
@@ -70,13 +82,11 @@ class BaseMixin:
     deleted_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
-        index=True,
         comment="Timestamp when the record was soft-deleted",
     )
 
     deleted_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
-        index=True,
         nullable=True,
         comment="UUID of the user who soft-deleted this record",
     )
@@ -7,6 +7,7 @@ from typing import Optional
 from sqlalchemy import Index, String, Float, Date
 
 from chavfana.models.base import BaseModel
+from chavfana.models.enums import ContactType, EquipmentStatus, pg_enum
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -19,13 +20,13 @@ class Contact(BaseModel):
     )
 
     contact_type: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(ContactType, "contact_type"),
         nullable=False,
         comment="SUPPLIER, BUYER, SERVICE_PROVIDER, VET, AGRONOMIST",
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
-    email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     address: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
 
@@ -41,7 +42,7 @@ class Equipment(BaseModel):
     )
 
     farm_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+        UUID(as_uuid=True), nullable=False
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     serial_no: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -50,7 +51,9 @@ class Equipment(BaseModel):
     currency: Mapped[str] = mapped_column(String(3), default="USD")
     last_service_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     status: Mapped[str] = mapped_column(
-        String(50), default="Active", comment="Active, Maintenance, Retired"
+        pg_enum(EquipmentStatus, "equipment_status"),
+        default="Active",
+        comment="Active, Maintenance, Retired",
     )
 
     def __repr__(self) -> str:
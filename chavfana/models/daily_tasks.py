@@ -4,11 +4,12 @@ import uuid
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Index, String, Integer, Date, DateTime, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Index, String, Integer, Date, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from chavfana.models.base import BaseModel
+from chavfana.models.base import NOT_DELETED, BaseModel
+from chavfana.models.enums import DailyEntryType, TaskPriority, TaskStatus, pg_enum
 
 if TYPE_CHECKING:
     from .farm import Farm, Plot
@@ -19,18 +20,27 @@ if TYPE_CHECKING:
 class DailyEntry(BaseModel):
     __tablename__ = "daily_entries"
     __table_args__ = (
-        Index("ix_daily_entries_farm_id", "farm_id"),
-        Index("ix_daily_entries_date", "date"),
-        Index("ix_daily_entries_farm_date", "farm_id", "date"),
+        Index("ix_daily_entries_date", "date", postgresql_using="brin"),
+        Index(
+            "ix_daily_entries_farm_date",
+            "farm_id",
+            "date",
+            postgresql_where=NOT_DELETED,
+        ),
+        Index(
+            "ix_daily_entries_content",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "jsonb_path_ops"},
+        ),
     )
 
     farm_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("farms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
     author_user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -47,11 +57,11 @@ class DailyEntry(BaseModel):
         nullable=True,
     )
     entry_type: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(DailyEntryType, "daily_entry_type"),
         nullable=False,
         comment="Activity, Note, Expense, Observation",
     )
-    content: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    content: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     duration_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     cost: Mapped[Optional[float]] = mapped_column(nullable=True)
     currency: Mapped[str] = mapped_column(String(3), default="USD")
@@ -73,25 +83,27 @@ class Task(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     project_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    due_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    due_date: Mapped[date] = mapped_column(Date, nullable=False)
     completed_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
     status: Mapped[str] = mapped_column(
-        String(50), default="Pending", comment="Pending, In Progress, Completed, Cancelled"
+        pg_enum(TaskStatus, "task_status"),
+        default="Pending",
+        comment="Pending, In Progress, Completed, Cancelled",
     )
     priority: Mapped[str] = mapped_column(
-        String(20), default="Medium", comment="Low, Medium, High, Critical"
+        pg_enum(TaskPriority, "task_priority"),
+        default="Medium",
+        comment="Low, Medium, High, Critical",
     )
     notes: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
 
@@ -0,0 +1,107 @@
+from enum import Enum as PyEnum
+from typing import Type
+
+from sqlalchemy import Enum
+
+
+class ProjectType(str, PyEnum):
+    PROJECT = "Project"
+    PLANTING = "PlantingProject"
+    ANIMAL_KEEPING = "AnimalKeepingProject"
+
+
+class ProjectStatus(str, PyEnum):
+    PLANNING = "Planning"
+    ACTIVE = "Active"
+    COMPLETED = "Completed"
+    ARCHIVED = "Archived"
+
+
+class PlantingStage(str, PyEnum):
+    SEEDLING = "Seedling"
+    VEGETATIVE = "Vegetative"
+    FLOWERING = "Flowering"
+    FRUITING = "Fruiting"
+    MATURE = "Mature"
+
+
+class TaskStatus(str, PyEnum):
+    PENDING = "Pending"
+    IN_PROGRESS = "In Progress"
+    COMPLETED = "Completed"
+    CANCELLED = "Cancelled"
+
+
+class TaskPriority(str, PyEnum):
+    LOW = "Low"
+    MEDIUM = "Medium"
+    HIGH = "High"
+    CRITICAL = "Critical"
+
+
+class DailyEntryType(str, PyEnum):
+    ACTIVITY = "Activity"
+    NOTE = "Note"
+    EXPENSE = "Expense"
+    OBSERVATION = "Observation"
+
+
+class HealthStatus(str, PyEnum):
+    HEALTHY = "Healthy"
+    SICK = "Sick"
+    RECOVERING = "Recovering"
+    QUARANTINED = "Quarantined"
+
+
+class UserRole(str, PyEnum):
+    ADMIN = "ADMIN"
+    FARMER = "FARMER"
+    MANAGER = "MANAGER"
+    EMPLOYEE = "EMPLOYEE"
+    VET = "VET"
+    AGRONOMIST = "AGRONOMIST"
+    CONSULTANT = "CONSULTANT"
+
+
+class TransactionType(str, PyEnum):
+    PURCHASE = "PURCHASE"
+    SALE = "SALE"
+    EXPENSE = "EXPENSE"
+    INCOME = "INCOME"
+
+
+class InventoryUnit(str, PyEnum):
+    KG = "KG"
+    LITER = "LITER"
+    UNIT = "UNIT"
+    POUND = "POUND"
+
+
+class EquipmentStatus(str, PyEnum):
+    ACTIVE = "Active"
+    MAINTENANCE = "Maintenance"
+    RETIRED = "Retired"
+
+
+class ContactType(str, PyEnum):
+    SUPPLIER = "SUPPLIER"
+    BUYER = "BUYER"
+    SERVICE_PROVIDER = "SERVICE_PROVIDER"
+    VET = "VET"
+    AGRONOMIST = "AGRONOMIST"
+
+
+class ChangeType(str, PyEnum):
+    CREATE = "CREATE"
+    UPDATE = "UPDATE"
+    DELETE = "DELETE"
+
+
+def pg_enum(enum: Type[PyEnum], name: str) -> Enum:
+    """Native Postgres enum type over the values of ``enum``.
+
+    A stored label takes a fixed four bytes (the enum value's OID) instead of
+    a varchar's header plus text. Columns load as plain strings, so schemas
+    and responses see the same values as before.
+    """
+    return Enum(*(member.value for member in enum), name=name)
@@ -3,11 +3,12 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Index, String, Float, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Index, String, Float, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from chavfana.models.base import BaseModel
+from chavfana.core.geo import GEOHASH_PRECISION
+from chavfana.models.base import NOT_DELETED, BaseModel
 
 if TYPE_CHECKING:
     from chavfana.models.user import User
@@ -18,24 +19,29 @@ if TYPE_CHECKING:
 class Farm(BaseModel):
     __tablename__ = "farms"
     __table_args__ = (
-        Index("ix_farms_owner_id", "owner_id"),
-        Index("ix_farms_owner_name", "owner_id", "name"),
+        Index("ix_farms_owner_name", "owner_id", "name", postgresql_where=NOT_DELETED),
         Index("ix_farms_country", "country"),
+        Index("ix_farms_geohash", "geohash", postgresql_where=NOT_DELETED),
     )
 
     owner_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    country: Mapped[str] = mapped_column(String(2), nullable=False, index=True)
+    country: Mapped[str] = mapped_column(String(2), nullable=False)
     city: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     address: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    geo_coordinate: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    rectangle_boundary: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    geo_coordinate: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # Derived from geo_coordinate on write, for nearby search
+    latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    geohash: Mapped[Optional[str]] = mapped_column(
+        String(GEOHASH_PRECISION, collation="C"), nullable=True
+    )
+    rectangle_boundary: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     area_size: Mapped[float] = mapped_column(Float, nullable=False)
     area_unit: Mapped[str] = mapped_column(String(20), default="HECTARE")
     time_zone: Mapped[str] = mapped_column(String(50), default="UTC")
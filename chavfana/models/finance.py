@@ -8,7 +8,8 @@ from sqlalchemy import Index, String, Float, Date, Integer, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from chavfana.models.base import BaseModel
+from chavfana.models.base import NOT_DELETED, BaseModel
+from chavfana.models.enums import InventoryUnit, TransactionType, pg_enum
 
 if TYPE_CHECKING:
     from chavfana.models.farm import Farm
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
 class InventoryItem(BaseModel):
     __tablename__ = "inventory_items"
     __table_args__ = (
-        Index("ix_inventory_items_farm_id", "farm_id"),
+        Index("ix_inventory_items_farm_id", "farm_id", postgresql_where=NOT_DELETED),
         Index("ix_inventory_items_sku", "sku", unique=True),
     )
 
@@ -26,13 +27,12 @@ class InventoryItem(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("farms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
-    sku: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    sku: Mapped[str] = mapped_column(String(100), nullable=False)
     quantity: Mapped[float] = mapped_column(Float, nullable=False)
     unit: Mapped[str] = mapped_column(
-        String(20), nullable=False, comment="KG, LITER, UNIT, POUND"
+        pg_enum(InventoryUnit, "inventory_unit"), nullable=False, comment="KG, LITER, UNIT, POUND"
     )
     unit_cost: Mapped[float] = mapped_column(Float, nullable=False)
     currency: Mapped[str] = mapped_column(String(3), default="USD")
@@ -48,23 +48,25 @@ class InventoryItem(BaseModel):
 class Transaction(BaseModel):
     __tablename__ = "transactions"
     __table_args__ = (
-        Index("ix_transactions_farm_id", "farm_id"),
         Index("ix_transactions_project_id", "project_id"),
-        Index("ix_transactions_date", "date"),
-        Index("ix_transactions_farm_date", "farm_id", "date"),
+        Index("ix_transactions_date", "date", postgresql_using="brin"),
+        Index(
+            "ix_transactions_farm_date",
+            "farm_id",
+            "date",
+            postgresql_where=NOT_DELETED,
+        ),
     )
 
     farm_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("farms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     project_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     item_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
@@ -72,14 +74,14 @@ class Transaction(BaseModel):
         nullable=True,
     )
     transaction_type: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(TransactionType, "transaction_type"),
         nullable=False,
         comment="PURCHASE, SALE, EXPENSE, INCOME",
     )
     amount: Mapped[float] = mapped_column(Float, nullable=False)
     currency: Mapped[str] = mapped_column(String(3), default="USD")
     quantity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
     related_party_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), nullable=True
@@ -0,0 +1,39 @@
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    The first 48 bits are the Unix time in milliseconds, so keys generated
+    later sort later and new rows land on the rightmost page of a B-tree
+    instead of a random one. The next 12 bits are a counter seeded randomly
+    each millisecond, which keeps ids from one process strictly increasing;
+    the remaining 62 bits are random.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Counter exhausted within one millisecond: borrow the next one
+                _last_ms += 1
+                _counter = 0
+        timestamp, counter = _last_ms, _counter
+
+    value = (timestamp & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=value)
@@ -4,11 +4,12 @@ import uuid
 from datetime import date
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import ForeignKey, Index, String, Date, Float, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import ForeignKey, Index, String, Date, Float
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from chavfana.models.base import BaseModel
+from chavfana.models.base import NOT_DELETED, BaseModel
+from chavfana.models.enums import PlantingStage, ProjectStatus, ProjectType, pg_enum
 
 if TYPE_CHECKING:
     from chavfana.models.farm import Farm
@@ -21,17 +22,20 @@ if TYPE_CHECKING:
 class Project(BaseModel):
     __tablename__ = "projects"
     __table_args__ = (
-        Index("ix_projects_farm_id", "farm_id"),
-        Index("ix_projects_owner_id", "owner_id"),
+        Index("ix_projects_owner_id", "owner_id", postgresql_where=NOT_DELETED),
         Index("ix_projects_status", "status"),
-        Index("ix_projects_farm_status", "farm_id", "status"),
+        Index(
+            "ix_projects_farm_status",
+            "farm_id",
+            "status",
+            postgresql_where=NOT_DELETED,
+        ),
     )
 
     farm_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("farms.id", ondelete="CASCADE"),
         nullable=True,
-        index=True,
     )
     plot_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -43,17 +47,17 @@ class Project(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     project_type: Mapped[str] = mapped_column(
-        String(50), nullable=False, comment="PlantingProject, AnimalKeepingProject"
+        pg_enum(ProjectType, "project_type"),
+        nullable=False,
+        comment="PlantingProject, AnimalKeepingProject",
     )
     status: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(ProjectStatus, "project_status"),
         nullable=False,
         default="Planning",
-        index=True,
         comment="Planning, Active, Completed, Archived",
     )
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -64,6 +68,7 @@ class Project(BaseModel):
     owner: Mapped["User"] = relationship("User", back_populates="projects")
 
     __mapper_args__ = {
+        **BaseModel.__mapper_args__,
         "polymorphic_identity": "Project",
         "polymorphic_on": project_type,
     }
@@ -74,7 +79,6 @@ class Project(BaseModel):
 
 class PlantingProject(Project):
     __tablename__ = "planting_projects"
-    __table_args__ = (Index("ix_planting_projects_project_id", "project_id"),)
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -97,6 +101,7 @@ class PlantingProject(Project):
     )
 
     __mapper_args__ = {
+        **BaseModel.__mapper_args__,
         "polymorphic_identity": "PlantingProject",
     }
 
@@ -107,9 +112,14 @@ class PlantingProject(Project):
 class PlantingEvent(BaseModel):
     __tablename__ = "planting_events"
     __table_args__ = (
-        Index("ix_planting_events_project_id", "project_id"),
         Index("ix_planting_events_plot_id", "plot_id"),
         Index("ix_planting_events_planting_date", "planting_date"),
+        Index(
+            "ix_planting_events_species_details",
+            "species_details",
+            postgresql_using="gin",
+            postgresql_ops={"species_details": "jsonb_path_ops"},
+        ),
     )
 
     project_id: Mapped[uuid.UUID] = mapped_column(
@@ -119,19 +129,19 @@ class PlantingEvent(BaseModel):
     )
 
     plot_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+        UUID(as_uuid=True), nullable=False
     )
-    planting_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    planting_date: Mapped[date] = mapped_column(Date, nullable=False)
     end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     area_size: Mapped[float] = mapped_column(Float, nullable=False)
     area_unit: Mapped[str] = mapped_column(String(20), default="HECTARE")
     stage: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(PlantingStage, "planting_stage"),
         default="Seedling",
         comment="Seedling, Vegetative, Flowering, Fruiting, Mature",
     )
     notes: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    species_details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    species_details: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     project: Mapped["PlantingProject"] = relationship(
         "PlantingProject", back_populates="planting_events"
@@ -143,7 +153,6 @@ class PlantingEvent(BaseModel):
 
 class AnimalKeepingProject(Project):
     __tablename__ = "animal_keeping_projects"
-    __table_args__ = (Index("ix_animal_keeping_projects_project_id", "project_id"),)
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -162,6 +171,7 @@ class AnimalKeepingProject(Project):
     )
 
     __mapper_args__ = {
+        **BaseModel.__mapper_args__,
         "polymorphic_identity": "AnimalKeepingProject",
     }
 
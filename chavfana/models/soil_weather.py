@@ -4,7 +4,16 @@ import uuid
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Index, String, Float, Date, DateTime, JSON, ForeignKey
+from sqlalchemy import (
+    Index,
+    String,
+    Float,
+    Date,
+    DateTime,
+    JSON,
+    ForeignKey,
+    PrimaryKeyConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,9 +35,8 @@ class SoilAnalysis(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("plots.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    sample_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    sample_date: Mapped[date] = mapped_column(Date, nullable=False)
     phosphorous: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     potassium: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     nitrogen: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -45,17 +53,24 @@ class WeatherObservation(BaseModel):
     __tablename__ = "weather_observations"
     __table_args__ = (
         Index("ix_weather_observations_farm_id", "farm_id"),
-        Index("ix_weather_observations_observed_at", "observed_at"),
+        Index(
+            "ix_weather_observations_observed_at",
+            "observed_at",
+            postgresql_using="brin",
+        ),
+        # Postgres requires the partition key in the primary key
+        PrimaryKeyConstraint("id", "observed_at"),
+        # One partition per month, managed by chavfana.db.partitions
+        {"postgresql_partition_by": "RANGE (observed_at)"},
     )
 
     farm_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("farms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     observed_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, index=True
+        DateTime(timezone=True), primary_key=True
     )
     temperature: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     humidity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -76,7 +91,6 @@ class Season(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("farms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
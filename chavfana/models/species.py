@@ -15,7 +15,7 @@ class CropSpecies(BaseModel):
     __tablename__ = "crop_species"
     __table_args__ = (Index("ix_crop_species_name", "name"),)
 
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
     variety: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     species_type: Mapped[str] = mapped_column(
         String(50), nullable=False, comment="VEGETABLE, CEREAL, FRUIT, LEGUME, etc."
@@ -8,7 +8,8 @@ from sqlalchemy import Index, String, Boolean, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from chavfana.models.base import BaseModel
+from chavfana.models.base import NOT_DELETED, BaseModel
+from chavfana.models.enums import UserRole, pg_enum
 
 if TYPE_CHECKING:
     from chavfana.models.farm import Farm
@@ -20,17 +21,29 @@ class User(BaseModel):
     __tablename__ = "users"
     __table_args__ = (
         Index("ix_users_email", "email", unique=True),
-        Index("ix_users_role", "role"),
+        Index(
+            "ix_users_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=NOT_DELETED,
+        ),
+        Index(
+            "ix_users_role_created_at_id",
+            "role",
+            "created_at",
+            "id",
+            postgresql_where=NOT_DELETED,
+        ),
         Index("ix_users_is_active", "is_active"),
     )
+    # User ids appear in tokens and URLs; keep them from dating the account
+    __uuid_version__ = 4
 
-    email: Mapped[str] = mapped_column(
-        String(255), nullable=False, unique=True, index=True
-    )
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     role: Mapped[str] = mapped_column(
-        String(50),
+        pg_enum(UserRole, "user_role"),
         nullable=False,
         default="FARMER",
         comment="ADMIN, FARMER, MANAGER, EMPLOYEE, VET, AGRONOMIST, CONSULTANT",
@@ -60,21 +73,34 @@ class Employee(BaseModel):
 
     __tablename__ = "employees"
     __table_args__ = (
-        Index("ix_employees_user_id", "user_id", unique=True),
-        Index("ix_employees_farm_id", "farm_id"),
+        Index("ix_employees_user_id", "user_id", postgresql_where=NOT_DELETED),
+        # Covers EmployeeRead, so listing a farm's staff is an index-only scan
+        Index(
+            "ix_employees_farm_id",
+            "farm_id",
+            postgresql_include=[
+                "id",
+                "user_id",
+                "position",
+                "employment_start",
+                "employment_end",
+                "salary_amount",
+                "salary_currency",
+                "created_at",
+            ],
+            postgresql_where=NOT_DELETED,
+        ),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     farm_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("farms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     position: Mapped[str] = mapped_column(String(100), nullable=False)
     employment_start: Mapped[datetime] = mapped_column(
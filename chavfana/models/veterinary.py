@@ -27,16 +27,14 @@ class VeterinaryVisit(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("animals.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     vet_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     visit_date: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, index=True
+        DateTime(timezone=True), nullable=False
     )
     diagnosis: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     treatment: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
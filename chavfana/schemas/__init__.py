@@ -1,5 +1,5 @@
-from .user import UserCreate, UserUpdate, UserRead, EmployeeCreate, EmployeeRead
-from .farm import FarmCreate, FarmUpdate, FarmRead, PlotCreate, PlotUpdate, PlotRead
+from .user import UserCreate, UserUpdate, UserRead, UserPage, EmployeeCreate, EmployeeUpdate, EmployeeRead
+from .farm import FarmCreate, FarmUpdate, FarmRead, FarmNearbyRead, PlotCreate, PlotUpdate, PlotRead
 from .project import (
     ProjectCreate,
     PlantingProjectCreate,
@@ -14,9 +14,11 @@ from .finance import (
     InventoryItemCreate,
     InventoryItemUpdate,
     InventoryItemRead,
+    InventoryImportResult,
     TransactionCreate,
     TransactionRead,
 )
+from .daily_tasks import DailyEntryRead
 from .soil_weather import (
     SoilAnalysisCreate,
     SoilAnalysisRead,
@@ -30,11 +32,14 @@ __all__ = [
     "UserCreate",
     "UserUpdate",
     "UserRead",
+    "UserPage",
     "EmployeeCreate",
+    "EmployeeUpdate",
     "EmployeeRead",
     "FarmCreate",
     "FarmUpdate",
     "FarmRead",
+    "FarmNearbyRead",
     "PlotCreate",
     "PlotUpdate",
     "PlotRead",
@@ -53,8 +58,10 @@ __all__ = [
     "InventoryItemCreate",
     "InventoryItemUpdate",
     "InventoryItemRead",
+    "InventoryImportResult",
     "TransactionCreate",
     "TransactionRead",
+    "DailyEntryRead",
     "SoilAnalysisCreate",
     "SoilAnalysisRead",
     "WeatherObservationCreate",
@@ -6,6 +6,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from chavfana.models.enums import HealthStatus
+
 
 class AnimalGroupCreate(BaseModel):
     project_id: uuid.UUID
@@ -46,10 +48,10 @@ class AnimalCreate(BaseModel):
     gender: str = Field(..., max_length=20)
     weight: Optional[float] = Field(None, gt=0)
     age_estimate: Optional[float] = Field(None, gt=0)
-    health_status: str = Field(default="Healthy", max_length=50)
+    health_status: HealthStatus = Field(default="Healthy")
     insurance_policy: Optional[dict] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
     @model_validator(mode="before")
     def validate_dates(cls, values):
@@ -65,10 +67,10 @@ class AnimalUpdate(BaseModel):
     breed: Optional[str] = Field(None, max_length=100)
     name: Optional[str] = Field(None, max_length=100)
     weight: Optional[float] = Field(None, gt=0)
-    health_status: Optional[str] = Field(None, max_length=50)
+    health_status: Optional[HealthStatus] = None
     is_active: Optional[bool] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class AnimalRead(BaseModel):
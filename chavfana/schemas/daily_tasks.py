@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DailyEntryRead(BaseModel):
+    id: uuid.UUID
+    farm_id: uuid.UUID
+    date: date
+    author_user_id: uuid.UUID
+    project_id: Optional[uuid.UUID]
+    plot_id: Optional[uuid.UUID]
+    entry_type: str
+    content: Optional[dict]
+    duration_minutes: Optional[int]
+    cost: Optional[float]
+    currency: str
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -4,7 +4,9 @@ from datetime import datetime
 import uuid
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from chavfana.core.geo import parse_coordinate
 
 
 class FarmCreate(BaseModel):
@@ -22,6 +24,11 @@ class FarmCreate(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("geo_coordinate")
+    def validate_geo_coordinate(cls, value):
+        parse_coordinate(value)
+        return value
+
 
 class FarmUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=200)
@@ -36,6 +43,11 @@ class FarmUpdate(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("geo_coordinate")
+    def validate_geo_coordinate(cls, value):
+        parse_coordinate(value)
+        return value
+
 
 class FarmRead(BaseModel):
     id: uuid.UUID
@@ -53,6 +65,12 @@ class FarmRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class FarmNearbyRead(FarmRead):
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
 class PlotCreate(BaseModel):
     farm_id: uuid.UUID
     name: str = Field(..., min_length=2, max_length=200)
@@ -2,23 +2,25 @@ from __future__ import annotations
 
 import uuid
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from chavfana.models.enums import InventoryUnit, TransactionType
+
 
 class InventoryItemCreate(BaseModel):
     farm_id: uuid.UUID
     name: str = Field(..., min_length=2, max_length=200)
     sku: str = Field(..., min_length=1, max_length=100)
     quantity: float = Field(..., ge=0)
-    unit: str = Field(..., max_length=20)
+    unit: InventoryUnit
     unit_cost: float = Field(..., gt=0)
     currency: str = Field(default="USD", max_length=3)
     supplier_id: Optional[uuid.UUID] = None
     reorder_level: float = Field(default=0.0, ge=0)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class InventoryItemUpdate(BaseModel):
@@ -44,11 +46,17 @@ class InventoryItemRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class InventoryImportResult(BaseModel):
+    inserted: List[InventoryItemRead]
+    updated: List[InventoryItemRead]
+    unchanged: int
+
+
 class TransactionCreate(BaseModel):
     farm_id: uuid.UUID
     project_id: Optional[uuid.UUID] = None
     item_id: Optional[uuid.UUID] = None
-    transaction_type: str = Field(..., max_length=50)
+    transaction_type: TransactionType
     amount: float = Field(..., ne=0)
     currency: str = Field(default="USD", max_length=3)
     quantity: Optional[float] = Field(None, gt=0)
@@ -57,13 +65,15 @@ class TransactionCreate(BaseModel):
     related_party_id: Optional[uuid.UUID] = None
     created_by_id: Optional[uuid.UUID] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
     @model_validator(mode="before")
     def validate_amount(cls, values):
 
         if isinstance(values, dict):
             tx_type = values.get("transaction_type", "").upper()
+            if tx_type:
+                values["transaction_type"] = tx_type
             amount = values.get("amount")
             if tx_type in ("INCOME", "SALE") and amount and amount < 0:
                 raise ValueError(f"{tx_type} amount must be positive")
@@ -6,6 +6,8 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from chavfana.models.enums import PlantingStage, ProjectStatus
+
 from chavfana.schemas.farm import FarmRead, PlotRead
 from chavfana.schemas.user import UserRead
 
@@ -15,12 +17,12 @@ class ProjectCreate(BaseModel):
     plot_id: Optional[uuid.UUID] = None
     owner_id: uuid.UUID
     name: str = Field(..., min_length=2, max_length=200)
-    status: str = Field(default="Planning", max_length=50)
+    status: ProjectStatus = Field(default="Planning")
     start_date: date
     end_date: Optional[date] = None
     notes: Optional[str] = Field(None, max_length=2048)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
     @model_validator(mode='after')
     def check_one_required(self):
@@ -73,11 +75,11 @@ class PlantingEventCreate(BaseModel):
     end_date: Optional[date] = None
     area_size: float = Field(..., gt=0)
     area_unit: str = Field(default="HECTARE", max_length=20)
-    stage: str = Field(default="Seedling", max_length=50)
+    stage: PlantingStage = Field(default="Seedling")
     notes: Optional[str] = Field(None, max_length=1024)
     species_details: Optional[dict] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
     @model_validator(mode="before")
     def validate_dates(cls, values):
@@ -2,20 +2,22 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from chavfana.models.enums import UserRole
+
 
 class UserCreate(BaseModel):
     email: str = Field(..., min_length=5, max_length=255)
     full_name: str = Field(..., min_length=2, max_length=255)
     phone: Optional[str] = Field(None, max_length=20)
-    role: str = Field(default="FARMER", max_length=50)
+    role: UserRole = Field(default="FARMER")
     password: str = Field(..., min_length=8)
     profile_data: Optional[dict] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
     @model_validator(mode="before")
     def normalize_email(cls, values):
@@ -29,11 +31,11 @@ class UserUpdate(BaseModel):
     email: Optional[str] = Field(None, min_length=5, max_length=255)
     full_name: Optional[str] = Field(None, min_length=2, max_length=255)
     phone: Optional[str] = Field(None, max_length=20)
-    role: Optional[str] = Field(None, max_length=50)
+    role: Optional[UserRole] = None
     is_active: Optional[bool] = None
     profile_data: Optional[dict] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
     @model_validator(mode="before")
     def normalize_email(cls, values):
@@ -57,6 +59,12 @@ class UserRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPage(BaseModel):
+    items: List[UserRead]
+    next_cursor: Optional[str] = None
+    estimated_total: Optional[int] = None
+
+
 class EmployeeCreate(BaseModel):
     user_id: uuid.UUID
     farm_id: uuid.UUID
@@ -69,6 +77,16 @@ class EmployeeCreate(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class EmployeeUpdate(BaseModel):
+    position: Optional[str] = Field(None, min_length=2, max_length=100)
+    employment_start: Optional[datetime] = None
+    employment_end: Optional[datetime] = None
+    salary_amount: Optional[float] = Field(None, gt=0)
+    salary_currency: Optional[str] = Field(None, max_length=3)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class EmployeeRead(BaseModel):
     id: uuid.UUID
     user_id: uuid.UUID